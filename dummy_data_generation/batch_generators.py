@@ -0,0 +1,164 @@
+"""
+Batch generation of phones, emails, names and datetimes for generate_dummy_data.py.
+Each function produces N values at once. With NumPy installed the random draws
+and datetime formatting are vectorized; without it the same API falls back to
+per-value random calls. Output for a given seed therefore depends on whether
+NumPy is available.
+
+Run this file to benchmark per-row vs batch generation per million rows:
+    python batch_generators.py --rows 1000000
+"""
+
+import random
+from datetime import datetime, timedelta
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+EMAIL_DOMAINS = ["gmail.com", "yahoo.com", "hotmail.com", "outlook.com"]
+COMPANY_EMAIL_DOMAINS = ["tech.com", "solutions.com", "corp.com", "inc.com", "digital.com"]
+
+# Naive datetimes are converted to seconds since this epoch (no timezone involved)
+EPOCH = datetime(1970, 1, 1)
+SECONDS_PER_DAY = 86400
+
+def make_rng():
+    """Create a NumPy generator seeded from the (seeded) random module, or None"""
+    if np is None:
+        return None
+    return np.random.default_rng(random.getrandbits(64))
+
+def random_integers(low, high, n, rng=None):
+    """n random integers in [low, high] (inclusive, like random.randint)"""
+    if rng is not None:
+        return rng.integers(low, high + 1, size=n).tolist()
+    return [random.randint(low, high) for _ in range(n)]
+
+def choose_batch(items, n, rng=None):
+    """n random choices from items"""
+    if rng is not None:
+        return [items[index] for index in rng.integers(0, len(items), size=n).tolist()]
+    return [random.choice(items) for _ in range(n)]
+
+def generate_phones(n, rng=None):
+    """Generate n random phone numbers"""
+    if rng is not None:
+        area = rng.integers(100, 1000, size=n).tolist()
+        prefix = rng.integers(100, 1000, size=n).tolist()
+        line = rng.integers(1000, 10000, size=n).tolist()
+        return [f"{a}-{p}-{l}" for a, p, l in zip(area, prefix, line)]
+    return [f"{random.randint(100, 999)}-{random.randint(100, 999)}-{random.randint(1000, 9999)}" for _ in range(n)]
+
+def generate_emails(first_names, last_names, company=False, rng=None):
+    """Generate one email address per (first name, last name) pair"""
+    n = len(first_names)
+    if company:
+        domains = choose_batch(COMPANY_EMAIL_DOMAINS, n, rng)
+        return [f"{first.lower()}.{last.lower()}@{domain}"
+                for first, last, domain in zip(first_names, last_names, domains)]
+
+    domains = choose_batch(EMAIL_DOMAINS, n, rng)
+    variations = random_integers(0, 3, n, rng)
+    numbers = random_integers(1, 99, n, rng)
+
+    emails = []
+    for first, last, domain, variation, number in zip(first_names, last_names, domains, variations, numbers):
+        first = first.lower()
+        last = last.lower()
+        if variation == 0:
+            local = f"{first}.{last}"
+        elif variation == 1:
+            local = f"{first}{last}"
+        elif variation == 2:
+            local = f"{first[0]}{last}"
+        else:
+            local = f"{first}{number}"
+        emails.append(f"{local}@{domain}")
+    return emails
+
+def generate_datetimes(n, start_date, end_date, rng=None):
+    """Generate n random datetimes as epoch seconds
+
+    Same distribution as generate_dummy_data.generate_datetime: a random day
+    between start and end, then a random time of day. start_date and end_date
+    are datetimes, or lists of n datetimes for per-row ranges.
+    """
+    if isinstance(start_date, datetime):
+        start_date = [start_date] * n
+    if isinstance(end_date, datetime):
+        end_date = [end_date] * n
+
+    start_days = [(start - EPOCH).days for start in start_date]
+    span_days = [(end - start).days for start, end in zip(start_date, end_date)]
+
+    if rng is not None:
+        days = np.asarray(start_days, dtype=np.int64) + np.floor(
+            rng.random(n) * (np.asarray(span_days, dtype=np.int64) + 1)
+        ).astype(np.int64)
+        seconds = rng.integers(0, SECONDS_PER_DAY, size=n, dtype=np.int64)
+        return days * SECONDS_PER_DAY + seconds
+
+    return [
+        (day + random.randint(0, span)) * SECONDS_PER_DAY + random.randint(0, SECONDS_PER_DAY - 1)
+        for day, span in zip(start_days, span_days)
+    ]
+
+def format_datetimes(epoch_seconds):
+    """Format epoch seconds as "YYYY-MM-DD HH:MM:SS" strings in bulk"""
+    if np is not None and isinstance(epoch_seconds, np.ndarray):
+        formatted = np.datetime_as_string(epoch_seconds.astype('datetime64[s]'), unit='s')
+        return [value.replace('T', ' ') for value in formatted.tolist()]
+    return [(EPOCH + timedelta(seconds=int(value))).strftime("%Y-%m-%d %H:%M:%S") for value in epoch_seconds]
+
+def to_datetimes(epoch_seconds):
+    """Convert epoch seconds to naive datetimes in bulk"""
+    if np is not None and isinstance(epoch_seconds, np.ndarray):
+        return epoch_seconds.astype('datetime64[s]').tolist()
+    return [EPOCH + timedelta(seconds=int(value)) for value in epoch_seconds]
+
+def benchmark(rows):
+    """Compare per-row and batch generation cost, scaled to one million rows"""
+    import time
+    from generate_dummy_data import generate_phone, generate_email, generate_datetime
+    from generate_dummy_data_choices import FIRST_NAMES, LAST_NAMES
+
+    start_date, end_date = datetime(2020, 1, 1), datetime(2023, 12, 31)
+    first_names = choose_batch(FIRST_NAMES, rows)
+    last_names = choose_batch(LAST_NAMES, rows)
+    scale = 1000000 / rows
+
+    def timed(function):
+        start = time.perf_counter()
+        function()
+        return (time.perf_counter() - start) * scale
+
+    results = {
+        "phones": (
+            timed(lambda: [generate_phone() for _ in range(rows)]),
+            timed(lambda: generate_phones(rows, make_rng()))
+        ),
+        "emails": (
+            timed(lambda: [generate_email(first, last) for first, last in zip(first_names, last_names)]),
+            timed(lambda: generate_emails(first_names, last_names, rng=make_rng()))
+        ),
+        "datetimes": (
+            timed(lambda: [generate_datetime(start_date, end_date).strftime("%Y-%m-%d %H:%M:%S") for _ in range(rows)]),
+            timed(lambda: format_datetimes(generate_datetimes(rows, start_date, end_date, make_rng())))
+        )
+    }
+
+    print(f"Benchmark over {rows} rows (NumPy {'available' if np is not None else 'not installed'})")
+    print(f"{'':<12}{'per-row s/1M':>14}{'batch s/1M':>14}{'speedup':>10}")
+    for name, (per_row, batch) in results.items():
+        print(f"{name:<12}{per_row:>14.3f}{batch:>14.3f}{per_row / batch:>9.1f}x")
+    return results
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark per-row vs batch value generation')
+    parser.add_argument('--rows', type=int, default=200000, help='Rows generated per measurement')
+    args = parser.parse_args()
+    benchmark(args.rows)
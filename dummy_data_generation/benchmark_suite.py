@@ -0,0 +1,384 @@
+#!/usr/bin/env python
+"""
+End-to-end benchmark suite for the dummy_data_generation toolchain.
+Every run works in a scratch copy of the scripts, so generated CSVs, media,
+logs and exports never touch the real project tree. Measured per scale:
+
+  generate.<phase>  rows/s of the users, companies, listings and applies
+                    phases (from the generator's --profile report, fastest
+                    of --repeat runs); password hashing, logos and CVs
+                    overlap the phases, so only generate.total includes them
+  generate.total    rows/s of the whole generator run (profile wall time)
+  import.<step>     rows/s of each CSVImporter step             (--db only)
+  export            rows/s of export_data_to_csv.py              (--db only)
+  compare           rows/s of compare_data.py, in-memory and --external
+
+plus cv_pdf, the generate_cv_pdf render rate. Results are appended to a JSON
+history; a metric that drops more than --tolerance below the last accepted
+run on the same machine is a regression and fails the run.
+
+--db imports into the database configured by DJANGO_SETTINGS_MODULE (or
+--settings) and CLEARS it first: point it at a scratch SQLite or local
+PostgreSQL database, never at real data.
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import shutil
+import platform
+import tempfile
+import subprocess
+from pathlib import Path
+from datetime import datetime
+
+from scale_presets import SCALE_PRESETS, resolve_sizes, table_counts
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+BASE_DIR = SCRIPT_DIR.parent
+
+DEFAULT_HISTORY = BASE_DIR / 'benchmark_history.json'
+DEFAULT_SCALES = ["smoke"]
+
+# A metric more than this fraction below its baseline is a regression
+DEFAULT_TOLERANCE = 0.25
+
+# Measurements shorter than this are recorded but too noisy to gate on
+MIN_GATED_SECONDS = 0.5
+
+# Generator runs per scale; each phase keeps its fastest run (password hashing threads make single runs noisy)
+DEFAULT_REPEAT = 3
+
+DEFAULT_CV_COUNT = 100
+BENCHMARK_SEED = 1
+
+# Generator profile stage -> table whose rows it produces
+GENERATOR_PHASES = {
+    "users": "auth_user",
+    "companies": "companies_company",
+    "listings": "listings_listing",
+    "applies": "applies_apply"
+}
+
+# CSVImporter method -> CSV file it reads
+IMPORT_STEPS = {
+    "users": "auth_user.csv",
+    "companies": "companies_company.csv",
+    "listings": "listings_listing.csv",
+    "applies": "applies_apply.csv"
+}
+
+def count_csv_rows(filepath):
+    with open(filepath, 'r', encoding='utf-8', newline='') as f:
+        return max(0, sum(1 for _ in csv.reader(f)) - 1)
+
+def metric(rows, seconds):
+    """rows/s computed from the seconds as stored, so the two always agree in the history"""
+    seconds = round(seconds, 4)
+    return {"value": rows / seconds if seconds > 0 else 0.0, "unit": "rows/s", "rows": rows,
+            "seconds": seconds}
+
+def scale_sizes(scale):
+    """A preset name or an integer multiplier"""
+    if scale in SCALE_PRESETS:
+        return resolve_sizes(preset=scale)
+    return resolve_sizes(multiplier=int(scale))
+
+def make_workspace():
+    """Scratch project root holding a copy of the scripts (and the choices snapshot, if any)"""
+    root = Path(tempfile.mkdtemp(prefix='dummy_data_bench_'))
+    scripts = root / SCRIPT_DIR.name
+    scripts.mkdir()
+    for path in SCRIPT_DIR.glob('*.py'):
+        shutil.copy2(path, scripts / path.name)
+    snapshot = SCRIPT_DIR / 'listings_choices_snapshot.json'
+    if snapshot.exists():
+        shutil.copy2(snapshot, scripts / snapshot.name)
+    return root
+
+def run_logged(command, cwd, log_path, env=None):
+    """Run a command with its output appended to log_path; returns the wall time"""
+    start = time.perf_counter()
+    with open(log_path, 'a', encoding='utf-8') as log:
+        log.write(f"$ {' '.join(str(part) for part in command)}\n")
+        log.flush()
+        result = subprocess.run(command, cwd=cwd, stdout=log, stderr=subprocess.STDOUT, env=env)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(f"{Path(command[1]).name} exited with {result.returncode}, see {log_path}")
+    return elapsed
+
+def django_env(settings=None):
+    """Environment for scripts that set up Django: the real project on the path, optional settings"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(BASE_DIR), env.get("PYTHONPATH")]))
+    if settings:
+        env["DJANGO_SETTINGS_MODULE"] = settings
+    return env
+
+def bench_generator(workspace, scale, env, log_path, repeat=DEFAULT_REPEAT):
+    """Generate one scale repeat times and report each phase's fastest run from the generator's profile"""
+    scripts = workspace / SCRIPT_DIR.name
+    best = {}
+    for attempt in range(max(1, repeat)):
+        profile_path = workspace / f'profile_{scale}_{attempt}.json'
+        command = [sys.executable, 'generate_dummy_data.py', '--seed', str(BENCHMARK_SEED), '--workers', '1',
+                   '--no-snapshot-cache', '--profile', str(profile_path)]
+        command += ['--preset', scale] if scale in SCALE_PRESETS else ['--multiplier', scale]
+        if (scripts / 'listings_choices_snapshot.json').exists():
+            command += ['--django-free', '--choices-snapshot', 'listings_choices_snapshot.json']
+        run_logged(command, scripts, log_path, env)
+
+        with open(profile_path, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+        stages = report["stages"]
+        for phase in GENERATOR_PHASES:
+            if phase in stages:
+                best[phase] = min(best.get(phase, float('inf')), stages[phase]["seconds"])
+        best["total"] = min(best.get("total", float('inf')), report["wall_seconds"])
+
+    # Rows actually written, not the configured sizes
+    rows = {phase: count_csv_rows(workspace / 'dummy_data' / f'{table}.csv') for phase, table in GENERATOR_PHASES.items()}
+    rows["total"] = sum(rows.values())
+    return {f"generate.{phase}": metric(rows[phase], seconds) for phase, seconds in best.items()}
+
+def bench_cv_pdf(workspace, count):
+    """Render count CVs with generate_cv_pdf"""
+    from generate_pdf import generate_cv_pdf
+
+    output_dir = workspace / 'cv_bench'
+    output_dir.mkdir(exist_ok=True)
+    applicant_info = {
+        'name': 'Jane Doe', 'email': 'jane.doe@example.com', 'phone': '+1-555-0100',
+        'skills': 'Python, SQL, Docker, Kubernetes, Terraform, Data Analysis',
+        'experience_level': 'Senior', 'job_title': 'Backend Engineer',
+        'description': 'Builds and operates data pipelines and web services. ' * 4,
+        'message': 'I am excited to apply for this position. ' * 3
+    }
+    start = time.perf_counter()
+    for i in range(count):
+        generate_cv_pdf(applicant_info, str(output_dir / f'cv_{i}.pdf'), create_dir=False)
+    return {"cv_pdf": metric(count, time.perf_counter() - start)}
+
+def run_db_worker(csv_dir, result_path):
+    """Import csv_dir step by step and export it again (runs in a subprocess under Django)"""
+    from import_csv_to_db import CSVImporter
+
+    importer = CSVImporter(csv_dir=csv_dir)
+    # Clearing also restarts the id sequences, which the CSV foreign keys rely on
+    if not importer.setup_database() or not importer.clear_existing_data(confirm=False):
+        raise RuntimeError("Could not prepare the benchmark database")
+
+    results = {}
+    for step, filename in IMPORT_STEPS.items():
+        rows = count_csv_rows(os.path.join(importer.csv_dir, filename))
+        start = time.perf_counter()
+        getattr(importer, f'import_{step}')()
+        results[f"import.{step}"] = metric(rows, time.perf_counter() - start)
+
+    import export_data_to_csv
+    start = time.perf_counter()
+    export_data_to_csv.main()
+    seconds = time.perf_counter() - start
+    exported = sum(count_csv_rows(os.path.join('exported_data', name)) for name in os.listdir('exported_data'))
+    results["export"] = metric(exported, seconds)
+
+    with open(result_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f)
+
+def bench_db(workspace, env, log_path):
+    """Import and export through Django in a subprocess rooted at the workspace"""
+    result_path = workspace / 'db_results.json'
+    command = [sys.executable, f'{SCRIPT_DIR.name}/benchmark_suite.py', '--db-worker',
+               str(workspace / 'dummy_data'), str(result_path)]
+    run_logged(command, workspace, log_path, env)
+    with open(result_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def bench_compare(workspace, log_path):
+    """compare_data.py in-memory and --external over the generated and exported CSVs"""
+    exported_dir = workspace / 'exported_data'
+    if not exported_dir.exists():
+        # Without --db the generated files stand in for the export
+        exported_dir.mkdir()
+        for table in GENERATOR_PHASES.values():
+            shutil.copy2(workspace / 'dummy_data' / f'{table}.csv', exported_dir / f'{table}_exported.csv')
+
+    rows = sum(count_csv_rows(workspace / 'dummy_data' / f'{table}.csv') for table in GENERATOR_PHASES.values())
+    script = f'{SCRIPT_DIR.name}/compare_data.py'
+    return {
+        "compare": metric(rows, run_logged([sys.executable, script], workspace, log_path)),
+        "compare_external": metric(rows, run_logged([sys.executable, script, '--external'], workspace, log_path))
+    }
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BASE_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def machine_id():
+    """Runs are only compared with earlier runs on the same machine and interpreter"""
+    return f"{platform.node()}/{platform.machine()}/python{platform.python_version()}"
+
+def load_history(path):
+    if not os.path.exists(path):
+        return {"runs": []}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_history(path, history):
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(history, f, indent=2)
+    os.replace(temp_path, path)
+
+def find_baseline(history, machine, name):
+    """The metric from the most recent accepted run on this machine"""
+    for run in reversed(history["runs"]):
+        if run.get("accepted") and run.get("machine") == machine and name in run["metrics"]:
+            return run["metrics"][name]
+    return None
+
+def check_regressions(history, machine, metrics, tolerance):
+    """Compare metrics with their baselines; returns (rows for the report, regressed names)"""
+    report, regressions = [], []
+    for name, current in metrics.items():
+        baseline = find_baseline(history, machine, name)
+        if baseline is None or baseline["value"] <= 0:
+            report.append((name, current, None, "new"))
+            continue
+        change = current["value"] / baseline["value"] - 1
+        gated = min(current["seconds"], baseline["seconds"]) >= MIN_GATED_SECONDS
+        if change < -tolerance and gated:
+            status = "REGRESSION"
+            regressions.append(name)
+        elif change < -tolerance:
+            status = "slower (too short to gate)"
+        else:
+            status = "ok"
+        report.append((name, current, change, status))
+    return report, regressions
+
+def print_results(report, tolerance):
+    print("\n" + "="*78)
+    print("BENCHMARK RESULTS")
+    print("="*78)
+    print(f"  {'metric':<36}{'rows':>9}{'seconds':>10}{'rows/s':>12}{'vs base':>10}")
+    for name, current, change, status in report:
+        versus = f"{change * 100:+.1f}%" if change is not None else "-"
+        marker = "❌" if status == "REGRESSION" else ("⚠️ " if status != "ok" and status != "new" else "✓")
+        print(f"  {name:<36}{current['rows']:>9}{current['seconds']:>10.3f}{current['value']:>12.1f}"
+              f"{versus:>10}  {marker} {status}")
+    print(f"\n(tolerance {tolerance * 100:.0f}%; runs under {MIN_GATED_SECONDS}s are not gated; "
+          f"generator phases are the fastest of their repeated runs)")
+
+def main(scales=None, history_path=DEFAULT_HISTORY, tolerance=DEFAULT_TOLERANCE, db=False, settings=None,
+         cv_count=DEFAULT_CV_COUNT, save=True, accept=False, keep_workspace=False, repeat=DEFAULT_REPEAT):
+    """Run the suite; returns False when a metric regressed"""
+    scales = scales or DEFAULT_SCALES
+    env = django_env(settings)
+    metrics = {}
+
+    print("="*78)
+    print("DUMMY DATA TOOLCHAIN BENCHMARKS")
+    print("="*78)
+    if db:
+        print(f"⚠️  --db clears and imports into the database of {env.get('DJANGO_SETTINGS_MODULE', 'config.settings')}")
+
+    for scale in scales:
+        workspace = make_workspace()
+        log_path = workspace / 'benchmark.log'
+        print(f"\nScale {scale} ({table_counts(scale_sizes(scale))}) in {workspace}")
+        failed = True
+        try:
+            steps = [("generator", lambda: bench_generator(workspace, scale, env, log_path, repeat))]
+            if db:
+                steps.append(("import/export", lambda: bench_db(workspace, env, log_path)))
+            steps.append(("compare", lambda: bench_compare(workspace, log_path)))
+            for label, step in steps:
+                results = step()
+                metrics.update({f"{scale}.{name}": value for name, value in results.items()})
+                print(f"  ✓ {label}")
+            failed = False
+        finally:
+            # A failed run keeps its workspace so the log its error points to is still there
+            if keep_workspace or failed:
+                print(f"  Workspace kept: {workspace}")
+            else:
+                shutil.rmtree(workspace, ignore_errors=True)
+
+    if cv_count > 0:
+        workspace = Path(tempfile.mkdtemp(prefix='dummy_data_bench_'))
+        try:
+            metrics.update(bench_cv_pdf(workspace, cv_count))
+            print(f"\n  ✓ generate_cv_pdf x{cv_count}")
+        finally:
+            shutil.rmtree(workspace, ignore_errors=True)
+
+    history = load_history(history_path)
+    machine = machine_id()
+    report, regressions = check_regressions(history, machine, metrics, tolerance)
+    print_results(report, tolerance)
+
+    if save:
+        history["runs"].append({
+            "timestamp": datetime.now().isoformat(timespec='seconds'),
+            "commit": git_commit(),
+            "machine": machine,
+            "scales": scales,
+            "db": db,
+            # A regressed run does not become the next baseline unless accepted explicitly
+            "accepted": not regressions or accept,
+            "metrics": metrics
+        })
+        save_history(history_path, history)
+        print(f"History saved to {history_path}")
+
+    if regressions:
+        print("\n" + "!"*78)
+        print(f"❌ PERFORMANCE REGRESSION in {len(regressions)} metric(s): {', '.join(regressions)}")
+        print("   Re-run with --accept to make this run the new baseline.")
+        print("!"*78)
+        return False
+    print("\n✅ No regressions against the baseline")
+    return True
+
+if __name__ == "__main__":
+    import argparse
+
+    if len(sys.argv) == 4 and sys.argv[1] == '--db-worker':
+        # Internal: the import/export half of bench_db, run inside the workspace under Django
+        run_db_worker(sys.argv[2], sys.argv[3])
+        sys.exit(0)
+
+    parser = argparse.ArgumentParser(description='Benchmark generation, CV rendering, import, export and comparison')
+    parser.add_argument('--scales', type=str, default=','.join(DEFAULT_SCALES),
+                        help=f'Comma-separated presets ({", ".join(SCALE_PRESETS)}) or multipliers')
+    parser.add_argument('--history', type=str, default=str(DEFAULT_HISTORY),
+                        help='JSON file the results are appended to and compared against')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='Allowed drop below the baseline before a metric counts as a regression (0.25 = 25%%)')
+    parser.add_argument('--db', action='store_true',
+                        help='Also benchmark CSVImporter and export_data_to_csv.py (CLEARS the configured database)')
+    parser.add_argument('--settings', type=str, default=None,
+                        help='DJANGO_SETTINGS_MODULE for --db, e.g. a settings module using a scratch SQLite file')
+    parser.add_argument('--cv-count', type=int, default=DEFAULT_CV_COUNT,
+                        help='CVs rendered for the generate_cv_pdf benchmark (0 to skip)')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help='Generator runs per scale; each phase is measured by its fastest run')
+    parser.add_argument('--no-save', action='store_true', help="Don't append this run to the history")
+    parser.add_argument('--accept', action='store_true',
+                        help='Make this run the baseline even if it regressed')
+    parser.add_argument('--keep-workspace', action='store_true',
+                        help='Keep the scratch directories (generated data, exports and benchmark.log)')
+    args = parser.parse_args()
+
+    success = main(scales=[scale.strip() for scale in args.scales.split(',') if scale.strip()],
+                   history_path=args.history, tolerance=args.tolerance, db=args.db, settings=args.settings,
+                   cv_count=args.cv_count, save=not args.no_save, accept=args.accept,
+                   keep_workspace=args.keep_workspace, repeat=args.repeat)
+    sys.exit(0 if success else 1)
@@ -6,8 +6,33 @@ Script to compare generated dummy data with exported database data.
 import os
 import csv
 import sys
+import heapq
+import hashlib
+import itertools
+import tempfile
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor
 from collections import Counter
 
+from media_manifest import verify_manifest, MANIFEST_FILENAME, STATE_FILENAME
+
+# Rows held in memory per sorted run when comparing in out-of-core mode
+DEFAULT_MAX_ROWS_IN_MEMORY = 100000
+
+# Run files opened at once by one merge pass; more runs are merged in several passes
+MAX_MERGE_FAN_IN = 64
+
+# Threads listing media directories when checking file paths
+DEFAULT_SCAN_WORKERS = 8
+
+# Generated CSVs spell booleans "true"/"false", exports use "1"/"0"
+BOOLEAN_VALUES = {'true': '1', 'false': '0'}
+
+def normalize_value(value):
+    """Normalize a CSV or ORM value so generated and exported spellings compare equal"""
+    value = '' if value is None else str(value)
+    return BOOLEAN_VALUES.get(value.lower(), value)
+
 def read_csv_file(filepath):
     """Read a CSV file and return list of dictionaries"""
     if not os.path.exists(filepath):
@@ -79,35 +104,500 @@ def compare_files(generated_file, exported_file, key_fields=None):
     
     return generated_data, exported_data
 
-def check_file_paths_in_data(data, field_name, base_dir):
-    """Check if file paths in data actually exist"""
+def report_field_mismatch(generated_fields, exported_fields):
+    """Print which fields only exist on one side"""
+    if set(generated_fields) != set(exported_fields):
+        print(f"⚠️  FIELD MISMATCH:")
+        missing_in_exported = set(generated_fields) - set(exported_fields)
+        missing_in_generated = set(exported_fields) - set(generated_fields)
+        
+        if missing_in_exported:
+            print(f"  Fields in generated but not in exported: {missing_in_exported}")
+        if missing_in_generated:
+            print(f"  Fields in exported but not in generated: {missing_in_generated}")
+    else:
+        print("✓ Field names match")
+
+def report_comparison_stats(stats, samples, key_fields):
+    """Print the summary of a record-level comparison"""
+    print(f"Generated records: {stats['generated']}")
+    print(f"Exported records:  {stats['exported']}")
+    
+    if stats['generated'] != stats['exported']:
+        print(f"⚠️  COUNT MISMATCH: Difference of {abs(stats['generated'] - stats['exported'])} records")
+    else:
+        print("✓ Record counts match")
+    
+    print(f"Matching records:           {stats['matched']}")
+    print(f"Records with differences:   {stats['different']}")
+    print(f"Records only in generated:  {stats['only_generated']}")
+    print(f"Records only in exported:   {stats['only_exported']}")
+    
+    if samples:
+        print(f"\nFirst {len(samples)} differences (keyed by {', '.join(key_fields)}):")
+        for line in samples:
+            print(line)
+
+def peek_fieldnames(rows):
+    """Field names of the first row of a stream, and the stream with that row put back"""
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return [], rows
+    return list(first), itertools.chain([first], rows)
+
+def compare_record_streams(generated_rows, exported_rows, key_fields=None, max_reported=5,
+                           max_rows_in_memory=DEFAULT_MAX_ROWS_IN_MEMORY):
+    """Compare two streams of records joined on their natural key
+    
+    Rows may come from a csv.DictReader or straight from the ORM, in any
+    order. Both streams are hash-joined in memory on the natural key, so a
+    row missing on one side only affects that row. Only when a stream holds
+    more than max_rows_in_memory rows does the comparison spill to the
+    external sort and merge-join of compare_files_external.
+    """
+    generated_fields, generated_rows = peek_fieldnames(generated_rows)
+    exported_fields, exported_rows = peek_fieldnames(exported_rows)
+    generated_fields = generated_fields or exported_fields
+    exported_fields = exported_fields or generated_fields
+    
+    generated_head = list(itertools.islice(generated_rows, max_rows_in_memory + 1))
+    exported_head = list(itertools.islice(exported_rows, max_rows_in_memory + 1))
+    if len(generated_head) > max_rows_in_memory or len(exported_head) > max_rows_in_memory:
+        print(f"More than {max_rows_in_memory} rows, spilling to external sort")
+        return merge_join_rows(itertools.chain(generated_head, generated_rows), generated_fields,
+                               itertools.chain(exported_head, exported_rows), exported_fields,
+                               key_fields, max_rows_in_memory, max_reported)
+    
+    return hash_join_rows(generated_head, generated_fields, exported_head, exported_fields,
+                          key_fields, max_reported)
+
+# Aggregate signature of each table: columns folded into the hash aggregate,
+# datetime columns reported as min/max, optional per-industry and active splits
+SIGNATURE_SPECS = {
+    'auth_user': {
+        'hash_fields': ['username', 'email', 'first_name', 'last_name'],
+        'date_fields': ['date_joined', 'last_login'],
+        'group_field': None,
+        'active_field': None
+    },
+    'companies_company': {
+        'hash_fields': ['name', 'email', 'phone', 'user_id'],
+        'date_fields': ['create_date'],
+        'group_field': 'industry',
+        'active_field': None
+    },
+    'listings_listing': {
+        'hash_fields': ['company_id', 'title', 'budget', 'duration'],
+        'date_fields': ['publish_date'],
+        'group_field': 'industry',
+        'active_field': 'is_active'
+    },
+    'applies_apply': {
+        'hash_fields': ['listing_id', 'user_id', 'name', 'email', 'cv'],
+        'date_fields': ['apply_date'],
+        'group_field': None,
+        'active_field': None
+    },
+}
+
+# Row hashes are summed modulo 2**64 so the aggregate does not depend on row order
+SIGNATURE_HASH_MODULUS = 2 ** 64
+
+def row_signature_hash(values):
+    """Hash key column values of one row (first 60 bits of an MD5 digest)
+
+    The same expression is computed in SQL on PostgreSQL, so the per-row
+    hashes can be summed on either side and compared.
+    """
+    joined = '|'.join(normalize_value(value) for value in values)
+    return int(hashlib.md5(joined.encode('utf-8')).hexdigest()[:15], 16)
+
+def compute_csv_signature(filepath, spec):
+    """Compute a table's aggregate signature while streaming a generated CSV"""
+    signature = {'count': 0, 'hash': 0}
+    if spec['group_field']:
+        signature['by_' + spec['group_field']] = Counter()
+    if spec['active_field']:
+        signature['active'] = 0
+        signature['inactive'] = 0
+    
+    with open(filepath, 'r', encoding='utf-8') as csvfile:
+        for row in csv.DictReader(csvfile):
+            signature['count'] += 1
+            signature['hash'] += row_signature_hash(row.get(field) for field in spec['hash_fields'])
+            
+            if spec['group_field']:
+                signature['by_' + spec['group_field']][row[spec['group_field']]] += 1
+            if spec['active_field']:
+                if normalize_value(row[spec['active_field']]) == '1':
+                    signature['active'] += 1
+                else:
+                    signature['inactive'] += 1
+            
+            # Timestamps are "YYYY-MM-DD HH:MM:SS", so string order is time order
+            for field in spec['date_fields']:
+                value = row.get(field)
+                if not value:
+                    continue
+                if signature.get('min_' + field) is None or value < signature['min_' + field]:
+                    signature['min_' + field] = value
+                if signature.get('max_' + field) is None or value > signature['max_' + field]:
+                    signature['max_' + field] = value
+    
+    for field in spec['date_fields']:
+        signature.setdefault('min_' + field, None)
+        signature.setdefault('max_' + field, None)
+    signature['hash'] %= SIGNATURE_HASH_MODULUS
+    return signature
+
+def compare_signatures(expected, actual):
+    """Return the signature entries that differ as (name, expected, actual)"""
+    differences = []
+    for name in expected:
+        expected_value = expected[name]
+        actual_value = actual.get(name)
+        if isinstance(expected_value, Counter):
+            actual_value = Counter(actual_value or {})
+            for group in sorted(set(expected_value) | set(actual_value)):
+                if expected_value[group] != actual_value[group]:
+                    differences.append((f"{name}[{group}]", expected_value[group], actual_value[group]))
+        elif expected_value != actual_value:
+            differences.append((name, expected_value, actual_value))
+    return differences
+
+def make_sort_key(key_fields, fieldnames):
+    """Build a sort key ordering rows by natural key, then by full content"""
+    def sort_key(row):
+        return (
+            tuple(normalize_value(row.get(field)) for field in key_fields),
+            tuple(normalize_value(row.get(field)) for field in fieldnames)
+        )
+    return sort_key
+
+def external_sort_rows(rows, fieldnames, sort_key, tmp_dir, run_prefix,
+                       max_rows_in_memory=DEFAULT_MAX_ROWS_IN_MEMORY):
+    """Split a stream of rows into sorted run files of at most max_rows_in_memory rows
+    
+    Returns the number of rows read and the list of run file paths.
+    """
+    run_paths = []
+    row_count = 0
+    rows = iter(rows)
+    
+    while True:
+        chunk = list(itertools.islice(rows, max_rows_in_memory))
+        if not chunk:
+            break
+        row_count += len(chunk)
+        chunk.sort(key=sort_key)
+        
+        run_path = os.path.join(tmp_dir, f"{run_prefix}_run_{len(run_paths)}.csv")
+        with open(run_path, 'w', newline='', encoding='utf-8') as run_file:
+            writer = csv.DictWriter(run_file, fieldnames=fieldnames, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(chunk)
+        run_paths.append(run_path)
+    
+    return row_count, run_paths
+
+def iter_sorted_runs(run_paths, sort_key, stack):
+    """Stream rows from sorted run files in global sort order"""
+    readers = []
+    for run_path in run_paths:
+        run_file = stack.enter_context(open(run_path, 'r', encoding='utf-8'))
+        readers.append(csv.DictReader(run_file))
+    return heapq.merge(*readers, key=sort_key)
+
+def reduce_runs(run_paths, fieldnames, sort_key, tmp_dir, run_prefix, fan_in=MAX_MERGE_FAN_IN):
+    """Merge sorted runs in passes of at most fan_in files until fan_in or fewer remain
+    
+    Keeps the number of open run files bounded, so a large input with a small
+    max_rows_in_memory does not run into the file descriptor limit.
+    """
+    merge_pass = 0
+    while len(run_paths) > fan_in:
+        merged_paths = []
+        for start in range(0, len(run_paths), fan_in):
+            group = run_paths[start:start + fan_in]
+            if len(group) == 1:
+                merged_paths.extend(group)
+                continue
+            merged_path = os.path.join(tmp_dir, f"{run_prefix}_pass_{merge_pass}_{len(merged_paths)}.csv")
+            with ExitStack() as stack, open(merged_path, 'w', newline='', encoding='utf-8') as merged_file:
+                writer = csv.DictWriter(merged_file, fieldnames=fieldnames, extrasaction='ignore')
+                writer.writeheader()
+                writer.writerows(iter_sorted_runs(group, sort_key, stack))
+            for run_path in group:
+                os.remove(run_path)
+            merged_paths.append(merged_path)
+        run_paths = merged_paths
+        merge_pass += 1
+    return run_paths
+
+def compare_files_external(generated_file, exported_file, key_fields=None,
+                           max_rows_in_memory=DEFAULT_MAX_ROWS_IN_MEMORY, max_reported=5):
+    """Compare two CSV files out-of-core using external sort and a merge-join
+    
+    Each file is sorted by its natural key into temporary runs holding at most
+    max_rows_in_memory rows, then both sides are streamed in key order so memory
+    stays bounded regardless of file size.
+    """
+    print(f"\nComparing (out-of-core):\n  Generated: {generated_file}\n  Exported:  {exported_file}")
+    print("-" * 60)
+    
+    for filepath in (generated_file, exported_file):
+        if not os.path.exists(filepath):
+            print(f"Error: File not found: {filepath}")
+            return None
+    
+    with open(generated_file, 'r', encoding='utf-8') as generated_csv, \
+            open(exported_file, 'r', encoding='utf-8') as exported_csv:
+        generated_rows = csv.DictReader(generated_csv)
+        exported_rows = csv.DictReader(exported_csv)
+        return merge_join_rows(generated_rows, generated_rows.fieldnames or [],
+                               exported_rows, exported_rows.fieldnames or [],
+                               key_fields, max_rows_in_memory, max_reported)
+
+def join_fields(generated_fields, exported_fields, key_fields=None):
+    """Fields present on both sides, and the natural key to join them on"""
+    common_fields = [field for field in generated_fields if field in exported_fields]
+    
+    # Natural key: requested key fields present on both sides, else every common field
+    key_fields_to_check = ['name', 'email', 'id'] if not key_fields else key_fields
+    natural_key = [field for field in key_fields_to_check if field in common_fields] or common_fields
+    return common_fields, natural_key
+
+def new_comparison_stats():
+    """Counters filled in by a record-level comparison"""
+    return {
+        'generated': 0,
+        'exported': 0,
+        'matched': 0,
+        'different': 0,
+        'only_generated': 0,
+        'only_exported': 0
+    }
+
+def compare_key_group(key, gen_values, exp_values, common_fields, stats, report):
+    """Compare the rows sharing one natural key (Counters of row values per side)"""
+    if not exp_values:
+        group_size = sum(gen_values.values())
+        stats['only_generated'] += group_size
+        report(f"  ⚠️  Only in generated ({group_size}): {key}")
+        return
+    if not gen_values:
+        group_size = sum(exp_values.values())
+        stats['only_exported'] += group_size
+        report(f"  ⚠️  Only in exported ({group_size}): {key}")
+        return
+    
+    stats['matched'] += sum((gen_values & exp_values).values())
+    
+    # Pair up the leftovers on each side as differing records
+    gen_left = sorted((gen_values - exp_values).elements())
+    exp_left = sorted((exp_values - gen_values).elements())
+    for gen_row, exp_row in zip(gen_left, exp_left):
+        stats['different'] += 1
+        for field, gen_value, exp_value in zip(common_fields, gen_row, exp_row):
+            if gen_value != exp_value:
+                report(f"  ⚠️  {key} {field}: Generated='{gen_value}' vs Exported='{exp_value}'")
+                break
+    stats['only_generated'] += max(0, len(gen_left) - len(exp_left))
+    stats['only_exported'] += max(0, len(exp_left) - len(gen_left))
+
+def hash_join_rows(generated_rows, generated_fields, exported_rows, exported_fields, key_fields=None,
+                   max_reported=5):
+    """Compare two row collections held in memory by a hash join on their natural key"""
+    common_fields, natural_key = join_fields(generated_fields, exported_fields, key_fields)
+    
+    report_field_mismatch(generated_fields, exported_fields)
+    
+    def group_rows(rows):
+        groups = {}
+        for row in rows:
+            key = tuple(normalize_value(row.get(field)) for field in natural_key)
+            values = tuple(normalize_value(row.get(field)) for field in common_fields)
+            groups.setdefault(key, Counter())[values] += 1
+        return groups
+    
+    stats = new_comparison_stats()
+    samples = []
+    
+    def report(message):
+        if len(samples) < max_reported:
+            samples.append(message)
+    
+    generated_groups = group_rows(generated_rows)
+    exported_groups = group_rows(exported_rows)
+    stats['generated'] = sum(sum(values.values()) for values in generated_groups.values())
+    stats['exported'] = sum(sum(values.values()) for values in exported_groups.values())
+    
+    # Visit keys in sorted order so reported samples match the merge-join's
+    for key in sorted(generated_groups.keys() | exported_groups.keys()):
+        compare_key_group(key, generated_groups.get(key, Counter()), exported_groups.get(key, Counter()),
+                          common_fields, stats, report)
+    
+    report_comparison_stats(stats, samples, natural_key)
+    
+    return stats
+
+def merge_join_rows(generated_rows, generated_fields, exported_rows, exported_fields, key_fields=None,
+                    max_rows_in_memory=DEFAULT_MAX_ROWS_IN_MEMORY, max_reported=5):
+    """Compare two row streams by external sort on their natural key and a merge-join"""
+    common_fields, natural_key = join_fields(generated_fields, exported_fields, key_fields)
+    
+    report_field_mismatch(generated_fields, exported_fields)
+    
+    sort_key = make_sort_key(natural_key, common_fields)
+    
+    def row_key(row):
+        return tuple(normalize_value(row.get(field)) for field in natural_key)
+    
+    def row_values(row):
+        return tuple(normalize_value(row.get(field)) for field in common_fields)
+    
+    stats = new_comparison_stats()
+    samples = []
+    
+    def report(message):
+        if len(samples) < max_reported:
+            samples.append(message)
+    
+    with tempfile.TemporaryDirectory(prefix='compare_data_') as tmp_dir, ExitStack() as stack:
+        stats['generated'], generated_runs = external_sort_rows(generated_rows, generated_fields, sort_key, tmp_dir,
+                                                                'generated', max_rows_in_memory)
+        stats['exported'], exported_runs = external_sort_rows(exported_rows, exported_fields, sort_key, tmp_dir,
+                                                              'exported', max_rows_in_memory)
+        print(f"Sorted into {len(generated_runs)} + {len(exported_runs)} runs of up to {max_rows_in_memory} rows")
+        generated_runs = reduce_runs(generated_runs, generated_fields, sort_key, tmp_dir, 'generated')
+        exported_runs = reduce_runs(exported_runs, exported_fields, sort_key, tmp_dir, 'exported')
+        
+        # Only one group of rows sharing a natural key is held per side at a time
+        generated_groups = itertools.groupby(iter_sorted_runs(generated_runs, sort_key, stack), key=row_key)
+        exported_groups = itertools.groupby(iter_sorted_runs(exported_runs, sort_key, stack), key=row_key)
+        gen_group = next(generated_groups, None)
+        exp_group = next(exported_groups, None)
+        
+        # Merge-join both sorted streams on the natural key
+        while gen_group is not None or exp_group is not None:
+            if exp_group is None or (gen_group is not None and gen_group[0] < exp_group[0]):
+                compare_key_group(gen_group[0], Counter(row_values(row) for row in gen_group[1]), Counter(),
+                                  common_fields, stats, report)
+                gen_group = next(generated_groups, None)
+            elif gen_group is None or exp_group[0] < gen_group[0]:
+                compare_key_group(exp_group[0], Counter(), Counter(row_values(row) for row in exp_group[1]),
+                                  common_fields, stats, report)
+                exp_group = next(exported_groups, None)
+            else:
+                compare_key_group(gen_group[0], Counter(row_values(row) for row in gen_group[1]),
+                                  Counter(row_values(row) for row in exp_group[1]),
+                                  common_fields, stats, report)
+                gen_group = next(generated_groups, None)
+                exp_group = next(exported_groups, None)
+    
+    report_comparison_stats(stats, samples, natural_key)
+    
+    return stats
+
+def scan_directory(directory):
+    """List the file names in a directory once (empty if it does not exist)"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+def list_subdirectories(directory):
+    """List the subdirectories of a directory (empty if it does not exist)"""
+    try:
+        with os.scandir(directory) as entries:
+            return [entry.path for entry in entries if entry.is_dir()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+def list_date_directories(root_dir, executor):
+    """Find every YYYY/MM/DD directory under a media root such as cv/ or photos/"""
+    directories = [root_dir]
+    for _ in range(3):  # year, month, day
+        directories = [
+            subdirectory
+            for subdirectories in executor.map(list_subdirectories, directories)
+            for subdirectory in subdirectories
+        ]
+    return directories
+
+def check_file_paths_in_data(data, field_name, base_dir, max_workers=DEFAULT_SCAN_WORKERS):
+    """Check if file paths in data actually exist and find orphan files on disk
+    
+    Paths are grouped by directory and every cv/YYYY/MM/DD or photos/YYYY/MM/DD
+    directory is listed once with os.scandir in a thread pool, so existence is
+    answered from in-memory sets instead of one os.path.exists call per row.
+    data may be any iterable of rows, e.g. a csv.DictReader.
+    """
     print(f"\nChecking {field_name} file paths...")
     
-    missing_files = []
-    existing_files = []
+    # directory -> {file name: record number of first reference}
+    referenced = {}
+    total_paths = 0
     
     for i, record in enumerate(data):
         if field_name in record and record[field_name]:
             file_path = record[field_name]
-            full_path = os.path.join(base_dir, file_path)
-            
-            if os.path.exists(full_path):
-                existing_files.append(file_path)
+            directory, file_name = os.path.split(os.path.normpath(file_path))
+            referenced.setdefault(directory, {}).setdefault(file_name, (i+1, file_path))
+            total_paths += 1
+    
+    # Media roots are the top-level folders of the referenced paths (cv, photos)
+    media_roots = {directory.split(os.sep)[0] for directory in referenced if directory}
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        directories = set(referenced)
+        for media_root in media_roots:
+            date_directories = list_date_directories(os.path.join(base_dir, media_root), executor)
+            directories.update(os.path.relpath(path, base_dir) for path in date_directories)
+        
+        directories = sorted(directories)
+        full_directories = [os.path.join(base_dir, directory) for directory in directories]
+        files_on_disk = dict(zip(directories, executor.map(scan_directory, full_directories)))
+    
+    existing_count = 0
+    missing_files = []
+    orphan_files = []
+    
+    for directory in directories:
+        on_disk = files_on_disk[directory]
+        wanted = referenced.get(directory, {})
+        for file_name, (record_num, file_path) in wanted.items():
+            if file_name in on_disk:
+                existing_count += 1
             else:
-                missing_files.append((i+1, file_path))
+                missing_files.append((record_num, file_path))
+        orphan_files.extend(
+            os.path.join(directory, file_name)
+            for file_name in sorted(on_disk - wanted.keys())
+        )
+    
+    missing_files.sort()
     
-    print(f"  Total {field_name} paths: {len(existing_files) + len(missing_files)}")
-    print(f"  Existing files: {len(existing_files)}")
+    print(f"  Total {field_name} paths: {total_paths} ({existing_count + len(missing_files)} unique)")
+    print(f"  Existing files: {existing_count}")
     print(f"  Missing files: {len(missing_files)}")
+    print(f"  Orphan files on disk: {len(orphan_files)}")
     
     if missing_files:
         print(f"  First 5 missing files:")
         for i, (record_num, path) in enumerate(missing_files[:5]):
             print(f"    Record {record_num}: {path}")
     
-    return existing_files, missing_files
+    if orphan_files:
+        print(f"  First 5 orphan files:")
+        for path in orphan_files[:5]:
+            print(f"    {path}")
+    
+    return existing_count, missing_files, orphan_files
 
-def main():
+def main(external=False, max_rows_in_memory=DEFAULT_MAX_ROWS_IN_MEMORY, scan_workers=DEFAULT_SCAN_WORKERS):
     """Main comparison function"""
     print("="*70)
     print("COMPARING GENERATED DATA WITH EXPORTED DATABASE DATA")
@@ -124,8 +614,12 @@ def main():
     all_results = []
     
     for gen_file, exp_file, key_fields in files_to_compare:
-        gen_data, exp_data = compare_files(gen_file, exp_file, key_fields)
-        all_results.append((gen_file, gen_data, exp_data))
+        if external:
+            stats = compare_files_external(gen_file, exp_file, key_fields, max_rows_in_memory)
+            all_results.append((gen_file, stats))
+        else:
+            gen_data, exp_data = compare_files(gen_file, exp_file, key_fields)
+            all_results.append((gen_file, gen_data, exp_data))
     
     # Check file paths for logos and CVs
     print("\n" + "="*70)
@@ -136,19 +630,21 @@ def main():
     company_export_file = "exported_data/companies_company_exported.csv"
     if os.path.exists(company_export_file):
         with open(company_export_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            company_data = list(reader)
-            
-        check_file_paths_in_data(company_data, "logo", ".")
+            check_file_paths_in_data(csv.DictReader(f), "logo", ".", scan_workers)
     
     # Check CV files in apply data
     apply_export_file = "exported_data/applies_apply_exported.csv"
     if os.path.exists(apply_export_file):
         with open(apply_export_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            apply_data = list(reader)
-            
-        check_file_paths_in_data(apply_data, "cv", ".")
+            check_file_paths_in_data(csv.DictReader(f), "cv", ".", scan_workers)
+    
+    # Check media sizes and checksums against the manifest written at generation time
+    manifest_file = os.path.join("dummy_data", MANIFEST_FILENAME)
+    if os.path.exists(manifest_file):
+        print("\n" + "="*70)
+        print("CHECKING MEDIA INTEGRITY")
+        print("="*70)
+        verify_manifest(manifest_file, ".", os.path.join("dummy_data", STATE_FILENAME), max_workers=scan_workers)
     
     print("\n" + "="*70)
     print("SUMMARY")
@@ -164,4 +660,17 @@ def main():
     print("="*70)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Compare generated dummy data with exported database data')
+    parser.add_argument('--external', action='store_true',
+                        help='Compare out-of-core: external-sort both files by natural key and merge-join them')
+    parser.add_argument('--max-rows-in-memory', type=int, default=DEFAULT_MAX_ROWS_IN_MEMORY,
+                        help='Rows held in memory per sorted run in --external mode')
+    parser.add_argument('--workers', type=int, default=DEFAULT_SCAN_WORKERS,
+                        help='Threads used to list media directories when checking file paths')
+    
+    args = parser.parse_args()
+    if args.max_rows_in_memory < 1:
+        parser.error('--max-rows-in-memory must be at least 1')
+    main(external=args.external, max_rows_in_memory=args.max_rows_in_memory, scan_workers=args.workers)
\ No newline at end of file
@@ -20,16 +20,39 @@ from django.contrib.auth.models import User
 from companies.models import Company
 from listings.models import Listing
 from applies.models import Apply
+from django.db import connection
+from django.db.models import Count, Max, Min, Q
 
-def export_auth_user_data():
-    """Export auth_user data to CSV"""
-    print("Exporting auth_user data...")
-    
-    users = User.objects.all().order_by('id')
-    data = []
-    
-    for user in users:
-        user_data = {
+# Field order of each exported file (matches generate_dummy_data.py)
+AUTH_USER_FIELDS = [
+    "password", "last_login", "is_superuser", "username", "first_name",
+    "last_name", "email", "is_staff", "is_active", "date_joined"
+]
+COMPANY_FIELDS = [
+    "name", "logo", "industry", "serivces", "description", 
+    "phone", "email", "create_date", "user_id"
+]
+LISTING_FIELDS = [
+    "company_id", "title", "industry", "budget", "duration",
+    "description", "requirement", "publish_date", "is_active"
+]
+APPLY_FIELDS = [
+    "name", "email", "phone", "message",
+    "cv", "apply_date", "listing_id", "user_id"
+]
+
+# Rows fetched per round trip when streaming from the database
+ITERATOR_CHUNK_SIZE = 2000
+
+def iter_auth_user_data(include_superusers=True):
+    """Stream auth_user rows from the database in id order
+
+    With include_superusers=False only the rows covered by the auth_user
+    signature are streamed (superusers are never generated).
+    """
+    queryset = User.objects.all() if include_superusers else signature_queryset('auth_user')
+    for user in queryset.order_by('id').iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+        yield {
             "password": user.password,
             "last_login": user.last_login.strftime("%Y-%m-%d %H:%M:%S") if user.last_login else "",
             "is_superuser": "1" if user.is_superuser else "0",
@@ -41,19 +64,11 @@ def export_auth_user_data():
             "is_active": "1" if user.is_active else "0",
             "date_joined": user.date_joined.strftime("%Y-%m-%d %H:%M:%S"),
         }
-        data.append(user_data)
-    
-    return data
 
-def export_company_data():
-    """Export company data to CSV"""
-    print("Exporting company data...")
-    
-    companies = Company.objects.all().order_by('id')
-    data = []
-    
-    for company in companies:
-        company_data = {
+def iter_company_data():
+    """Stream company rows from the database in id order"""
+    for company in Company.objects.all().order_by('id').iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+        yield {
             "name": company.name,
             "logo": str(company.logo) if company.logo else "",  # Get the file path
             "industry": company.industry,
@@ -62,22 +77,14 @@ def export_company_data():
             "phone": company.phone,
             "email": company.email,
             "create_date": company.create_date.strftime("%Y-%m-%d %H:%M:%S"),
-            "user_id": company.user.id if company.user else "",
+            "user_id": company.user_id if company.user_id else "",
         }
-        data.append(company_data)
-    
-    return data
 
-def export_listing_data():
-    """Export listing data to CSV"""
-    print("Exporting listing data...")
-    
-    listings = Listing.objects.all().order_by('id')
-    data = []
-    
-    for listing in listings:
-        listing_data = {
-            "company_id": listing.company.id if listing.company else "",
+def iter_listing_data():
+    """Stream listing rows from the database in id order"""
+    for listing in Listing.objects.all().order_by('id').iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+        yield {
+            "company_id": listing.company_id if listing.company_id else "",
             "title": listing.title,
             "industry": listing.industry,
             "budget": listing.budget,
@@ -87,31 +94,112 @@ def export_listing_data():
             "publish_date": listing.publish_date.strftime("%Y-%m-%d %H:%M:%S"),
             "is_active": "1" if listing.is_active else "0",
         }
-        data.append(listing_data)
-    
-    return data
 
-def export_apply_data():
-    """Export apply data to CSV"""
-    print("Exporting apply data...")
-    
-    applies = Apply.objects.all().order_by('id')
-    data = []
-    
-    for apply in applies:
-        apply_data = {
-            "listing_id": apply.listing.id if apply.listing else "",
+def iter_apply_data():
+    """Stream apply rows from the database in id order"""
+    for apply in Apply.objects.all().order_by('id').iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+        yield {
+            "listing_id": apply.listing_id if apply.listing_id else "",
             "name": apply.name,
             "email": apply.email,
             "phone": apply.phone,
             "message": apply.message,
             "cv": str(apply.cv) if apply.cv else "",  # Get the file path
             "apply_date": apply.apply_date.strftime("%Y-%m-%d %H:%M:%S"),
-            "user_id": apply.user.id if apply.user else "",
+            "user_id": apply.user_id if apply.user_id else "",
         }
-        data.append(apply_data)
-    
-    return data
+
+def export_auth_user_data():
+    """Export auth_user data to CSV"""
+    print("Exporting auth_user data...")
+    return list(iter_auth_user_data())
+
+def export_company_data():
+    """Export company data to CSV"""
+    print("Exporting company data...")
+    return list(iter_company_data())
+
+def export_listing_data():
+    """Export listing data to CSV"""
+    print("Exporting listing data...")
+    return list(iter_listing_data())
+
+def export_apply_data():
+    """Export apply data to CSV"""
+    print("Exporting apply data...")
+    return list(iter_apply_data())
+
+# Models behind each table verified by aggregate signature
+SIGNATURE_MODELS = {
+    'auth_user': User,
+    'companies_company': Company,
+    'listings_listing': Listing,
+    'applies_apply': Apply,
+}
+
+def signature_queryset(table):
+    """Rows covered by a table's signature (superusers are never generated)"""
+    model = SIGNATURE_MODELS[table]
+    if model is User:
+        return User.objects.filter(is_superuser=False)
+    return model.objects.all()
+
+def compute_db_hash_aggregate(table, spec):
+    """Sum the per-row key column hashes of a table
+
+    On PostgreSQL the hash is computed in SQL; other databases stream only the
+    key columns and hash them in Python with the same expression.
+    """
+    from compare_data import row_signature_hash, SIGNATURE_HASH_MODULUS
+
+    queryset = signature_queryset(table)
+
+    if connection.vendor == 'postgresql':
+        model = SIGNATURE_MODELS[table]
+        columns = [model._meta.get_field(field).column for field in spec['hash_fields']]
+        joined = " || '|' || ".join(f'COALESCE("{column}"::text, \'\')' for column in columns)
+        sql = (
+            f"SELECT COALESCE(SUM(('x' || substr(md5({joined}), 1, 15))::bit(60)::bigint), 0) "
+            f'FROM "{model._meta.db_table}"'
+        )
+        if model is User:
+            sql += ' WHERE NOT "is_superuser"'
+        with connection.cursor() as cursor:
+            cursor.execute(sql)
+            return int(cursor.fetchone()[0]) % SIGNATURE_HASH_MODULUS
+
+    total = 0
+    for values in queryset.values_list(*spec['hash_fields']).iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+        total += row_signature_hash(values)
+    return total % SIGNATURE_HASH_MODULUS
+
+def compute_db_signature(table, spec):
+    """Compute a table's aggregate signature with database-side aggregates"""
+    queryset = signature_queryset(table)
+
+    aggregates = {'count': Count('pk')}
+    if spec['active_field']:
+        aggregates['active'] = Count('pk', filter=Q(**{spec['active_field']: True}))
+        aggregates['inactive'] = Count('pk', filter=Q(**{spec['active_field']: False}))
+    for field in spec['date_fields']:
+        aggregates['min_' + field] = Min(field)
+        aggregates['max_' + field] = Max(field)
+
+    signature = queryset.aggregate(**aggregates)
+    for field in spec['date_fields']:
+        for name in ('min_' + field, 'max_' + field):
+            if signature[name] is not None:
+                signature[name] = signature[name].strftime("%Y-%m-%d %H:%M:%S")
+
+    if spec['group_field']:
+        group_field = spec['group_field']
+        signature['by_' + group_field] = {
+            row[group_field]: row['count']
+            for row in queryset.values(group_field).annotate(count=Count('pk')).order_by()
+        }
+
+    signature['hash'] = compute_db_hash_aggregate(table, spec)
+    return signature
 
 def write_csv(filename, data, fieldnames):
     """Write data to CSV file"""
@@ -133,36 +221,20 @@ def main():
     print("="*60)
     
     # Export auth_user data
-    auth_user_fields = [
-        "password", "last_login", "is_superuser", "username", "first_name",
-        "last_name", "email", "is_staff", "is_active", "date_joined"
-    ]
     auth_user_data = export_auth_user_data()
-    write_csv('auth_user_exported.csv', auth_user_data, auth_user_fields)
+    write_csv('auth_user_exported.csv', auth_user_data, AUTH_USER_FIELDS)
     
     # Export company data
-    company_fields = [
-        "name", "logo", "industry", "serivces", "description", 
-        "phone", "email", "create_date", "user_id"
-    ]
     company_data = export_company_data()
-    write_csv('companies_company_exported.csv', company_data, company_fields)
+    write_csv('companies_company_exported.csv', company_data, COMPANY_FIELDS)
     
     # Export listing data
-    listing_fields = [
-        "company_id", "title", "industry", "budget", "duration",
-        "description", "requirement", "publish_date", "is_active"
-    ]
     listing_data = export_listing_data()
-    write_csv('listings_listing_exported.csv', listing_data, listing_fields)
+    write_csv('listings_listing_exported.csv', listing_data, LISTING_FIELDS)
     
     # Export apply data
-    apply_fields = [
-        "name", "email", "phone", "message",
-        "cv", "apply_date", "listing_id", "user_id"
-    ]
     apply_data = export_apply_data()
-    write_csv('applies_apply_exported.csv', apply_data, apply_fields)
+    write_csv('applies_apply_exported.csv', apply_data, APPLY_FIELDS)
     
     print("\n" + "="*60)
     print("EXPORT COMPLETE!")
@@ -1,37 +1,133 @@
 from pathlib import Path
 import csv
 import random
+import hashlib
+import string
 from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
 import os
 import sys
-import django
+import json
+import time
+import shutil
+import tempfile
+import threading
+import contextlib
 
 from generate_dummy_data_choices import FIRST_NAMES, LAST_NAMES, COMPANY_NAMES, EXPERIENCE_LEVELS, JOB_TITLES, SKILLS, DESCRIPTIONS, SERVICES, MESSAGES
 from industry_mappings import INDUSTRY_CATEGORIES  # Import from separate file
 
-# Setup Django environment
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
-django.setup()
-
-# Setup paths for importing listings/choices.py
+# Setup paths for importing listings/choices.py (Django itself is only set up on demand)
 project_root = Path(__file__).parent.parent
 BASE_DIR = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(BASE_DIR))
-from listings.choices import industry_choices, budget_choices, duration_choices
 
-from django.contrib.auth.hashers import make_password
+# Standalone Django-compatible password hashing for Django-free mode
+import password_hashing
+
+
+# Import media manifest writer
+from media_manifest import write_manifest, media_entry, MANIFEST_FILENAME
+
+# Import vectorized batch generators (NumPy optional)
+from batch_generators import (
+    EMAIL_DOMAINS, COMPANY_EMAIL_DOMAINS, make_rng, random_integers, choose_batch,
+    generate_phones, generate_emails, generate_datetimes, format_datetimes, to_datetimes
+)
+
+# Import the columnar store for records read by later phases
+from record_store import ColumnStore, DATETIME_FORMAT
+
+# Import uniqueness helpers for emails and company names
+from unique_values import make_unique, unique_email, unique_company_name
+
+# Import overlapped pipeline stages (password hashing, logos, CVs, CSV writing)
+from pipeline import Stage, CsvSink, DatabaseSink, DEFAULT_STAGE_WORKERS, resolved, resolve_rows
+
+# Import the PostgreSQL load file writer (--sql)
+from sql_dump import SqlDump, SQL_DIRNAME, SQL_FORMATS, DEFAULT_TIMEZONE as DEFAULT_SQL_TIMEZONE
+
+# Import the output path allocator for CVs and logos
+from path_allocator import PathAllocator
+
+# Import the --profile instrumentation
+from profiling import Profiler
+
+# Import the snapshot cache for repeated runs with the same inputs
+from snapshot_cache import (
+    DEFAULT_MAX_CACHE_BYTES, compute_fingerprint, restore_snapshot, save_snapshot, evict_snapshots
+)
+import batch_generators
+
+# Import scale presets and resource planner
+from scale_presets import (
+    SCALE_PRESETS, DEFAULT_PRESET, SIZE_RATIOS, RECORD_COSTS,
+    resolve_sizes, load_sizes_config, estimate_resources, print_plan
+)
 
-# Import CV generation function
-from generate_pdf import generate_cv_pdf
+# Configuration (default preset; change with --preset, --multiplier or per-table options)
+NUM_COMPANY_USERS = 0  # Company users (1:1 with companies)
+NUM_INDIVIDUAL_USERS = 0  # Individual users (job seekers)
+NUM_COMPANIES = 0  # Same as company users
+NUM_LISTINGS = 0
+NUM_APPLIES = 0
 
-# Configuration
-Multipler = 30
-NUM_COMPANY_USERS = 1 * Multipler  # Company users (1:1 with companies)
-NUM_INDIVIDUAL_USERS = 10 * Multipler  # Individual users (job seekers)
-NUM_COMPANIES = NUM_COMPANY_USERS  # Same as company users
-NUM_LISTINGS = 4 * Multipler
-NUM_APPLIES = 60 * Multipler
+def configure_sizes(sizes):
+    """Set the table sizes used by the generators"""
+    global NUM_COMPANY_USERS, NUM_INDIVIDUAL_USERS, NUM_COMPANIES, NUM_LISTINGS, NUM_APPLIES
+    NUM_COMPANY_USERS = sizes["company_users"]
+    NUM_INDIVIDUAL_USERS = sizes["individual_users"]
+    NUM_COMPANIES = NUM_COMPANY_USERS  # Same as company users
+    NUM_LISTINGS = sizes["listings"]
+    NUM_APPLIES = sizes["applies"]
+
+def current_sizes():
+    """Table sizes currently used by the generators"""
+    return {
+        "company_users": NUM_COMPANY_USERS,
+        "individual_users": NUM_INDIVIDUAL_USERS,
+        "listings": NUM_LISTINGS,
+        "applies": NUM_APPLIES
+    }
+
+configure_sizes(resolve_sizes(DEFAULT_PRESET))
+
+# Date ranges for generated datetimes
+USER_START_DATE, USER_END_DATE = datetime(2020, 1, 1), datetime(2023, 12, 31)
+LISTING_START_DATE, LISTING_END_DATE = datetime(2023, 1, 1), datetime(2024, 12, 31)
+APPLY_END_DATE = datetime(2024, 12, 31, 23, 59, 59)
+APPLY_WINDOW = timedelta(days=180)  # Applies arrive within 180 days of publishing
+
+# CSV columns of each generated table
+AUTH_USER_FIELDS = [
+    "id", "password", "last_login", "is_superuser", "username", "first_name",
+    "last_name", "email", "is_staff", "is_active", "date_joined"
+]
+COMPANY_FIELDS = [
+    "name", "logo", "industry", "serivces", "description",
+    "phone", "email", "create_date", "user_id"
+]
+LISTING_FIELDS = [
+    "company_id", "title", "industry", "budget", "duration",
+    "description", "requirement", "publish_date", "is_active"
+]
+APPLY_FIELDS = [
+    "name", "email", "phone", "message",
+    "cv", "apply_date", "listing_id", "user_id"
+]
+
+# Id counters and run history of the fixture in dummy_data/, read by --append
+GENERATION_STATE_FILENAME = 'generation_state.json'
+
+# Fields of each table that later phases read, kept in ColumnStores
+USER_COLUMNS = {"id": "int", "first_name": "category", "last_name": "category", "email": "str", "date_joined": "date"}
+COMPANY_COLUMNS = {"industry": "category"}
+# The experience level is part of the title, so titles are a bounded set too
+LISTING_COLUMNS = {"industry": "category", "title": "category", "publish_date": "date"}
+
+# Characters used for password salts (same alphabet as Django's get_random_string)
+SALT_CHARS = string.ascii_letters + string.digits
+SALT_LENGTH = 22
 
 # Individual user password and company user password
 PASSWORD = {
@@ -39,14 +135,193 @@ PASSWORD = {
     "company": "company123"
 }
 
-# Industry categories for companies and listings
-INDUSTRIES = [value for value in industry_choices]
+# Snapshot of listings/choices.py for workers without the project checkout
+CHOICES_SNAPSHOT = Path(__file__).resolve().parent / 'listings_choices_snapshot.json'
+
+# Industry categories for companies and listings (loaded by configure_choices)
+INDUSTRIES = []
 
 # Budget ranges
-BUDGET_RANGES = [value for value in budget_choices]
+BUDGET_RANGES = []
 
 # Duration options
-DURATIONS = [value for value in duration_choices]
+DURATIONS = []
+
+# Hash passwords with the standalone PBKDF2 implementation instead of Django's make_password
+DJANGO_FREE = False
+_django_ready = False
+
+# Threads per pipeline stage (password hashing, logo downloads, CV rendering); 0 runs them inline
+STAGE_WORKERS = DEFAULT_STAGE_WORKERS
+
+# Processes rendering CV PDFs (set by main); 0 renders them in threads of the CV stage
+CV_PROCESSES = 0
+
+# The run's pipeline stages by name; they stay open across phases until close_stages()
+STAGES = {}
+
+# Manifest entries (size, sha256) of the media files this process wrote, by relative path
+WRITTEN_MEDIA = {}
+
+# Rows handed to a background CSV writer (or the database sink) at a time
+CSV_BATCH_ROWS = 1000
+
+# Set by --stream: rows carry datetimes and bools instead of their CSV spellings
+TYPED_ROWS = False
+
+# How typed booleans are spelled in each CSV (true, false)
+CSV_BOOLEANS = {
+    "auth_user.csv": ("true", "false"),
+    "listings_listing.csv": ("1", "0")
+}
+
+# CV and logo output paths below the project root (directories are created once)
+OUTPUT_PATHS = PathAllocator(BASE_DIR)
+
+# Downloaded logos, keyed by URL, reused by later runs (None disables the cache)
+LOGO_CACHE_DIR = BASE_DIR / '.logo_cache'
+
+# Mixed into the logo colour digest; change it for a different (still stable) palette
+LOGO_PALETTE_SEED = "logos"
+
+# Set by --profile: stage timers and timed wrappers around PROFILED_HELPERS
+PROFILER = None
+
+# Hot helpers timed by --profile, and how to count the bytes each call writes
+PROFILED_HELPERS = [
+    "hash_password", "get_industry_specific_job_title", "get_industry_specific_company_name",
+    "get_industry_specific_skills", "get_industry_specific_services", "get_industry_specific_description",
+    "generate_cv_pdf", "plan_logo", "fetch_logo", "generate_emails", "generate_datetimes", "format_datetimes",
+    "make_unique"
+]
+PROFILED_SIZES = {
+    "generate_cv_pdf": lambda args, result: len(result),
+    "fetch_logo": lambda args, result: os.path.getsize(BASE_DIR / result) if os.path.exists(BASE_DIR / result) else 0
+}
+
+# Archives of earlier runs keyed by a fingerprint of their inputs (see snapshot_cache.py)
+SNAPSHOT_CACHE_DIR = BASE_DIR / '.snapshot_cache'
+
+# Modules whose code or data determines the generated output (part of the snapshot fingerprint)
+GENERATOR_SOURCES = [
+    Path(__file__).resolve().parent / name for name in (
+        'generate_dummy_data.py', 'generate_dummy_data_choices.py', 'industry_mappings.py',
+        'batch_generators.py', 'unique_values.py', 'record_store.py', 'generate_pdf.py', 'password_hashing.py',
+        'sql_dump.py'
+    )
+]
+
+def setup_django():
+    """Setup Django environment (only needed to hash passwords with Django's make_password)"""
+    global _django_ready
+    if _django_ready:
+        return
+    import django
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+    django.setup()
+    _django_ready = True
+
+def django_time_zone():
+    """TIME_ZONE of the Django settings, or None when they cannot be loaded
+    
+    Only the settings module is imported; django.setup() is not needed.
+    """
+    try:
+        from django.conf import settings
+        project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        if project_dir not in sys.path:
+            sys.path.append(project_dir)
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+        return settings.TIME_ZONE
+    except Exception:
+        return None
+
+def load_choices(snapshot_path=None):
+    """Load industry, budget and duration choices
+    
+    listings/choices.py is a plain module, so it is imported without
+    django.setup(). Without the project checkout (or when snapshot_path is
+    given) the choices are read from a JSON snapshot instead.
+    """
+    if snapshot_path is None:
+        try:
+            from listings.choices import industry_choices, budget_choices, duration_choices
+            return {
+                "industries": [value for value in industry_choices],
+                "budget_ranges": [value for value in budget_choices],
+                "durations": [value for value in duration_choices]
+            }
+        except ImportError:
+            snapshot_path = CHOICES_SNAPSHOT
+    
+    if not os.path.exists(snapshot_path):
+        raise FileNotFoundError(
+            f"listings.choices is not importable and no choices snapshot exists at {snapshot_path}. "
+            f"Run 'python generate_dummy_data.py --write-choices-snapshot' in the project checkout first."
+        )
+    with open(snapshot_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def write_choices_snapshot(choices, snapshot_path=CHOICES_SNAPSHOT):
+    """Save the choices so Django-free workers can generate without the project checkout"""
+    with open(snapshot_path, 'w', encoding='utf-8') as f:
+        json.dump(choices, f, indent=2)
+    print(f"Saved choices snapshot to {snapshot_path}")
+
+def configure_choices(choices):
+    """Set the industry, budget and duration choices used by the generators"""
+    global INDUSTRIES, BUDGET_RANGES, DURATIONS
+    INDUSTRIES = list(choices["industries"])
+    BUDGET_RANGES = list(choices["budget_ranges"])
+    DURATIONS = list(choices["durations"])
+
+def current_choices():
+    """Choices currently used by the generators"""
+    return {
+        "industries": INDUSTRIES,
+        "budget_ranges": BUDGET_RANGES,
+        "durations": DURATIONS
+    }
+
+def configure_worker(sizes, choices, django_free, stage_workers, logo_cache_dir, profile, typed_rows):
+    """Give a worker process the same configuration as the main process"""
+    global DJANGO_FREE, STAGE_WORKERS, LOGO_CACHE_DIR, TYPED_ROWS, CV_PROCESSES
+    configure_sizes(sizes)
+    configure_choices(choices)
+    DJANGO_FREE = django_free
+    STAGE_WORKERS = stage_workers
+    LOGO_CACHE_DIR = logo_cache_dir
+    TYPED_ROWS = typed_rows
+    # Shard processes already render in parallel; their CV stages use threads.
+    # Stages of a forked parent are not usable here
+    CV_PROCESSES = 0
+    STAGES.clear()
+    WRITTEN_MEDIA.clear()
+    if profile:
+        # Only helper metrics are collected here; they go back with each shard's result
+        enable_profiling()
+    # The main process already created the date directories
+    prepare_output_dirs(create=False)
+    if not django_free:
+        setup_django()
+
+def enable_profiling(cprofile=False, memory=False):
+    """Start collecting stage and helper metrics (--profile)"""
+    global PROFILER
+    PROFILER = Profiler(cprofile=cprofile, memory=memory)
+    PROFILER.instrument(globals(), PROFILED_HELPERS, PROFILED_SIZES)
+
+def profile_stage(name):
+    """Time a stage of main() when profiling, otherwise do nothing"""
+    return PROFILER.stage(name) if PROFILER is not None else contextlib.nullcontext()
+
+def prepare_output_dirs(create=True):
+    """Create the cv/ and photos/ date trees up front for runs large enough to fill them"""
+    return (
+        OUTPUT_PATHS.prepare("photos", USER_START_DATE, USER_END_DATE, NUM_COMPANIES, create)
+        + OUTPUT_PATHS.prepare("cv", LISTING_START_DATE, APPLY_END_DATE, NUM_APPLIES, create)
+    )
 
 def categorize_industry(industry_name):
     """Categorize an industry into one of the predefined categories"""
@@ -219,14 +494,11 @@ def generate_phone():
 
 def generate_email(first_name, last_name, company=False):
     """Generate a random email address"""
-    domains = ["gmail.com", "yahoo.com", "hotmail.com", "outlook.com"]
-    company_domains = ["tech.com", "solutions.com", "corp.com", "inc.com", "digital.com"]
-    
     if company:
-        domain = random.choice(company_domains)
+        domain = random.choice(COMPANY_EMAIL_DOMAINS)
         return f"{first_name.lower()}.{last_name.lower()}@{domain}"
     else:
-        domain = random.choice(domains)
+        domain = random.choice(EMAIL_DOMAINS)
         variations = [
             f"{first_name.lower()}.{last_name.lower()}",
             f"{first_name.lower()}{last_name.lower()}",
@@ -253,69 +525,204 @@ def generate_datetime(start_date, end_date):
         random_seconds
     )
 
+def row_datetimes(epoch_seconds):
+    """Values of a datetime column: CSV strings, or naive datetimes for typed rows"""
+    if TYPED_ROWS:
+        return to_datetimes(epoch_seconds)
+    return format_datetimes(epoch_seconds)
+
+def row_bool(value, true="true", false="false"):
+    """Value of a boolean column: its CSV spelling, or the bool itself for typed rows"""
+    if TYPED_ROWS:
+        return value
+    return true if value else false
+
+def date_parts(value):
+    """(year, month, day) of a datetime column value"""
+    if isinstance(value, str):
+        return int(value[0:4]), int(value[5:7]), int(value[8:10])
+    return value.year, value.month, value.day
+
+def csv_row_formatter(filename):
+    """Spell the datetimes and bools of a typed row the way the CSV files do (None when rows are CSV-ready)"""
+    if not TYPED_ROWS:
+        return None
+    true, false = CSV_BOOLEANS.get(filename, ("true", "false"))
+    
+    def format_row(row):
+        formatted = {}
+        for field, value in row.items():
+            if isinstance(value, datetime):
+                value = value.strftime(DATETIME_FORMAT)
+            elif isinstance(value, bool):
+                value = true if value else false
+            formatted[field] = value
+        return formatted
+    return format_row
+
 def generate_message():
     """Generate application message"""
     return random.choice(MESSAGES)
 
-def generate_auth_user_data():
-    """Generate auth_user data with properly hashed passwords"""
+def generate_cv_pdf(applicant_info, output_path, creation_date=None):
+    """Generate a CV PDF (fpdf is imported on first use to keep startup fast); returns the bytes written
+    
+    output_path comes from OUTPUT_PATHS, so its directory already exists.
+    """
+    from generate_pdf import render_cv_pdf
+    data = render_cv_pdf(applicant_info, creation_date)
+    with open(output_path, 'wb') as f:
+        f.write(data)
+    return data
+
+def record_media(relative_path, data):
+    """Remember the manifest entry of a media file from the bytes written to it"""
+    WRITTEN_MEDIA[relative_path] = media_entry(relative_path, data)
+
+def export_written_media():
+    """Manifest entries recorded so far, for shipping from worker processes"""
+    exported = dict(WRITTEN_MEDIA)
+    WRITTEN_MEDIA.clear()
+    return exported
+
+def render_cv(applicant_info, output_path, cv_path, fallback_path, index, apply_date):
+    """Render one applicant's CV in the CV stage; returns the path for the apply row
+    
+    The PDF is dated with the apply date, so it only depends on the seed.
+    A CV that fails to render is recorded under fallback_path instead.
+    """
+    if isinstance(apply_date, str):
+        apply_date = datetime.strptime(apply_date, DATETIME_FORMAT)
+    try:
+        record_media(cv_path, generate_cv_pdf(applicant_info, output_path, apply_date))
+    except Exception as e:
+        print(f"Error generating CV for applicant {index + 1}: {e}")
+        return fallback_path
+    if (index + 1) % 100 == 0:
+        print(f"  Generated {index + 1} CVs...")
+    return cv_path
+
+def render_cv_in_process(*args):
+    """render_cv in a CV process; the manifest entry and helper metrics go back with the path"""
+    return (render_cv(*args), export_written_media(),
+            PROFILER.export_helpers() if PROFILER is not None else None)
+
+def collect_cv_result(result):
+    """Merge a CV process's manifest entry and helper metrics and return the CV path"""
+    cv_path, written_media, helper_metrics = result
+    WRITTEN_MEDIA.update(written_media)
+    if helper_metrics:
+        PROFILER.merge_helpers(helper_metrics)
+    return cv_path
+
+def configure_cv_process(profile):
+    """Start a CV process, timing generate_cv_pdf when profiling"""
+    if profile:
+        enable_profiling()
+
+def pipeline_stage(name, function, workers=None, **options):
+    """The run's stage called name, started on first use
+    
+    Stages stay open across phases, so passwords are still being hashed while
+    companies and applies are generated; close_stages() waits for them.
+    """
+    if name not in STAGES:
+        STAGES[name] = Stage(name, function, STAGE_WORKERS if workers is None else workers, **options)
+    return STAGES[name]
+
+def cv_stage():
+    """The CV stage: CV_PROCESSES processes (PDF rendering holds the GIL), otherwise threads"""
+    if CV_PROCESSES > 0:
+        return pipeline_stage("cvs", render_cv_in_process, CV_PROCESSES, processes=True,
+                              initializer=configure_cv_process, initargs=(PROFILER is not None,),
+                              unpack=collect_cv_result)
+    return pipeline_stage("cvs", render_cv)
+
+def close_stages():
+    """Wait for every pipeline stage of the run to finish its queued items"""
+    while STAGES:
+        STAGES.popitem()[1].close()
+
+def generate_salt():
+    """Generate a password salt from the seeded random stream
+    
+    make_password would otherwise draw the salt from the OS, which makes the
+    password column differ on every run even with a fixed --seed.
+    """
+    return ''.join(random.choice(SALT_CHARS) for _ in range(SALT_LENGTH))
+
+def hash_password(password, salt=None):
+    """Hash a password with Django's make_password, or standalone in Django-free mode
+    
+    Both produce the same pbkdf2_sha256 hash for the same salt. Pass a salt
+    drawn beforehand when hashing outside the thread that owns the random stream.
+    """
+    if salt is None:
+        salt = generate_salt()
+    if DJANGO_FREE:
+        return password_hashing.make_password(password, salt)
+    
+    setup_django()
+    from django.contrib.auth.hashers import make_password
+    return make_password(password, salt=salt)
+
+def generate_user_batch(index_range, username_prefix, id_offset, password, company=False):
+    """Generate one kind of user, drawing names, emails and datetimes in batches"""
+    rng = make_rng()
+    n = len(index_range)
+    first_names = choose_batch(FIRST_NAMES, n, rng)
+    last_names = choose_batch(LAST_NAMES, n, rng)
+    emails = generate_emails(first_names, last_names, company=company, rng=rng)
+    last_logins = row_datetimes(generate_datetimes(n, USER_START_DATE, USER_END_DATE, rng))
+    dates_joined = row_datetimes(generate_datetimes(n, USER_START_DATE, USER_END_DATE, rng))
+    
+    # Set up Django once here rather than concurrently from the password threads
+    if not DJANGO_FREE:
+        setup_django()
+    
+    users = []
+    # Hash passwords using Django's make_password (or its standalone equivalent) in the
+    # password stage; salts are drawn here so the output only depends on the seed.
+    # The password field holds the stage's future until the row is written
+    passwords = pipeline_stage("passwords", hash_password)
+    for offset, i in enumerate(index_range):
+        users.append({
+            "id": id_offset + i + 1,  # Company users start from 1, individual users continue after them
+            "password": passwords.submit(password, generate_salt()),
+            "last_login": last_logins[offset],
+            "is_superuser": row_bool(False),
+            "username": f"{username_prefix}_{i+1}",
+            "first_name": first_names[offset],
+            "last_name": last_names[offset],
+            "email": emails[offset],
+            "is_staff": row_bool(False),
+            "is_active": row_bool(True),
+            "date_joined": dates_joined[offset]
+        })
+    return users
+
+def generate_auth_user_data(company_range=None, individual_range=None, company_id_offset=0, individual_id_offset=None):
+    """Generate auth_user data with properly hashed passwords
+    
+    company_range and individual_range select which users to generate (by
+    index), so a shard can produce just its slice of the id space. User ids
+    are index + offset + 1; individual users follow the company users unless
+    individual_id_offset says otherwise (--append).
+    """
+    if company_range is None:
+        company_range = range(NUM_COMPANY_USERS)
+    if individual_range is None:
+        individual_range = range(NUM_INDIVIDUAL_USERS)
+    if individual_id_offset is None:
+        individual_id_offset = NUM_COMPANY_USERS
+    
     data = []
     
     # Store generated user data for later reference
-    company_users = []
-    individual_users = []
-    
-    # Generate company users
-    for i in range(NUM_COMPANY_USERS):
-        first_name = random.choice(FIRST_NAMES)
-        last_name = random.choice(LAST_NAMES)
-        username = f"company_user_{i+1}"
-        email = generate_email(first_name, last_name, company=True)
-        
-        # Hash password using Django's make_password
-        hashed_password = make_password(PASSWORD["company"])
-        
-        user = {
-            "id": i + 1,  # User ID starting from 1
-            "password": hashed_password,
-            "last_login": generate_datetime(datetime(2020, 1, 1), datetime(2023, 12, 31)).strftime("%Y-%m-%d %H:%M:%S"),
-            "is_superuser": "false",
-            "username": username,
-            "first_name": first_name,
-            "last_name": last_name,
-            "email": email,
-            "is_staff": "false",
-            "is_active": "true",
-            "date_joined": generate_datetime(datetime(2020, 1, 1), datetime(2023, 12, 31)).strftime("%Y-%m-%d %H:%M:%S")
-        }
-        data.append(user)
-        company_users.append(user)
-    
-    # Generate individual users
-    for i in range(NUM_INDIVIDUAL_USERS):
-        first_name = random.choice(FIRST_NAMES)
-        last_name = random.choice(LAST_NAMES)
-        username = f"user_{i+1}"
-        email = generate_email(first_name, last_name)
-        
-        # Hash password using Django's make_password
-        hashed_password = make_password(PASSWORD['user'])
-        
-        user = {
-            "id": NUM_COMPANY_USERS + i + 1,  # Continue IDs after company users
-            "password": hashed_password, 
-            "last_login": generate_datetime(datetime(2020, 1, 1), datetime(2023, 12, 31)).strftime("%Y-%m-%d %H:%M:%S"),
-            "is_superuser": "false",
-            "username": username,
-            "first_name": first_name,
-            "last_name": last_name,
-            "email": email,
-            "is_staff": "false",
-            "is_active": "true",
-            "date_joined": generate_datetime(datetime(2020, 1, 1), datetime(2023, 12, 31)).strftime("%Y-%m-%d %H:%M:%S")
-        }
-        data.append(user)
-        individual_users.append(user)
+    company_users = generate_user_batch(company_range, "company_user", company_id_offset, PASSWORD["company"], company=True)
+    individual_users = generate_user_batch(individual_range, "user", individual_id_offset, PASSWORD["user"])
+    data.extend(company_users)
+    data.extend(individual_users)
     
     return data, company_users, individual_users
 
@@ -325,24 +732,31 @@ def hsl_to_hex(h, s, l):
     r, g, b = colorsys.hls_to_rgb(h/360, l/100, s/100)
     return f"#{int(r*255):02x}{int(g*255):02x}{int(b*255):02x}".upper()  
 
-def download_logo_from_placehold(company_name, company_id, create_date):
-    """Download and save logo from placehold.co based on company name"""
-    import urllib.request
-    import urllib.error
-    
-    # Generate hash from company name
-    name_hash = hash(company_name) % 360  # 0-359 for hue
+def logo_colors(company_name, company_id, palette_seed=None):
+    """Derive logo hue, saturation, lightness and text style from a digest of the company
     
+    Unlike hash() (randomized per process) and random draws, the digest gives
+    the same colours for the same company on every run, so logos can be cached.
+    """
+    if palette_seed is None:
+        palette_seed = LOGO_PALETTE_SEED
+    digest = hashlib.sha256(f"{palette_seed}:{company_name}:{company_id}".encode('utf-8')).digest()
+    hue = int.from_bytes(digest[0:2], 'big') % 360  # 0-359 for hue
+    saturation = 40 + digest[2] % 41  # 40-80
+    lightness = 30 + digest[3] % 31  # 30-60
+    complementary = digest[4] % 2 == 0
+    return hue, saturation, lightness, complementary
+
+def plan_logo(company_name, company_id, create_date):
+    """Pick the colours, URL and paths of a company logo"""
     # Use HSL color model for consistent schemes
     # Background: Main color
-    hue = name_hash
-    saturation = random.randint(40, 80)
-    lightness = random.randint(30, 60)
+    hue, saturation, lightness, complementary = logo_colors(company_name, company_id)
     
     bg_color = hsl_to_hex(hue, saturation, lightness)
     
     # Text: Complementary or monochromatic
-    if random.choice([True, False]):
+    if complementary:
         # Complementary color (opposite on color wheel)
         text_hue = (hue + 180) % 360
         text_color = hsl_to_hex(text_hue, saturation, lightness)
@@ -380,39 +794,86 @@ def download_logo_from_placehold(company_name, company_id, create_date):
     # Create logo filename
     logo_filename = f"logo_{company_name.lower().replace(' ', '_')}_{company_id}.png"
     logo_relative_path = f"photos/{logo_year}/{logo_month:02d}/{logo_day:02d}/{logo_filename}"
+    fallback_path = f"photos/{logo_year}/{logo_month:02d}/{logo_day:02d}/logo_{company_id}.png"
+    return logo_url, logo_relative_path, fallback_path
+
+def logo_cache_path(logo_url):
+    """Location of a logo in the persistent cache, or None when caching is off"""
+    if LOGO_CACHE_DIR is None:
+        return None
+    return Path(LOGO_CACHE_DIR) / f"{hashlib.sha256(logo_url.encode('utf-8')).hexdigest()}.png"
+
+def fetch_logo(company_name, logo_url, logo_relative_path, fallback_path):
+    """Download a planned logo; returns the path to store in the CSV (no random draws, safe in a thread)
+    
+    A logo already in the cache (same URL, so same colours and initials) is
+    copied instead of downloaded. The manifest entry is taken from the bytes
+    written to logo_relative_path.
+    """
+    import urllib.request
+    import urllib.error
+    
     # Save to project root photos directory instead of dummy_data_generation subdirectory
-    project_root = Path(__file__).parent.parent
-    logo_full_path = project_root / logo_relative_path
+    # (the allocator creates the date directory once)
+    logo_full_path = OUTPUT_PATHS.allocate(logo_relative_path)
+    cache_path = logo_cache_path(logo_url)
     
-    # Ensure directory exists
-    logo_dir = os.path.dirname(logo_full_path)
-    os.makedirs(logo_dir, exist_ok=True)
+    if cache_path is not None and cache_path.exists():
+        data = cache_path.read_bytes()
+        with open(logo_full_path, 'wb') as f:
+            f.write(data)
+        record_media(logo_relative_path, data)
+        print(f"  Reused cached logo for {company_name}: {logo_relative_path}")
+        return logo_relative_path
     
     # Download and save the logo
     try:
-        urllib.request.urlretrieve(logo_url, logo_full_path)
+        with urllib.request.urlopen(logo_url) as response:
+            data = response.read()
+        if cache_path is not None:
+            # Save into the cache atomically, other workers may read it
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            download_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(download_path, 'wb') as f:
+                f.write(data)
+            os.replace(download_path, cache_path)
+        with open(logo_full_path, 'wb') as f:
+            f.write(data)
+        record_media(logo_relative_path, data)
         print(f"  Downloaded logo for {company_name}: {logo_relative_path}")
         return logo_relative_path
     except urllib.error.URLError as e:
         print(f"Error downloading logo for {company_name}: {e}")
         # Fallback to placeholder path
-        return f"photos/{logo_year}/{logo_month:02d}/{logo_day:02d}/logo_{company_id}.png"
+        return fallback_path
     except Exception as e:
         print(f"Error saving logo for {company_name}: {e}")
         # Fallback to placeholder path
-        return f"photos/{logo_year}/{logo_month:02d}/{logo_day:02d}/logo_{company_id}.png"
+        return fallback_path
+
+def download_logo_from_placehold(company_name, company_id, create_date):
+    """Download and save logo from placehold.co based on company name"""
+    return fetch_logo(company_name, *plan_logo(company_name, company_id, create_date))
 
 def generate_logo_from_name(company_name, company_id, create_date):
     """Generate logo with colors based on company name - downloads and saves locally"""
     return download_logo_from_placehold(company_name, company_id, create_date)
 
 def generate_company_data(company_users):
-    """Generate company data with downloaded logos - uses matching user data and aligns company name with industry"""
+    """Generate company data with downloaded logos - uses matching user data and aligns company name with industry
+    
+    company_users is a ColumnStore with USER_COLUMNS.
+    """
     data = []
     
     print("Generating company logos...")
+    phones = generate_phones(len(company_users), make_rng())
+    dates_joined = company_users.column("date_joined")
     
-    for i, user in enumerate(company_users):
+    # Logos are downloaded by the logo stage while the remaining rows (and phases) are generated;
+    # the logo field holds the stage's future until the row is written
+    logos = pipeline_stage("logos", fetch_logo)
+    for i, user in enumerate(company_users.rows()):
         user_id = user["id"]
         
         # First choose an industry
@@ -429,8 +890,8 @@ def generate_company_data(company_users):
         # Generate create date for the company (use user's date_joined)
         create_date_str = user["date_joined"]
         
-        # Generate and download logo
-        logo_path = generate_logo_from_name(company_name, user_id, create_date_str)
+        # Plan the logo here, download it in the logo stage
+        logo_path = logos.submit(company_name, *plan_logo(company_name, user_id, create_date_str))
         
         # Get industry-specific services
         services = get_industry_specific_services(industry)
@@ -444,35 +905,40 @@ def generate_company_data(company_users):
             "industry": industry,
             "serivces": services,
             "description": description,
-            "phone": generate_phone(),
+            "phone": phones[i],
             "email": email,  # Use the same email as the user
-            "create_date": create_date_str,
+            "create_date": dates_joined.datetime(i) if TYPED_ROWS else create_date_str,
             "user_id": user_id
         }
         data.append(company)
-        
-        # Show progress for logos
-        if (i + 1) % 10 == 0:
-            print(f"  Generated {i + 1} logos...")
     
-    print(f"Completed generating {NUM_COMPANIES} company logos")
+    print(f"Queued {len(data)} company logos")
     return data
 
-def generate_listing_data(company_data):
-    """Generate listing data that aligns with company industry"""
+def generate_listing_data(companies, listing_range=None):
+    """Generate listing data that aligns with company industry
+    
+    companies is a ColumnStore with COMPANY_COLUMNS.
+    """
+    if listing_range is None:
+        listing_range = range(NUM_LISTINGS)
+    
     data = []
     
-    for i in range(NUM_LISTINGS):
+    # Draw companies and publish datetimes (with randomized time) for the whole range at once
+    rng = make_rng()
+    company_indices = random_integers(0, len(companies) - 1, len(listing_range), rng)
+    company_industries = companies.column("industry")
+    publish_dates = row_datetimes(generate_datetimes(len(listing_range), LISTING_START_DATE, LISTING_END_DATE, rng))
+    
+    for offset, i in enumerate(listing_range):
         # Pick a company and get its industry
-        company = random.choice(company_data)
-        company_id = company_data.index(company) + 1
-        company_industry = company["industry"]
-        
-        # Generate random publish datetime with randomized time
-        publish_datetime = generate_datetime(datetime(2023, 1, 1), datetime(2024, 12, 31))
+        company_index = company_indices[offset]
+        company_id = company_index + 1
+        company_industry = company_industries[company_index]
         
         # Ensure is_active is boolean
-        is_active = "1" if random.random() > 0.2 else "0"  # 80% active
+        is_active = row_bool(random.random() > 0.2, "1", "0")  # 80% active
         
         # Get industry-specific job title
         job_title = get_industry_specific_job_title(company_industry)
@@ -495,34 +961,63 @@ def generate_listing_data(company_data):
             "duration": random.choice(DURATIONS),
             "description": description,
             "requirement": ", ".join(skills),
-            "publish_date": publish_datetime.strftime("%Y-%m-%d %H:%M:%S"),
+            "publish_date": publish_dates[offset],
             "is_active": is_active
         }
         data.append(listing)
     
     return data
 
-def generate_apply_data(individual_users, listing_data):
-    """Generate apply data with actual PDF CVs - uses matching user data"""
+def generate_apply_data(individual_users, listings, apply_range=None):
+    """Generate apply data with actual PDF CVs - uses matching user data
+    
+    individual_users is a ColumnStore with USER_COLUMNS and listings one with
+    LISTING_COLUMNS.
+    """
+    if apply_range is None:
+        apply_range = range(NUM_APPLIES)
+    
     data = []
     
     print("Generating CV PDFs for applicants...")
     
-    # Create a copy of individual users to track which ones have applied
-    available_users = individual_users.copy()
+    user_ids = individual_users.column("id")
+    first_names = individual_users.column("first_name")
+    last_names = individual_users.column("last_name")
+    emails = individual_users.column("email")
+    listing_industries = listings.column("industry")
+    listing_titles = listings.column("title")
+    publish_dates = listings.column("publish_date")
+    
+    # Track which individual users (by index) have applied
+    available_users = list(range(len(individual_users)))
     applied_users = []
     
-    for i in range(NUM_APPLIES):
+    # Pick listings, apply datetimes and phones for the whole range at once.
+    # Apply dates fall after the listing's publish date (with randomized time)
+    rng = make_rng()
+    n = len(apply_range)
+    listing_indices = random_integers(0, len(listings) - 1, n, rng)
+    start_dates = [publish_dates.datetime(index) for index in listing_indices]
+    end_dates = [min(APPLY_END_DATE, start_date + APPLY_WINDOW) for start_date in start_dates]
+    apply_dates = row_datetimes(generate_datetimes(n, start_dates, end_dates, rng))
+    cv_phones = generate_phones(n, rng)
+    phones = generate_phones(n, rng)
+    
+    # CVs are rendered by the CV stage while the remaining rows are generated; the cv field
+    # holds the stage's future (resolving to the CV path, or its fallback) until the row is written
+    cvs = cv_stage()
+    # Applies of one user on one day share a CV path; only the first of them renders it
+    cv_renders = {}
+    
+    for offset, i in enumerate(apply_range):
         # Pick a listing
-        listing = random.choice(listing_data)
-        listing_id = listing_data.index(listing) + 1
+        listing_index = listing_indices[offset]
+        listing_id = listing_index + 1
         
         # Get listing industry for CV alignment
-        listing_industry = listing["industry"]
-        listing_job_title = listing["title"]
-        
-        # Get listing to ensure apply date is after publish date
-        publish_datetime = datetime.strptime(listing["publish_date"], "%Y-%m-%d %H:%M:%S")
+        listing_industry = listing_industries[listing_index]
+        listing_job_title = listing_titles[listing_index]
         
         # Select a user - prioritize users who haven't applied yet
         if available_users and random.random() > 0.3:  # 70% chance to use new user
@@ -531,34 +1026,26 @@ def generate_apply_data(individual_users, listing_data):
             applied_users.append(user)
         else:
             # Use a user who already applied (reuse)
-            user = random.choice(applied_users if applied_users else individual_users)
+            user = random.choice(applied_users if applied_users else range(len(individual_users)))
         
-        user_id = user["id"]
+        user_id = user_ids[user]
         
         # Use the name and email from the user
-        first_name = user["first_name"]
-        last_name = user["last_name"]
+        first_name = first_names[user]
+        last_name = last_names[user]
         full_name = f"{first_name} {last_name}"
-        email = user["email"]
-        
-        # Generate apply datetime after listing publish date (with randomized time)
-        max_apply_date = min(datetime(2024, 12, 31, 23, 59, 59), publish_datetime + timedelta(days=180))
-        apply_datetime = generate_datetime(publish_datetime, max_apply_date)
+        email = emails[user]
         
         # Generate CV path based on apply date (matching Django's upload_to pattern)
-        cv_year = apply_datetime.year
-        cv_month = apply_datetime.month
-        cv_day = apply_datetime.day
+        apply_date = apply_dates[offset]
+        cv_year, cv_month, cv_day = date_parts(apply_date)
         
         # Create CV filename with applicant name and ID
         cv_filename = f"cv_{full_name.lower().replace(' ', '_')}_{user_id}.pdf"
         cv_relative_path = f"cv/{cv_year}/{cv_month:02d}/{cv_day:02d}/{cv_filename}"
         # Save to project root cv directory instead of dummy_data_generation subdirectory
-        project_root = Path(__file__).parent.parent
-        cv_full_path = project_root / cv_relative_path
-        
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(cv_full_path), exist_ok=True)
+        # (the allocator creates the date directory once)
+        cv_full_path = OUTPUT_PATHS.allocate(cv_relative_path)
         
         # Get industry-specific skills for the CV
         cv_skills = get_industry_specific_skills(listing_industry, random.randint(5, 10))
@@ -572,7 +1059,7 @@ def generate_apply_data(individual_users, listing_data):
         applicant_info = {
             'name': full_name,
             'email': email,  # Use the same email as the user
-            'phone': generate_phone(),
+            'phone': cv_phones[offset],
             'skills': ", ".join(cv_skills),
             'experience_level': experience_level,
             'job_title': listing_job_title,  # Use the listing job title
@@ -581,32 +1068,99 @@ def generate_apply_data(individual_users, listing_data):
         }
         
         # Generate actual PDF CV
-        try:
-            generate_cv_pdf(applicant_info, cv_full_path)
-            if (i + 1) % 100 == 0:
-                print(f"  Generated {i + 1} CVs...")
-        except Exception as e:
-            print(f"Error generating CV for applicant {i+1}: {e}")
-            # Fallback to placeholder path if CV generation fails
-            cv_relative_path = f"cv/{cv_year}/{cv_month:02d}/{cv_day:02d}/cv_{user_id}.pdf"
-            # Also update the full path for the fallback
-            cv_full_path = project_root / cv_relative_path
+        # Fallback to placeholder path if CV generation fails
+        fallback_path = f"cv/{cv_year}/{cv_month:02d}/{cv_day:02d}/cv_{user_id}.pdf"
+        if cv_relative_path not in cv_renders:
+            cv_renders[cv_relative_path] = cvs.submit(applicant_info, cv_full_path, cv_relative_path, fallback_path, i,
+                                                      apply_date)
         
         apply_record = {
             "listing_id": listing_id,
             "name": full_name,  # Use the same name as the user
             "email": email,  # Use the same email as the user
-            "phone": generate_phone(),
+            "phone": phones[offset],
             "message": message,
-            "cv": cv_relative_path,
-            "apply_date": apply_datetime.strftime("%Y-%m-%d %H:%M:%S"),
+            "cv": cv_renders[cv_relative_path],
+            "apply_date": apply_date,
             "user_id": user_id
         }
         data.append(apply_record)
     
-    print(f"Completed generating {NUM_APPLIES} CV PDFs")
+    print(f"Queued {len(data)} CV PDFs")
     return data
 
+def derive_seed(seed, phase, shard_index):
+    """Derive an independent, stable seed for one shard of one generation phase"""
+    digest = hashlib.sha256(f"{seed}:{phase}:{shard_index}".encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big')
+
+def shard_ranges(total, num_shards, start=0):
+    """Split range(start, start + total) into num_shards contiguous index ranges"""
+    return [range(start + total * k // num_shards, start + total * (k + 1) // num_shards) for k in range(num_shards)]
+
+def generate_user_shard(seed, shard_index, company_range, individual_range, company_id_offset, individual_id_offset):
+    """Generate one shard of company and individual users from its own RNG stream"""
+    random.seed(derive_seed(seed, 'users', shard_index))
+    _, company_users, individual_users = generate_auth_user_data(
+        company_range, individual_range, company_id_offset, individual_id_offset
+    )
+    return company_users, individual_users
+
+def generate_company_shard(seed, shard_index, company_users):
+    """Generate the companies (and logos) of one shard of company users"""
+    random.seed(derive_seed(seed, 'companies', shard_index))
+    return generate_company_data(company_users)
+
+def generate_listing_shard(seed, shard_index, companies, listing_range):
+    """Generate one shard of listings"""
+    random.seed(derive_seed(seed, 'listings', shard_index))
+    return generate_listing_data(companies, listing_range)
+
+def generate_apply_shard(seed, shard_index, individual_users, listings, apply_range):
+    """Generate one shard of applies (and CVs) from the shard's own pool of users"""
+    random.seed(derive_seed(seed, 'applies', shard_index))
+    return generate_apply_data(individual_users, listings, apply_range)
+
+def check_shard_rows(table, parts, expected):
+    """Make sure the shards of a phase produced exactly the configured number of rows"""
+    produced = sum(len(part) for part in parts)
+    if produced != expected:
+        raise RuntimeError(f"{table}: shards produced {produced} rows, expected {expected}")
+
+def run_worker_shard(shard_function, *args):
+    """Run a shard in a worker process and hand its finished rows, media entries and helper metrics back
+    
+    Futures cannot leave the process, so the worker waits for its stages here.
+    """
+    result = shard_function(*args)
+    close_stages()
+    for rows in (result if isinstance(result, tuple) else (result,)):
+        resolve_rows(rows)
+    return result, export_written_media(), PROFILER.export_helpers() if PROFILER is not None else None
+
+def run_shards(shard_function, shard_args, workers):
+    """Run the shards of one phase, in worker processes when workers > 1
+    
+    Results are returned in shard order whatever order the shards finish in,
+    so the output only depends on the seed and the shard count.
+    """
+    if workers <= 1 or len(shard_args) <= 1:
+        return [shard_function(*args) for args in shard_args]
+    
+    # Workers start from the same sizes, choices and password hasher as this process
+    with ProcessPoolExecutor(max_workers=min(workers, len(shard_args)), initializer=configure_worker,
+                             initargs=(current_sizes(), current_choices(), DJANGO_FREE, STAGE_WORKERS, LOGO_CACHE_DIR,
+                                       PROFILER is not None, TYPED_ROWS)) as executor:
+        futures = [executor.submit(run_worker_shard, shard_function, *args) for args in shard_args]
+        results = []
+        for future in futures:
+            result, written_media, helper_metrics = future.result()
+            WRITTEN_MEDIA.update(written_media)
+            if helper_metrics is not None:
+                PROFILER.merge_helpers(helper_metrics)
+            results.append(result)
+        return results
+
 def write_csv(filename, data, fieldnames):
     """Write data to CSV file"""
     # Get the directory where this script is located
@@ -628,44 +1182,424 @@ def write_csv(filename, data, fieldnames):
     
     print(f"Generated {len(data)} records in {filepath}")
 
-def main():
+def calibrate_costs(samples=3):
+    """Measure per-record costs of password hashing and CV rendering on this machine"""
+    costs = {table: dict(cost) for table, cost in RECORD_COSTS.items()}
+    
+    start = time.perf_counter()
+    for _ in range(samples):
+        hash_password(PASSWORD["user"])
+    costs["auth_user"]["seconds"] = (time.perf_counter() - start) / samples
+    
+    applicant_info = {
+        'name': 'Calibration Applicant',
+        'email': 'calibration@example.com',
+        'phone': generate_phone(),
+        'skills': ", ".join(random.sample(SKILLS, 8)),
+        'experience_level': random.choice(EXPERIENCE_LEVELS),
+        'job_title': random.choice(JOB_TITLES),
+        'description': random.choice(DESCRIPTIONS),
+        'message': generate_message()
+    }
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        start = time.perf_counter()
+        sizes = []
+        for i in range(samples * 5):
+            output_path = os.path.join(tmp_dir, f"cv_{i}.pdf")
+            generate_cv_pdf(applicant_info, output_path)
+            sizes.append(os.path.getsize(output_path))
+        costs["applies_apply"]["seconds"] = (time.perf_counter() - start) / len(sizes)
+        costs["applies_apply"]["media_bytes"] = sum(sizes) / len(sizes)
+    
+    print(f"Calibrated: password hash {costs['auth_user']['seconds']:.3f}s, "
+          f"CV PDF {costs['applies_apply']['seconds']:.4f}s / {costs['applies_apply']['media_bytes']:.0f} bytes")
+    return costs
+
+def open_csv_sink(filename, fieldnames, append=False, format_row=None):
+    """Start a background writer for a CSV file in dummy_data/"""
+    dummy_dir = Path(__file__).parent.parent / 'dummy_data'
+    dummy_dir.mkdir(exist_ok=True)
+    return CsvSink(dummy_dir / filename, fieldnames, append=append, format_row=format_row)
+
+def write_table(filename, parts, fieldnames, part_files=False, append=False, database=None, csv_output=True,
+                sql=None):
+    """Write a table merged into one CSV file, or as one part file per shard
+    
+    Part files are numbered so that concatenating them in name order gives
+    the merged file (rows stay in id order). Rows are written by background
+    CsvSinks so the next phase can start right away; close the returned
+    sinks (finish_tables) before reading the files. With append=True the
+    rows are added to the end of the existing merged file.
+    
+    With a DatabaseSink (--stream) the rows are also queued for insertion
+    into the table of the same name; csv_output=False skips the CSV files.
+    With an SqlDump (--sql) the rows also go to the table's load file.
+    """
+    table = filename[:-len('.csv')]
+    if database is not None:
+        for rows in parts:
+            for start in range(0, len(rows), CSV_BATCH_ROWS):
+                database.put(table, rows[start:start + CSV_BATCH_ROWS])
+    
+    files = []
+    if csv_output and part_files:
+        files = [(open_csv_sink(f"{table}.part-{part_index:04d}.csv", fieldnames, append, csv_row_formatter(filename)),
+                  [rows]) for part_index, rows in enumerate(parts)]
+    elif csv_output:
+        files = [(open_csv_sink(filename, fieldnames, append, csv_row_formatter(filename)), parts)]
+    if sql is not None:
+        files.append((sql.open_table(table), parts))
+    
+    sinks = []
+    for sink, file_parts in files:
+        for rows in file_parts:
+            for start in range(0, len(rows), CSV_BATCH_ROWS):
+                sink.put(rows[start:start + CSV_BATCH_ROWS])
+        sinks.append(sink)
+    return sinks
+
+def read_table(filename, fieldnames):
+    """Stream the rows of an existing CSV in dummy_data/, checking its columns"""
+    filepath = project_root / 'dummy_data' / filename
+    with open(filepath, 'r', encoding='utf-8') as csvfile:
+        reader = csv.DictReader(csvfile)
+        if reader.fieldnames != fieldnames:
+            raise ValueError(f"{filepath} has columns {reader.fieldnames}, expected {fieldnames}")
+        yield from reader
+
+def empty_existing_data():
+    """Counters and pools for a run that starts from nothing"""
+    return {
+        "company_users": 0,
+        "max_user_id": 0,
+        "emails": [],
+        "individual_users": ColumnStore(USER_COLUMNS),
+        "company_names": [],
+        "companies": ColumnStore(COMPANY_COLUMNS),
+        "listings": ColumnStore(LISTING_COLUMNS),
+        "applies": 0
+    }
+
+def load_existing_data():
+    """Recover id counters and the pools later phases read from the CSVs in dummy_data/ (--append)"""
+    existing = empty_existing_data()
+    for row in read_table('auth_user.csv', AUTH_USER_FIELDS):
+        existing["max_user_id"] = max(existing["max_user_id"], int(row["id"]))
+        existing["emails"].append(row["email"])
+        if row["username"].startswith("company_user_"):
+            existing["company_users"] += 1
+        else:
+            existing["individual_users"].append(row)
+    for row in read_table('companies_company.csv', COMPANY_FIELDS):
+        existing["company_names"].append(row["name"])
+        existing["companies"].append(row)
+    existing["listings"].extend(read_table('listings_listing.csv', LISTING_FIELDS))
+    existing["applies"] = sum(1 for _ in read_table('applies_apply.csv', APPLY_FIELDS))
+    return existing
+
+def existing_counts(existing):
+    """Rows per table of a fixture"""
+    return {
+        "company_users": existing["company_users"],
+        "individual_users": len(existing["individual_users"]),
+        "listings": len(existing["listings"]),
+        "applies": existing["applies"]
+    }
+
+def load_generation_state():
+    """Read the state saved next to the CSVs by the last run, or None"""
+    state_path = project_root / 'dummy_data' / GENERATION_STATE_FILENAME
+    if not state_path.exists():
+        return None
+    with open(state_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_generation_state(state, counts, run):
+    """Record the table sizes and the runs (seed, shards, sizes) that produced the fixture
+
+    state is the state of the fixture appended to; a fresh run (state None) starts the history.
+    """
+    state = {
+        "counts": counts,
+        "runs": (state or {}).get("runs", []) + [run]
+    }
+    with open(project_root / 'dummy_data' / GENERATION_STATE_FILENAME, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2)
+
+def password_hasher_identity():
+    """What the password hashes depend on besides the salt: the hasher, its work factor and, with Django, its version"""
+    if DJANGO_FREE:
+        return [password_hashing.ALGORITHM, password_hashing.PBKDF2_ITERATIONS]
+    
+    setup_django()
+    import django
+    from django.contrib.auth.hashers import get_hasher
+    hasher = get_hasher('default')
+    return [django.get_version(), hasher.algorithm, getattr(hasher, 'iterations', None)]
+
+def run_fingerprint(seed, shards, part_files, sql_format=None, sql_timezone=None):
+    """Fingerprint of everything that determines the output of a run"""
+    numpy = batch_generators.np
+    return compute_fingerprint({
+        "seed": seed,
+        "shards": shards,
+        "part_files": part_files,
+        "sql": [sql_format, sql_timezone] if sql_format else None,
+        "sizes": current_sizes(),
+        "choices": current_choices(),
+        "logo_palette_seed": LOGO_PALETTE_SEED,
+        # A Django upgrade can change the hasher or its iterations without touching our sources
+        "password_hasher": password_hasher_identity(),
+        # NumPy and the pure-Python fallback draw different values
+        "numpy": numpy.__version__ if numpy is not None else None
+    }, GENERATOR_SOURCES)
+
+def open_database_sink():
+    """Clear the database and start the background inserter for --stream
+    
+    Returns (importer, sink), or (None, None) when the database is not
+    reachable or clearing it was declined.
+    """
+    setup_django()
+    from import_csv_to_db import CSVImporter
+    
+    importer = CSVImporter()
+    if not importer.setup_database() or not importer.clear_existing_data():
+        return None, None
+    importer.start_stream()
+    return importer, DatabaseSink(importer.insert_batch, importer.finish_stream)
+
+def finish_tables(sinks):
+    """Wait for the background CSV writers to finish"""
+    for sink in sinks:
+        count = sink.close()
+        print(f"Generated {count} records in {sink.filepath}")
+        if PROFILER is not None:
+            PROFILER.add_file(sink.filepath, os.path.getsize(sink.filepath))
+
+def main(seed=None, shards=1, workers=None, part_files=False, sizes=None, plan=False, calibrate=False,
+         django_free=False, choices_snapshot=None, stage_workers=DEFAULT_STAGE_WORKERS, logo_cache=True,
+         append=False, snapshot_cache=True, snapshot_cache_bytes=DEFAULT_MAX_CACHE_BYTES,
+         profile=None, profile_cprofile=False, profile_memory=False, stream=False, keep_csv=False,
+         sql_format=None, sql_timezone=None, cv_processes=None):
+    global DJANGO_FREE, STAGE_WORKERS, LOGO_CACHE_DIR, TYPED_ROWS, CV_PROCESSES
+    DJANGO_FREE = django_free
+    STAGE_WORKERS = stage_workers
+    # Streamed rows go straight to the database, so they stay typed
+    TYPED_ROWS = stream
+    csv_output = not stream or keep_csv
+    if not logo_cache:
+        LOGO_CACHE_DIR = None
+    configure_choices(load_choices(choices_snapshot))
+    if profile is not None:
+        enable_profiling(profile_cprofile, profile_memory)
+    
+    # Load files read naive timestamps in the time zone the ORM import would use
+    if sql_format and sql_timezone is None:
+        sql_timezone = django_time_zone()
+        if sql_timezone is None:
+            print(f"⚠️  Django settings not available: the SQL load files read timestamps as {DEFAULT_SQL_TIMEZONE} "
+                  f"(pass --sql-timezone to match the project's TIME_ZONE)")
+    
+    # Only runs with an explicit seed can be served from (or worth storing in) the snapshot cache
+    use_snapshot_cache = snapshot_cache and seed is not None and not append and not stream
+    
+    # Without an explicit seed, pick one and print it so the run can be reproduced
+    if seed is None:
+        seed = random.SystemRandom().randrange(2**32)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    # PDF rendering holds the GIL: render CVs in processes unless the shards already run in processes
+    if cv_processes is None:
+        cv_processes = (os.cpu_count() or 1) if shards == 1 or workers <= 1 else 0
+    CV_PROCESSES = cv_processes if cv_processes > 1 else 0
+    if sizes is not None:
+        configure_sizes(sizes)
+    
+    # Estimate the cost of the run before doing any work
+    costs = calibrate_costs() if calibrate else RECORD_COSTS
+    estimate = estimate_resources(current_sizes(), workers, shards, costs)
+    free_bytes = shutil.disk_usage(project_root).free
+    total_disk = print_plan(estimate, free_bytes)
+    if plan:
+        return
+    if total_disk > free_bytes:
+        print("Aborting: the run would not fit on disk. Reduce the scale or free up space.")
+        return
+    
     print("Generating dummy data for Django project...")
     print("Aligning data by industry: company names, job titles, skills, descriptions, and services...")
     print("Randomizing datetime with hours, minutes, and seconds...")
+    print(f"Seed: {seed}, shards: {shards}, workers: {workers} (re-run with --seed {seed} --shards {shards} to reproduce)")
+    
+    # Restore an identical earlier run instead of generating it again
+    if use_snapshot_cache:
+        fingerprint = run_fingerprint(seed, shards, part_files, sql_format, sql_timezone)
+        restored = restore_snapshot(SNAPSHOT_CACHE_DIR, fingerprint, project_root)
+        if restored is not None:
+            print(f"✓ Restored {len(restored)} files from snapshot {fingerprint[:12]} in {SNAPSHOT_CACHE_DIR}")
+            # Snapshots are only taken of fresh runs, whose totals are the configured sizes
+            save_generation_state(None, current_sizes(), {"seed": seed, "shards": shards, "sizes": current_sizes(),
+                                                          "append": False})
+            return
+        print(f"No cached snapshot for fingerprint {fingerprint[:12]}, generating")
+    
+    # With --stream, rows are inserted by a background thread as each phase produces them
+    importer, database = None, None
+    if stream:
+        importer, database = open_database_sink()
+        if database is None:
+            print("Aborting: the database is not ready for streaming")
+            return
+    
+    # With --append, continue from the fixture already in dummy_data/
+    state = None
+    existing = empty_existing_data()
+    if append:
+        state = load_generation_state()
+        with profile_stage("load existing"):
+            existing = load_existing_data()
+        print(f"Appending to existing fixture: {existing_counts(existing)}")
+        if state is not None and state["counts"] != existing_counts(existing):
+            print(f"⚠️  CSV row counts differ from {GENERATION_STATE_FILENAME} ({state['counts']}); "
+                  f"the CSVs were changed after the last run")
+    
+    # With --sql, every table is also written as a PostgreSQL load file; new rows continue the fixture's ids
+    sql = None
+    if sql_format:
+        sql = SqlDump(project_root / 'dummy_data' / SQL_DIRNAME, sql_format, {
+            "companies_company": len(existing["companies"]) + 1,
+            "listings_listing": len(existing["listings"]) + 1,
+            "applies_apply": existing["applies"] + 1
+        }, sql_timezone)
+    
+    prepared = prepare_output_dirs()
+    if prepared:
+        print(f"Created {prepared} cv/ and photos/ date directories up front")
+    
+    with profile_stage("users"):
+        # Generate auth_user data and get user lists (each shard owns a slice of both id ranges).
+        # New users continue the usernames and ids of an appended-to fixture
+        first_company_user = existing["company_users"]
+        first_individual_user = len(existing["individual_users"])
+        company_id_offset = existing["max_user_id"] - first_company_user
+        individual_id_offset = existing["max_user_id"] + NUM_COMPANY_USERS - first_individual_user
+        user_shards = run_shards(generate_user_shard, [
+            (seed, shard_index, company_range, individual_range, company_id_offset, individual_id_offset)
+            for shard_index, (company_range, individual_range) in enumerate(zip(
+                shard_ranges(NUM_COMPANY_USERS, shards, first_company_user),
+                shard_ranges(NUM_INDIVIDUAL_USERS, shards, first_individual_user)
+            ))
+        ], workers)
+        company_user_parts = [company_part for company_part, _ in user_shards]
+        individual_user_parts = [individual_part for _, individual_part in user_shards]
+        check_shard_rows('auth_user', company_user_parts + individual_user_parts,
+                         NUM_COMPANY_USERS + NUM_INDIVIDUAL_USERS)
+        # Emails repeat at scale (small name and domain pools); fix them before companies and applies copy them
+        rewritten = make_unique((user for part in company_user_parts + individual_user_parts for user in part),
+                                "email", "id", unique_email, existing["emails"])
+        print(f"Made {rewritten} repeated user emails unique")
+        # Company users come first so the file stays in id order
+        sinks = write_table('auth_user.csv', company_user_parts + individual_user_parts, AUTH_USER_FIELDS, part_files, append,
+                            database, csv_output, sql)
+        # Later phases only read a few user fields: keep those columns and drop the dicts
+        company_users = ColumnStore.from_records((user for part in company_user_parts for user in part), USER_COLUMNS)
+        individual_users = existing["individual_users"]
+        individual_users.extend(user for part in individual_user_parts for user in part)
+        del user_shards, company_user_parts, individual_user_parts
+    
+    with profile_stage("companies"):
+        # Generate and save company data (using company users' emails and aligning with industry)
+        company_parts = run_shards(generate_company_shard, [
+            (seed, shard_index, company_users.slice(company_range.start, company_range.stop))
+            for shard_index, company_range in enumerate(shard_ranges(len(company_users), shards))
+        ], workers)
+        check_shard_rows('companies_company', company_parts, NUM_COMPANIES)
+        rewritten = make_unique((company for part in company_parts for company in part), "name", "user_id",
+                                unique_company_name, existing["company_names"])
+        print(f"Made {rewritten} repeated company names unique")
+        sinks += write_table('companies_company.csv', company_parts, COMPANY_FIELDS, part_files, append,
+                             database, csv_output, sql)
+        companies = existing["companies"]
+        companies.extend(company for part in company_parts for company in part)
+        media_paths = [company["logo"] for part in company_parts for company in part]
+        del company_parts
+    
+    with profile_stage("listings"):
+        # Generate and save listing data (aligning with company industry)
+        listing_parts = run_shards(generate_listing_shard, [
+            (seed, shard_index, companies, listing_range)
+            for shard_index, listing_range in enumerate(shard_ranges(NUM_LISTINGS, shards, len(existing["listings"])))
+        ], workers)
+        check_shard_rows('listings_listing', listing_parts, NUM_LISTINGS)
+        sinks += write_table('listings_listing.csv', listing_parts, LISTING_FIELDS, part_files, append,
+                             database, csv_output, sql)
+        listings = existing["listings"]
+        listings.extend(listing for part in listing_parts for listing in part)
+        del listing_parts
     
-    # Generate and save auth_user data
-    auth_user_fields = [
-        "id", "password", "last_login", "is_superuser", "username", "first_name",
-        "last_name", "email", "is_staff", "is_active", "date_joined"
-    ]
-    
-    # Generate auth_user data and get user lists
-    auth_user_data, company_users, individual_users = generate_auth_user_data()
-    write_csv('auth_user.csv', auth_user_data, auth_user_fields)
-    
-    # Generate and save company data (using company users' emails and aligning with industry)
-    company_fields = [
-        "name", "logo", "industry", "serivces", "description", 
-        "phone", "email", "create_date", "user_id"
-    ]
-    company_data = generate_company_data(company_users)
-    write_csv('companies_company.csv', company_data, company_fields)
-    
-    # Generate and save listing data (aligning with company industry)
-    listing_fields = [
-        "company_id", "title", "industry", "budget", "duration",
-        "description", "requirement", "publish_date", "is_active"
-    ]
-    listing_data = generate_listing_data(company_data)
-    write_csv('listings_listing.csv', listing_data, listing_fields)
-    
-    # Generate and save apply data (using individual users' names and emails)
-    apply_fields = [
-        "name", "email", "phone", "message",
-        "cv", "apply_date", "listing_id", "user_id"
-    ]
-    apply_data = generate_apply_data(individual_users, listing_data)
-    write_csv('applies_apply.csv', apply_data, apply_fields)
+    with profile_stage("applies"):
+        # Generate and save apply data (using individual users' names and emails)
+        # Every apply shard draws applicants from its own slice of individual users, so all CVs
+        # of a user are written by one shard. There are at most as many apply shards as users
+        apply_shards = max(1, min(shards, len(individual_users)))
+        apply_parts = run_shards(generate_apply_shard, [
+            (seed, shard_index, individual_users.slice(user_range.start, user_range.stop), listings, apply_range)
+            for shard_index, (user_range, apply_range) in enumerate(zip(
+                shard_ranges(len(individual_users), apply_shards),
+                shard_ranges(NUM_APPLIES, apply_shards, existing["applies"])
+            ))
+        ], workers)
+        check_shard_rows('applies_apply', apply_parts, NUM_APPLIES)
+        sinks += write_table('applies_apply.csv', apply_parts, APPLY_FIELDS, part_files, append,
+                             database, csv_output, sql)
+    
+    # Record size and checksum of every generated logo and CV next to the CSVs
+    media_paths += [apply["cv"] for part in apply_parts for apply in part]
+    del apply_parts
+    # The password, logo and CV stages have been running next to the phases; wait for what is left
+    with profile_stage("stage drain"):
+        close_stages()
+    media_paths = [resolved(path) for path in media_paths]
+    with profile_stage("csv writes"):
+        finish_tables(sinks)
+    if sql is not None:
+        load_script = sql.write_load_script()
+        print(f"PostgreSQL load script: psql -d <database> -f {load_script}")
+    if database is not None:
+        with profile_stage("database"):
+            counts = database.close()
+        print(f"Streamed into the database: {counts}")
+        importer.validate_import()
+    with profile_stage("manifest"):
+        _, missing_media = write_manifest(media_paths, WRITTEN_MEDIA, project_root / 'dummy_data' / MANIFEST_FILENAME,
+                                          append=append)
+    
+    # Save the totals and how they were produced so the fixture can be appended to and reproduced
+    totals = existing_counts(existing)
+    totals["company_users"] += NUM_COMPANY_USERS
+    totals["applies"] += NUM_APPLIES
+    if csv_output:
+        save_generation_state(state, totals, {"seed": seed, "shards": shards, "sizes": current_sizes(), "append": append})
+    
+    # A run that fell back to placeholder media (e.g. failed logo downloads) would be restored as is from then on
+    if use_snapshot_cache and missing_media:
+        print(f"⚠️  Not saving a snapshot: {len(missing_media)} media files fell back to placeholders")
+    elif use_snapshot_cache:
+        # generation_state.json is written again on restore, so it is not part of the snapshot
+        snapshot_files = [os.path.relpath(sink.filepath, project_root) for sink in sinks] + [
+            os.path.join('dummy_data', MANIFEST_FILENAME)
+        ] + media_paths
+        if sql is not None:
+            snapshot_files.append(os.path.relpath(load_script, project_root))
+        with profile_stage("snapshot"):
+            size = save_snapshot(SNAPSHOT_CACHE_DIR, fingerprint, project_root, snapshot_files)
+        print(f"Saved snapshot {fingerprint[:12]} ({size / 1024 / 1024:.1f} MB) to {SNAPSHOT_CACHE_DIR}")
+        for evicted in evict_snapshots(SNAPSHOT_CACHE_DIR, snapshot_cache_bytes):
+            print(f"  Evicted least recently used snapshot {evicted[:12]}")
+    if append:
+        print(f"Fixture now has {totals['company_users'] + totals['individual_users']} users, "
+              f"{totals['listings']} listings and {totals['applies']} applies")
     
     print("\n" + "="*50)
     print("DATA GENERATION COMPLETE!")
@@ -688,6 +1622,7 @@ def main():
     print("2. companies_company.csv")
     print("3. listings_listing.csv")
     print("4. applies_apply.csv")
+    print(f"5. {MANIFEST_FILENAME} (path, size and checksum of every CV and logo)")
     print("\n" + "="*50)
     print("IMPORTANT: Files have been generated in the following directories:")
     print("1. CV PDFs in 'cv/' directory:")
@@ -706,6 +1641,108 @@ def main():
     print("5. Data consistency: Company emails match user emails, Apply emails/names match user data")
     print("6. Industry alignment: All data is aligned by industry category")
     print("="*50)
+    
+    if PROFILER is not None:
+        PROFILER.write_report(profile)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Generate dummy data CSVs, CV PDFs and logos for the Django project')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Seed for reproducible output (CSV files are bit-identical for a given seed and shard count)')
+    parser.add_argument('--shards', type=int, default=1,
+                        help='Split users, companies, listings and applies into this many id ranges')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Processes used to generate shards (default: number of CPU cores)')
+    parser.add_argument('--stage-workers', type=int, default=DEFAULT_STAGE_WORKERS,
+                        help='Threads per pipeline stage: password hashing, logo downloads, CV rendering (0 = inline)')
+    parser.add_argument('--cv-processes', type=int, default=None,
+                        help='Processes rendering CV PDFs (default: number of CPU cores when the shards run in this '
+                             'process; 0 or 1 = render in threads of the CV stage)')
+    parser.add_argument('--no-logo-cache', action='store_true',
+                        help=f'Always download logos instead of reusing them from {LOGO_CACHE_DIR.name}/')
+    parser.add_argument('--append', action='store_true',
+                        help='Add rows to the CSVs in dummy_data/ instead of regenerating them; only the per-table '
+                             'sizes given (or the --preset/--multiplier sizes) are generated')
+    parser.add_argument('--no-snapshot-cache', action='store_true',
+                        help=f'Always generate instead of restoring an identical earlier run from {SNAPSHOT_CACHE_DIR.name}/')
+    parser.add_argument('--snapshot-cache-mb', type=int, default=DEFAULT_MAX_CACHE_BYTES // (1024 * 1024),
+                        help='Evict least recently used snapshots beyond this total size')
+    parser.add_argument('--profile', type=str, nargs='?', const='generation_profile.json', default=None,
+                        help='Time every stage and hot helper and write a JSON report (default: generation_profile.json)')
+    parser.add_argument('--profile-cprofile', action='store_true',
+                        help='With --profile, also record the top cProfile functions of every stage')
+    parser.add_argument('--profile-memory', action='store_true',
+                        help='With --profile, also record peak memory and top allocations of every stage (tracemalloc)')
+    parser.add_argument('--stream', action='store_true',
+                        help='Insert the rows straight into the Django database (cleared first) instead of writing CSVs')
+    parser.add_argument('--keep-csv', action='store_true',
+                        help='With --stream, also write the CSV files to dummy_data/ for reproducibility')
+    parser.add_argument('--sql', choices=SQL_FORMATS, default=None,
+                        help=f'Also write PostgreSQL load files (COPY blocks or multi-row INSERTs) to dummy_data/{SQL_DIRNAME}/')
+    parser.add_argument('--sql-timezone', type=str, default=None,
+                        help='Time zone the load script reads company, listing and apply timestamps in '
+                             f'(default: the Django TIME_ZONE, else {DEFAULT_SQL_TIMEZONE})')
+    parser.add_argument('--part-files', action='store_true',
+                        help='Write one CSV part file per shard instead of merging them')
+    parser.add_argument('--preset', choices=list(SCALE_PRESETS), default=None,
+                        help=f'Named scale preset (default: {DEFAULT_PRESET})')
+    parser.add_argument('--multiplier', type=int, default=None,
+                        help='Scale multiplier applied to the per-table ratios (overrides --preset)')
+    for name in SIZE_RATIOS:
+        parser.add_argument(f"--{name.replace('_', '-')}", type=int, default=None, dest=name,
+                            help=f'Number of {name.replace("_", " ")} (overrides the preset)')
+    parser.add_argument('--config', type=str, default=None,
+                        help='JSON file with "preset", "multiplier" and/or per-table sizes')
+    parser.add_argument('--plan', action='store_true',
+                        help='Only print estimated wall time, peak memory and disk usage, then exit')
+    parser.add_argument('--calibrate', action='store_true',
+                        help='Measure per-record costs on this machine before estimating')
+    parser.add_argument('--django-free', action='store_true',
+                        help="Don't set up Django: hash passwords with the standalone PBKDF2 implementation")
+    parser.add_argument('--choices-snapshot', type=str, default=None,
+                        help='Read industry/budget/duration choices from this JSON snapshot instead of listings/choices.py')
+    parser.add_argument('--write-choices-snapshot', action='store_true',
+                        help=f'Save listings/choices.py to {CHOICES_SNAPSHOT.name} for Django-free workers and exit')
+    
+    args = parser.parse_args()
+    if args.shards < 1:
+        parser.error('--shards must be at least 1')
+    if args.append and args.part_files:
+        parser.error('--append adds to the merged CSV files and cannot be combined with --part-files')
+    if args.stream and (args.append or args.django_free):
+        parser.error('--stream inserts into a freshly cleared database through Django; '
+                     'it cannot be combined with --append or --django-free')
+    if args.keep_csv and not args.stream:
+        parser.error('--keep-csv only applies to --stream')
+    
+    # Command line options take precedence over the config file
+    config = load_sizes_config(args.config) if args.config else {}
+    overrides = {name: getattr(args, name) if getattr(args, name) is not None else config.get(name)
+                 for name in SIZE_RATIOS}
+    try:
+        if args.append and args.preset is None and args.multiplier is None and not config:
+            # Only grow the tables that were asked for
+            sizes = {name: value or 0 for name, value in overrides.items()}
+        else:
+            sizes = resolve_sizes(
+                args.preset or config.get("preset"),
+                args.multiplier if args.multiplier is not None else config.get("multiplier"),
+                overrides
+            )
+    except ValueError as e:
+        parser.error(str(e))
+    
+    if args.write_choices_snapshot:
+        write_choices_snapshot(load_choices())
+        sys.exit(0)
+    
+    main(seed=args.seed, shards=args.shards, workers=args.workers, part_files=args.part_files,
+         sizes=sizes, plan=args.plan, calibrate=args.calibrate,
+         django_free=args.django_free, choices_snapshot=args.choices_snapshot,
+         stage_workers=args.stage_workers, logo_cache=not args.no_logo_cache, append=args.append,
+         snapshot_cache=not args.no_snapshot_cache, snapshot_cache_bytes=args.snapshot_cache_mb * 1024 * 1024,
+         profile=args.profile, profile_cprofile=args.profile_cprofile, profile_memory=args.profile_memory,
+         stream=args.stream, keep_csv=args.keep_csv, sql_format=args.sql, sql_timezone=args.sql_timezone,
+         cv_processes=args.cv_processes)
\ No newline at end of file
@@ -1,11 +1,15 @@
 from fpdf import FPDF
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 
 class CVGenerator(FPDF):
-    def __init__(self):
+    def __init__(self, creation_date=None):
         super().__init__()
         self.set_auto_page_break(auto=True, margin=15)
+        # A fixed creation date (footer and PDF metadata) makes the file reproducible
+        self.generated_on = creation_date or datetime.now()
+        if creation_date is not None:
+            self.set_creation_date(creation_date.replace(tzinfo=creation_date.tzinfo or timezone.utc))
         
     def header(self):
         # Logo or header content
@@ -17,7 +21,7 @@ class CVGenerator(FPDF):
         # Position at 1.5 cm from bottom
         self.set_y(-15)
         self.set_font('helvetica', 'I', 8)
-        self.cell(0, 10, f'Generated on {datetime.now().strftime("%Y-%m-%d")}', 0, 0, 'C')
+        self.cell(0, 10, f'Generated on {self.generated_on.strftime("%Y-%m-%d")}', 0, 0, 'C')
         
     def add_personal_info(self, name, email, phone, skills, experience_level):
         """Add personal information section"""
@@ -68,18 +72,19 @@ class CVGenerator(FPDF):
         self.multi_cell(0, 5, message)
         self.ln(5)
 
-def generate_cv_pdf(applicant_info, output_path):
+def render_cv_pdf(applicant_info, creation_date=None):
     """
-    Generate a CV PDF for an applicant
+    Render a CV PDF for an applicant and return its bytes
     
     Args:
         applicant_info (dict): Dictionary containing applicant information
             Required keys: name, email, phone, skills, experience_level, 
                           job_title, description, message
-        output_path (str): Path where to save the PDF file
+        creation_date (datetime): Date recorded in the footer and the PDF
+            metadata (default: now); naive datetimes are taken as UTC
     """
     # Create CV generator
-    pdf = CVGenerator()
+    pdf = CVGenerator(creation_date)
     pdf.add_page()
     
     # Add personal information
@@ -103,13 +108,30 @@ def generate_cv_pdf(applicant_info, output_path):
     # Add summary section
     pdf.add_summary_section(applicant_info.get('message', ''))
     
+    return bytes(pdf.output())
+
+def generate_cv_pdf(applicant_info, output_path, create_dir=True, creation_date=None):
+    """
+    Generate a CV PDF for an applicant
+    
+    Args:
+        applicant_info (dict): Dictionary containing applicant information
+            (see render_cv_pdf)
+        output_path (str): Path where to save the PDF file
+        create_dir (bool): Create the output directory first (skip when the
+            caller already created it)
+        creation_date (datetime): See render_cv_pdf
+    """
+    data = render_cv_pdf(applicant_info, creation_date)
+    
     # Ensure directory exists (only if output_path has a directory component)
     output_dir = os.path.dirname(output_path)
-    if output_dir:
+    if create_dir and output_dir:
         os.makedirs(output_dir, exist_ok=True)
     
     # Save PDF
-    pdf.output(output_path)
+    with open(output_path, 'wb') as f:
+        f.write(data)
     return output_path
 
 def generate_simple_pdf(text, filename, font="helvetica", size=12):
@@ -1,7 +1,11 @@
 import os
 import sys
 import csv
+import json
+import time
 import django
+import itertools
+import contextlib
 from pathlib import Path
 from datetime import datetime
 from django.utils import timezone
@@ -21,14 +25,31 @@ django.setup()
 
 from django.contrib.auth.models import User
 from django.db import transaction, IntegrityError
+from django.db.models import Count, Q
 from companies.models import Company
 from listings.models import Listing
 from applies.models import Apply
 
+# Steps whose table's secondary indexes and FK checks --defer-indexes suspends
+# (their foreign key checks only read other tables, so nothing slows down)
+DEFERRED_INDEX_STEPS = {
+    'import_listings': Listing,
+    'import_applies': Apply
+}
 
+# Session settings of --load-tuning, per database backend. They only apply to the
+# importer's connection and are restored afterwards. The SQLite ones trade crash
+# safety of the database file for speed while the import runs.
+LOAD_TUNING = {
+    'postgresql': {'synchronous_commit': 'off'},
+    'sqlite': {'journal_mode': 'MEMORY', 'synchronous': 'OFF', 'temp_store': 'MEMORY'}
+}
+
+# CSV rows per bulk_create batch of the import steps
+IMPORT_BATCH_ROWS = 1000
 
 class CSVImporter:
-    def __init__(self, csv_dir='dummy_data'):
+    def __init__(self, csv_dir='dummy_data', defer_indexes=False, load_tuning=False, load_memory_mb=None):
         # Make csv_dir relative to project root, not script location
         project_root = Path(__file__).resolve().parent.parent
         self.csv_dir = project_root / csv_dir
@@ -39,6 +60,26 @@ class CSVImporter:
             'total': 0
         }
         self.import_log = []
+        # Last id assigned per table to rows streamed through insert_batch
+        self.stream_ids = {}
+        # Added to streamed user ids and user foreign keys, past the users kept by clearing (see start_stream)
+        self.stream_user_offset = 0
+        self.defer_indexes = defer_indexes
+        # Load / rebuild / ANALYZE seconds per table of steps run with deferred indexes
+        self.step_timings = {}
+        # Counts from collect_counts, shared by validate_import and generate_report
+        self.table_counts = None
+        # Rows the import steps or insert_batch could not insert, with their errors (opened on the first reject)
+        self.rejects_path = project_root / 'import_rejects.csv'
+        self.rejects_file = None
+        self.rejects_writer = None
+        self.rejected_count = 0
+        # Session tuning for the load (see LOAD_TUNING); load_memory_mb raises
+        # work_mem/maintenance_work_mem (PostgreSQL) or the page cache (SQLite)
+        self.load_tuning = load_tuning
+        self.load_memory_mb = load_memory_mb
+        # (setting, value before, value during the load) of every tuned setting
+        self.tuning_report = []
         
     def log_message(self, level, message, record_id=None):
         """Log import messages with timestamp"""
@@ -69,8 +110,104 @@ class CSVImporter:
             self.log_message('ERROR', f'Database connection failed: {str(e)}')
             return False
         
-    def clear_existing_data(self, confirm=True):
-        """Clear existing data from tables and reset sequences"""
+    def reverse_relations(self, model):
+        """Foreign keys of other models (and many-to-many link tables) that point at model"""
+        return [relation for relation in model._meta.get_fields(include_hidden=True)
+                if relation.auto_created and not relation.concrete and (relation.one_to_many or relation.one_to_one)]
+    
+    def bulk_clear_blocker(self):
+        """Why bulk_clear would not match the ORM delete, or None when it can be used
+        
+        bulk_clear deletes (or TRUNCATE ... CASCADE empties) every row that
+        references the cleared rows, one level deep. That is only what the ORM
+        does when each such reference is ON DELETE CASCADE and nothing
+        references the referencing table in turn.
+        """
+        from django.db import models
+        app_tables = {model._meta.db_table for model in (Apply, Listing, Company)}
+        for model in (Apply, Listing, Company, User):
+            for relation in self.reverse_relations(model):
+                related_model = relation.related_model
+                if related_model._meta.db_table in app_tables:
+                    continue
+                reference = f'{related_model._meta.db_table}.{relation.field.column}'
+                if relation.on_delete is not models.CASCADE:
+                    return f'{reference} is {relation.on_delete.__name__}, not CASCADE'
+                if self.reverse_relations(related_model):
+                    return f'{related_model._meta.db_table} (referencing {model._meta.db_table}) is referenced by other tables'
+        return None
+    
+    def referencing_rows_sql(self, model, where_sql, skip_tables):
+        """Set-based DELETEs for rows of other tables that point at the rows of model matching where_sql
+        
+        Covers reverse foreign keys and many-to-many link tables (e.g.
+        auth_user_groups, django_admin_log); tables in skip_tables are
+        cleared separately. Only valid when bulk_clear_blocker() is None.
+        """
+        from django.db import connection
+        quote = connection.ops.quote_name
+        table = model._meta.db_table
+        statements = []
+        for relation in self.reverse_relations(model):
+            related_table = relation.related_model._meta.db_table
+            if related_table in skip_tables:
+                continue
+            statements.append(
+                f"DELETE FROM {quote(related_table)} WHERE {quote(relation.field.column)} IN "
+                f"(SELECT {quote(model._meta.pk.column)} FROM {quote(table)} WHERE {where_sql})"
+            )
+        return statements
+    
+    def bulk_clear(self):
+        """Clear the tables with set-based SQL instead of collecting objects through the ORM
+        
+        PostgreSQL: TRUNCATE ... RESTART IDENTITY CASCADE for the app tables.
+        SQLite (no TRUNCATE): one DELETE per table, then its sqlite_sequence
+        rows are dropped. Non-superusers are removed with a single DELETE on
+        both, after the rows that reference them.
+        """
+        from django.db import connection
+        quote = connection.ops.quote_name
+        app_tables = [model._meta.db_table for model in (Apply, Listing, Company)]
+        user_table = User._meta.db_table
+        non_superusers = f"NOT {quote('is_superuser')}"
+        
+        with transaction.atomic(), connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute(f"TRUNCATE {', '.join(quote(table) for table in app_tables)} RESTART IDENTITY CASCADE")
+            else:
+                for model in (Apply, Listing, Company):
+                    for statement in self.referencing_rows_sql(model, '1 = 1', app_tables):
+                        cursor.execute(statement)
+                    cursor.execute(f"DELETE FROM {quote(model._meta.db_table)}")
+            self.log_message('INFO', f'Cleared {", ".join(app_tables)}')
+            
+            for statement in self.referencing_rows_sql(User, non_superusers, app_tables):
+                cursor.execute(statement)
+            cursor.execute(f"DELETE FROM {quote(user_table)} WHERE {non_superusers}")
+            self.log_message('INFO', f'Cleared non-superuser Users ({cursor.rowcount} rows)')
+            
+            # The app tables restarted at 1 above; auth_user continues after the remaining superusers
+            if connection.vendor == 'postgresql':
+                cursor.execute(f"SELECT setval(pg_get_serial_sequence('{user_table}', 'id'), "
+                               f"COALESCE(MAX(id), 1), MAX(id) IS NOT NULL) FROM {quote(user_table)}")
+            else:
+                placeholders = ', '.join(['%s'] * (len(app_tables) + 1))
+                cursor.execute(f"DELETE FROM sqlite_sequence WHERE name IN ({placeholders})", app_tables + [user_table])
+        
+        remaining = User.objects.count()
+        if remaining:
+            self.log_message('WARNING', f'{remaining} superuser(s) kept: new user ids start after them, '
+                                        f'so user_id columns in the CSV files will not line up')
+    
+    def clear_existing_data(self, confirm=True, bulk=True):
+        """Clear existing data from tables and reset sequences
+        
+        With bulk=True, PostgreSQL and SQLite are cleared with set-based SQL
+        (bulk_clear); otherwise, on other databases, and when other tables
+        reference the cleared rows in ways bulk_clear does not handle
+        (bulk_clear_blocker), through the ORM.
+        """
         self.log_message('WARNING', 'Clearing existing data from tables...')
         
         # Check if tables have data
@@ -96,6 +233,14 @@ class CSVImporter:
             try:
                 from django.db import connection
                 
+                blocker = self.bulk_clear_blocker() if bulk and connection.vendor in ('postgresql', 'sqlite') else None
+                if blocker:
+                    self.log_message('INFO', f'Clearing through the ORM: {blocker}')
+                elif bulk and connection.vendor in ('postgresql', 'sqlite'):
+                    self.bulk_clear()
+                    self.log_message('SUCCESS', 'All data cleared and sequences reset successfully')
+                    return True
+                
                 # Clear data in reverse order (due to foreign keys)
                 Apply.objects.all().delete()
                 self.log_message('INFO', 'Cleared Apply table')
@@ -110,18 +255,26 @@ class CSVImporter:
                 User.objects.filter(is_superuser=False).delete()
                 self.log_message('INFO', 'Cleared non-superuser Users')
                 
+                # Get all table names
+                tables_to_reset = [
+                    'applies_apply',
+                    'listings_listing', 
+                    'companies_company',
+                    'auth_user'
+                ]
+                
+                if connection.vendor == 'sqlite':
+                    # SQLite keeps AUTOINCREMENT counters in sqlite_sequence
+                    with connection.cursor() as cursor:
+                        placeholders = ', '.join(['%s'] * len(tables_to_reset))
+                        cursor.execute(f"DELETE FROM sqlite_sequence WHERE name IN ({placeholders})", tables_to_reset)
+                    self.log_message('SUCCESS', 'All data cleared and sequences reset successfully')
+                    return True
+                
                 # Reset PostgreSQL sequences for all tables
                 self.log_message('INFO', 'Resetting PostgreSQL sequences...')
                 
                 with connection.cursor() as cursor:
-                    # Get all table names
-                    tables_to_reset = [
-                        'applies_apply',
-                        'listings_listing', 
-                        'companies_company',
-                        'auth_user'
-                    ]
-                    
                     for table_name in tables_to_reset:
                         try:
                             # Reset the sequence for each table
@@ -139,6 +292,173 @@ class CSVImporter:
         else:
             self.log_message('INFO', 'Database is already empty')
             return True
+    def suspend_indexes(self, table):
+        """Drop the secondary indexes and foreign keys of a table; returns what restore_indexes needs
+        
+        Primary keys, unique indexes and indexes backing constraints stay, so
+        duplicate checks keep working. PostgreSQL foreign keys are dropped
+        and re-added afterwards (one set-based check instead of one per row);
+        SQLite turns foreign key enforcement off and checks the table at the end.
+        """
+        from django.db import connection
+        quote = connection.ops.quote_name
+        
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute("""
+                    SELECT i.indexrelid::regclass::text, pg_get_indexdef(i.indexrelid)
+                    FROM pg_index i
+                    WHERE i.indrelid = %s::regclass AND NOT i.indisprimary AND NOT i.indisunique
+                      AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid)
+                """, [table])
+                indexes = cursor.fetchall()
+                cursor.execute("""
+                    SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint
+                    WHERE conrelid = %s::regclass AND contype = 'f'
+                """, [table])
+                foreign_keys = cursor.fetchall()
+                for name, _ in foreign_keys:
+                    cursor.execute(f"ALTER TABLE {quote(table)} DROP CONSTRAINT {quote(name)}")
+            else:
+                cursor.execute("SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = %s "
+                               "AND sql IS NOT NULL AND sql NOT LIKE 'CREATE UNIQUE%%'", [table])
+                indexes = [(quote(name), definition) for name, definition in cursor.fetchall()]
+                foreign_keys = []
+            for name, _ in indexes:
+                cursor.execute(f"DROP INDEX {name}")
+        
+        if connection.vendor != 'postgresql':
+            connection.disable_constraint_checking()
+        return indexes, foreign_keys
+    
+    def restore_indexes(self, table, indexes, foreign_keys):
+        """Recreate what suspend_indexes dropped and check the foreign keys of the loaded rows"""
+        from django.db import connection
+        quote = connection.ops.quote_name
+        
+        with connection.cursor() as cursor:
+            for _, definition in indexes:
+                cursor.execute(definition)
+            for name, definition in foreign_keys:
+                try:
+                    cursor.execute(f"ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(name)} {definition}")
+                except IntegrityError as e:
+                    # Keep enforcing the constraint for new rows; the existing ones need fixing first
+                    cursor.execute(f"ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(name)} {definition} NOT VALID")
+                    self.log_message('ERROR', f'{table}: rows violate {name} ({str(e).strip()}); re-added NOT VALID, '
+                                              f'run ALTER TABLE {table} VALIDATE CONSTRAINT {name} after fixing them')
+        
+        if connection.vendor != 'postgresql':
+            connection.enable_constraint_checking()
+            try:
+                connection.check_constraints(table_names=[table])
+            except IntegrityError as e:
+                self.log_message('ERROR', f'{table}: foreign key check failed after the load: {str(e)}')
+    
+    def tuning_settings(self):
+        """Session settings of the load tuning profile for the current database"""
+        from django.db import connection
+        
+        settings = dict(LOAD_TUNING.get(connection.vendor, {}))
+        if self.load_memory_mb:
+            if connection.vendor == 'postgresql':
+                settings['work_mem'] = f'{self.load_memory_mb}MB'
+                settings['maintenance_work_mem'] = f'{self.load_memory_mb}MB'
+            elif connection.vendor == 'sqlite':
+                # Negative cache_size is in KiB
+                settings['cache_size'] = str(-self.load_memory_mb * 1024)
+        return settings
+    
+    @contextlib.contextmanager
+    def tuned_session(self):
+        """Apply the load tuning profile to this connection and restore every setting afterwards
+        
+        Nothing is changed in the server or database configuration; the
+        settings live in the session (PostgreSQL SET, SQLite PRAGMA) and are
+        put back to their previous values when the load is done.
+        """
+        from django.db import connection
+        
+        if not self.load_tuning:
+            yield
+            return
+        
+        settings = self.tuning_settings()
+        if not settings:
+            self.log_message('WARNING', f'No load tuning profile for {connection.vendor}, running with its defaults')
+        
+        previous = {}
+        with connection.cursor() as cursor:
+            for name, value in settings.items():
+                if connection.vendor == 'postgresql':
+                    cursor.execute("SELECT current_setting(%s)", [name])
+                    previous[name] = cursor.fetchone()[0]
+                    cursor.execute("SELECT set_config(%s, %s, false)", [name, value])
+                else:
+                    cursor.execute(f"PRAGMA {name}")
+                    previous[name] = str(cursor.fetchone()[0])
+                    cursor.execute(f"PRAGMA {name} = {value}")
+                self.tuning_report.append((name, previous[name], value))
+                self.log_message('INFO', f'Load tuning: {name} = {value} (was {previous[name]})')
+        
+        try:
+            yield
+        finally:
+            with connection.cursor() as cursor:
+                for name, value in previous.items():
+                    if connection.vendor == 'postgresql':
+                        cursor.execute("SELECT set_config(%s, %s, false)", [name, value])
+                    else:
+                        cursor.execute(f"PRAGMA {name} = {value}")
+            if previous:
+                self.log_message('INFO', f'Load tuning: restored {", ".join(previous)}')
+    
+    def batch_savepoint(self):
+        """Savepoint around a batch's lookups inside a load transaction, so a failing query does not abort the rest"""
+        from django.db import connection
+        return transaction.atomic() if connection.in_atomic_block else contextlib.nullcontext()
+    
+    def run_in_transaction(self, step_function):
+        """Run an import step in one transaction with load tuning, otherwise with a commit per row"""
+        if not self.load_tuning:
+            return step_function()
+        with transaction.atomic():
+            return step_function()
+    
+    def run_step(self, step_function):
+        """Run an import step; with defer_indexes, its table loads without secondary indexes and FK checks
+        
+        The indexes are rebuilt and the table ANALYZEd afterwards; how long the
+        load, the rebuild and ANALYZE took is logged and kept in step_timings.
+        """
+        model = DEFERRED_INDEX_STEPS.get(step_function.__name__)
+        if not self.defer_indexes or model is None:
+            return self.run_in_transaction(step_function)
+        
+        from django.db import connection
+        table = model._meta.db_table
+        indexes, foreign_keys = self.suspend_indexes(table)
+        checks = f'{len(foreign_keys)} foreign keys' if connection.vendor == 'postgresql' else 'foreign key checks'
+        self.log_message('INFO', f'{table}: deferred {len(indexes)} indexes and {checks} for the load')
+        
+        start = time.perf_counter()
+        try:
+            return self.run_in_transaction(step_function)
+        finally:
+            loaded = time.perf_counter()
+            self.restore_indexes(table, indexes, foreign_keys)
+            rebuilt = time.perf_counter()
+            with connection.cursor() as cursor:
+                cursor.execute(f"ANALYZE {connection.ops.quote_name(table)}")
+            analyzed = time.perf_counter()
+            self.step_timings[table] = {
+                'load': loaded - start,
+                'rebuild': rebuilt - loaded,
+                'analyze': analyzed - rebuilt
+            }
+            self.log_message('INFO', f'{table}: load {loaded - start:.2f}s, index/constraint rebuild '
+                                     f'{rebuilt - loaded:.2f}s, ANALYZE {analyzed - rebuilt:.2f}s')
+    
     def validate_csv_file(self, filepath, expected_fields):
         """Validate CSV file structure"""
         if not os.path.exists(filepath):
@@ -169,6 +489,86 @@ class CSVImporter:
             self.log_message('ERROR', f'Error reading CSV file {filepath}: {str(e)}')
             return False
                 
+    def import_csv_rows(self, model, csv_file, build_object, describe, find_skipped=None):
+        """Insert the rows of a CSV file in bulk_create batches of IMPORT_BATCH_ROWS
+        
+        build_object turns a CSV row into an unsaved instance, describe names
+        a row in log messages and find_skipped(objects) returns
+        {position: reason} for rows that are already in the database.
+        Rows get ids in file order after the table's highest id, so the
+        generated foreign keys (row numbers from 1) still line up when an
+        earlier row fails. Rows with foreign keys to missing rows fail up
+        front, the rest go through insert_objects, which bisects a failing
+        batch down to its bad rows. Failed rows go to the rejects CSV.
+        
+        Returns (imported, failed, skipped).
+        """
+        from django.core.management.color import no_style
+        from django.db import connection
+        from django.db.models import Max
+        
+        table = model._meta.db_table
+        base_id = model.objects.aggregate(max_id=Max('id'))['max_id'] or 0
+        imported_count = 0
+        failed_count = 0
+        skipped_count = 0
+        
+        with open(csv_file, 'r', encoding='utf-8') as f:
+            numbered_rows = enumerate(csv.DictReader(f), 1)
+            while True:
+                batch = list(itertools.islice(numbered_rows, IMPORT_BATCH_ROWS))
+                if not batch:
+                    break
+                
+                rejected = []
+                objects = []
+                kept_rows = []
+                for i, row in batch:
+                    try:
+                        obj = build_object(row)
+                    except Exception as e:
+                        rejected.append((base_id + i, row, f'Invalid row {i} ({describe(row)}): {str(e)}'))
+                        continue
+                    obj.id = base_id + i
+                    objects.append(obj)
+                    kept_rows.append(row)
+                
+                try:
+                    # Lookups share a savepoint: a database error only fails this batch
+                    with self.batch_savepoint():
+                        skipped = find_skipped(objects) if find_skipped and objects else {}
+                        missing = self.missing_references(objects) if objects else {}
+                except Exception as e:
+                    skipped = {}
+                    missing = {position: f'Lookup failed: {str(e).strip()}' for position in range(len(objects))}
+                for position, reason in sorted(skipped.items()):
+                    self.log_message('WARNING', reason)
+                skipped_count += len(skipped)
+                rejected += [(objects[position].pk, kept_rows[position], f'{error} for {describe(kept_rows[position])}')
+                             for position, error in missing.items() if position not in skipped]
+                keep = [position for position in range(len(objects)) if position not in skipped and position not in missing]
+                objects = [objects[position] for position in keep]
+                kept_rows = [kept_rows[position] for position in keep]
+                
+                if objects:
+                    failures = self.insert_objects(objects)
+                    rejected += [(objects[position].pk, kept_rows[position],
+                                  f'Integrity error for {describe(kept_rows[position])}: {error}')
+                                 for position, error in failures]
+                    imported_count += len(objects) - len(failures)
+                
+                if rejected:
+                    self.reject_rows(table, rejected)
+                    failed_count += len(rejected)
+                self.log_message('INFO', f'Imported {imported_count} {table} rows...')
+        
+        # Explicit ids do not advance PostgreSQL sequences
+        with connection.cursor() as cursor:
+            for statement in connection.ops.sequence_reset_sql(no_style(), [model]):
+                cursor.execute(statement)
+        
+        return imported_count, failed_count, skipped_count
+    
     def import_users(self):
         def make_aware(date_str):
             if not date_str or date_str.strip() == '':
@@ -197,63 +597,40 @@ class CSVImporter:
             self.log_message('ERROR', 'User import aborted due to CSV validation failure')
             return False
         
-        imported_count = 0
-        failed_count = 0
-        skipped_count = 0
+        def build_user(row):
+            # Create user with already-hashed password
+            # We can't use create_user() because it expects plain text password
+            # Instead, we create the user object and set the password field directly
+            return User(
+                username=row['username'],
+                email=row['email'],
+                password=row['password'],  # Already hashed
+                first_name=row['first_name'],
+                last_name=row['last_name'],
+                # Convert string booleans to actual booleans
+                is_superuser=row['is_superuser'].lower() == 'true' or row['is_superuser'] == '1',
+                is_staff=row['is_staff'].lower() == 'true' or row['is_staff'] == '1',
+                is_active=row['is_active'].lower() == 'true' or row['is_active'] == '1',
+                date_joined=make_aware(row['date_joined']),
+                # Empty last_login becomes None
+                last_login=make_aware(row['last_login'])
+            )
+        
+        def existing_users(users):
+            # Check if users already exist (or came earlier in the batch)
+            existing = set(User.objects.filter(username__in=[user.username for user in users])
+                           .values_list('username', flat=True))
+            skipped = {}
+            for position, user in enumerate(users):
+                if user.username in existing:
+                    skipped[position] = f'User {user.username} already exists, skipping'
+                existing.add(user.username)
+            return skipped
         
         try:
-            with open(csv_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                
-                for i, row in enumerate(reader, 1):
-                    try:
-                        # Check if user already exists
-                        if User.objects.filter(username=row['username']).exists():
-                            self.log_message('WARNING', f'User {row["username"]} already exists, skipping')
-                            skipped_count += 1
-                            continue
-                        
-                        # Convert string booleans to actual booleans
-                        row['is_superuser'] = row['is_superuser'].lower() == 'true' or row['is_superuser'] == '1'
-                        row['is_staff'] = row['is_staff'].lower() == 'true' or row['is_staff'] == '1'
-                        row['is_active'] = row['is_active'].lower() == 'true' or row['is_active'] == '1'
-                        
-                        # Convert empty last_login to None
-                        if not row['last_login'] or row['last_login'].strip() == '':
-                            row['last_login'] = None
-                                            
-                        # Create user with already-hashed password
-                        # We can't use create_user() because it expects plain text password
-                        # Instead, we create the user object and set the password field directly
-                        user = User(
-                            username=row['username'],
-                            email=row['email'],
-                            password=row['password'],  # Already hashed
-                            first_name=row['first_name'],
-                            last_name=row['last_name'],
-                            is_superuser=row['is_superuser'],
-                            is_staff=row['is_staff'],
-                            is_active=row['is_active'],
-                            date_joined=make_aware(row['date_joined'])
-                        )
-                        
-                        # Set last_login if provided
-                        if row['last_login']:
-                            user.last_login = make_aware(row['last_login'])
-                        
-                        # Save the user
-                        user.save()
-                        
-                        imported_count += 1
-                        if imported_count % 10 == 0:
-                            self.log_message('INFO', f'Imported {imported_count} users...')
-                            
-                    except IntegrityError as e:
-                        self.log_message('ERROR', f'Integrity error for user {row.get("username", "Unknown")}: {str(e)}')
-                        failed_count += 1
-                    except Exception as e:
-                        self.log_message('ERROR', f'Error importing user row {i}: {str(e)}')
-                        failed_count += 1
+            imported_count, failed_count, skipped_count = self.import_csv_rows(
+                User, csv_file, build_user, lambda row: f'user {row.get("username", "Unknown")}', existing_users
+            )
             
             self.log_message('SUCCESS', f'User import completed: {imported_count} imported, {failed_count} failed, {skipped_count} skipped')
             self.import_stats['success'] += imported_count
@@ -284,59 +661,40 @@ class CSVImporter:
             self.log_message('ERROR', 'Company import aborted due to CSV validation failure')
             return False
         
-        imported_count = 0
-        failed_count = 0
-        skipped_count = 0
+        def build_company(row):
+            return Company(
+                name=row['name'],
+                logo=row['logo'],
+                industry=row['industry'],
+                serivces=row['serivces'],
+                description=row['description'],
+                phone=row['phone'],
+                email=row['email'],
+                create_date=row['create_date'],
+                user_id=int(row['user_id'])
+            )
+        
+        def existing_companies(companies):
+            # Check if the company (by email) exists or its user already has a company
+            emails = set(Company.objects.filter(email__in=[company.email for company in companies])
+                         .values_list('email', flat=True))
+            owners = set(Company.objects.filter(user_id__in=[company.user_id for company in companies])
+                         .values_list('user_id', flat=True))
+            skipped = {}
+            for position, company in enumerate(companies):
+                if company.email in emails:
+                    skipped[position] = f'Company with email {company.email} already exists, skipping'
+                elif company.user_id in owners:
+                    skipped[position] = f'User with ID {company.user_id} already has a company, skipping'
+                emails.add(company.email)
+                owners.add(company.user_id)
+            return skipped
         
         try:
-            with open(csv_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                
-                for i, row in enumerate(reader, 1):
-                    try:
-                        # Check if company already exists by email
-                        if Company.objects.filter(email=row['email']).exists():
-                            self.log_message('WARNING', f'Company with email {row["email"]} already exists, skipping')
-                            skipped_count += 1
-                            continue
-                        
-                        # Get the user
-                        try:
-                            user = User.objects.get(id=int(row['user_id']))
-                        except User.DoesNotExist:
-                            self.log_message('ERROR', f'User with ID {row["user_id"]} not found for company {row["name"]}')
-                            failed_count += 1
-                            continue
-                        
-                        # Check if user already has a company
-                        if Company.objects.filter(user=user).exists():
-                            self.log_message('WARNING', f'User {user.username} already has a company, skipping')
-                            skipped_count += 1
-                            continue
-                        
-                        # Create company
-                        company = Company.objects.create(
-                            name=row['name'],
-                            logo=row['logo'],
-                            industry=row['industry'],
-                            serivces=row['serivces'],
-                            description=row['description'],
-                            phone=row['phone'],
-                            email=row['email'],
-                            create_date=row['create_date'],
-                            user=user
-                        )
-                        
-                        imported_count += 1
-                        if imported_count % 5 == 0:
-                            self.log_message('INFO', f'Imported {imported_count} companies...')
-                            
-                    except IntegrityError as e:
-                        self.log_message('ERROR', f'Integrity error for company {row.get("name", "Unknown")}: {str(e)}')
-                        failed_count += 1
-                    except Exception as e:
-                        self.log_message('ERROR', f'Error importing company row {i}: {str(e)}')
-                        failed_count += 1
+            imported_count, failed_count, skipped_count = self.import_csv_rows(
+                Company, csv_file, build_company, lambda row: f'company {row.get("name", "Unknown")}',
+                existing_companies
+            )
             
             self.log_message('SUCCESS', f'Company import completed: {imported_count} imported, {failed_count} failed, {skipped_count} skipped')
             self.import_stats['success'] += imported_count
@@ -367,50 +725,24 @@ class CSVImporter:
             self.log_message('ERROR', 'Listing import aborted due to CSV validation failure')
             return False
         
-        imported_count = 0
-        failed_count = 0
-        skipped_count = 0
+        def build_listing(row):
+            return Listing(
+                company_id=int(row['company_id']),
+                title=row['title'],
+                industry=row['industry'],
+                budget=row['budget'],
+                duration=row['duration'],
+                description=row['description'],
+                requirement=row['requirement'],
+                publish_date=row['publish_date'],
+                # Convert is_active to boolean
+                is_active=row['is_active'].lower() == 'true' or row['is_active'] == '1'
+            )
         
         try:
-            with open(csv_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                
-                for i, row in enumerate(reader, 1):
-                    try:
-                        # Get the company
-                        try:
-                            company = Company.objects.get(id=int(row['company_id']))
-                        except Company.DoesNotExist:
-                            self.log_message('ERROR', f'Company with ID {row["company_id"]} not found for listing {row["title"]}')
-                            failed_count += 1
-                            continue
-                        
-                        # Convert is_active to boolean
-                        is_active = row['is_active'].lower() == 'true' or row['is_active'] == '1'
-                        
-                        # Create listing
-                        listing = Listing.objects.create(
-                            company=company,
-                            title=row['title'],
-                            industry=row['industry'],
-                            budget=row['budget'],
-                            duration=row['duration'],
-                            description=row['description'],
-                            requirement=row['requirement'],
-                            publish_date=row['publish_date'],
-                            is_active=is_active
-                        )
-                        
-                        imported_count += 1
-                        if imported_count % 10 == 0:
-                            self.log_message('INFO', f'Imported {imported_count} listings...')
-                            
-                    except IntegrityError as e:
-                        self.log_message('ERROR', f'Integrity error for listing {row.get("title", "Unknown")}: {str(e)}')
-                        failed_count += 1
-                    except Exception as e:
-                        self.log_message('ERROR', f'Error importing listing row {i}: {str(e)}')
-                        failed_count += 1
+            imported_count, failed_count, skipped_count = self.import_csv_rows(
+                Listing, csv_file, build_listing, lambda row: f'listing {row.get("title", "Unknown")}'
+            )
             
             self.log_message('SUCCESS', f'Listing import completed: {imported_count} imported, {failed_count} failed, {skipped_count} skipped')
             self.import_stats['success'] += imported_count
@@ -441,54 +773,22 @@ class CSVImporter:
             self.log_message('ERROR', 'Apply import aborted due to CSV validation failure')
             return False
         
-        imported_count = 0
-        failed_count = 0
-        skipped_count = 0
+        def build_apply(row):
+            return Apply(
+                listing_id=int(row['listing_id']),
+                name=row['name'],
+                email=row['email'],
+                phone=row['phone'],
+                message=row['message'],
+                cv=row['cv'],
+                apply_date=row['apply_date'],
+                user_id=int(row['user_id'])
+            )
         
         try:
-            with open(csv_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                
-                for i, row in enumerate(reader, 1):
-                    try:
-                        # Get the listing
-                        try:
-                            listing = Listing.objects.get(id=int(row['listing_id']))
-                        except Listing.DoesNotExist:
-                            self.log_message('ERROR', f'Listing with ID {row["listing_id"]} not found for apply from {row["name"]}')
-                            failed_count += 1
-                            continue
-                        
-                        # Get the user
-                        try:
-                            user = User.objects.get(id=int(row['user_id']))
-                        except User.DoesNotExist:
-                            self.log_message('ERROR', f'User with ID {row["user_id"]} not found for apply from {row["name"]}')
-                            failed_count += 1
-                            continue
-                        
-                        # Create apply
-                        apply = Apply.objects.create(
-                            listing=listing,
-                            name=row['name'],
-                            email=row['email'],
-                            phone=row['phone'],
-                            message=row['message'],
-                            cv=row['cv'],
-                            apply_date=row['apply_date'],
-                            user=user
-                        )
-                        
-                        imported_count += 1
-                        if imported_count % 10 == 0:
-                            self.log_message('INFO', f'Imported {imported_count} applications...')
-                            
-                    except IntegrityError as e:
-                        self.log_message('ERROR', f'Integrity error for apply from {row.get("name", "Unknown")}: {str(e)}')
-                        failed_count += 1
-                    except Exception as e:
-                        self.log_message('ERROR', f'Error importing apply row {i}: {str(e)}')
-                        failed_count += 1
+            imported_count, failed_count, skipped_count = self.import_csv_rows(
+                Apply, csv_file, build_apply, lambda row: f'apply from {row.get("name", "Unknown")}'
+            )
             
             self.log_message('SUCCESS', f'Apply import completed: {imported_count} imported, {failed_count} failed, {skipped_count} skipped')
             self.import_stats['success'] += imported_count
@@ -502,52 +802,277 @@ class CSVImporter:
             self.log_message('ERROR', f'Fatal error during apply import: {str(e)}')
             return False
     
-    def validate_import(self):
+    def start_stream(self):
+        """Prepare insert_batch after clear_existing_data, which keeps superusers
+        
+        Generated user ids start at 1 and would collide with (or, for foreign
+        keys, silently point to) the kept superusers, so streamed user ids and
+        the user_id of companies and applies are shifted past the highest
+        remaining user id.
+        """
+        from django.db.models import Max
+        
+        self.stream_user_offset = User.objects.aggregate(max_id=Max('id'))['max_id'] or 0
+        if self.stream_user_offset:
+            self.log_message('WARNING', f'{User.objects.count()} users kept by clearing; streamed user ids are shifted '
+                                        f'by {self.stream_user_offset} (CSV user ids + {self.stream_user_offset})')
+    
+    def stream_object(self, table, row, row_id):
+        """Model instance for a typed row streamed by generate_dummy_data.py --stream"""
+        user_offset = self.stream_user_offset
+        if table == 'auth_user':
+            return User(
+                id=row['id'] + user_offset,
+                username=row['username'],
+                email=row['email'],
+                password=row['password'],  # Already hashed
+                first_name=row['first_name'],
+                last_name=row['last_name'],
+                is_superuser=row['is_superuser'],
+                is_staff=row['is_staff'],
+                is_active=row['is_active'],
+                # Same UTC interpretation as import_users
+                date_joined=timezone.make_aware(row['date_joined'], pytz.UTC),
+                last_login=timezone.make_aware(row['last_login'], pytz.UTC) if row['last_login'] else None
+            )
+        if table == 'companies_company':
+            return Company(id=row_id, user_id=row['user_id'] + user_offset, name=row['name'], logo=row['logo'],
+                           industry=row['industry'], serivces=row['serivces'], description=row['description'],
+                           phone=row['phone'], email=row['email'], create_date=row['create_date'])
+        if table == 'listings_listing':
+            return Listing(id=row_id, company_id=row['company_id'], title=row['title'], industry=row['industry'],
+                           budget=row['budget'], duration=row['duration'], description=row['description'],
+                           requirement=row['requirement'], publish_date=row['publish_date'],
+                           is_active=row['is_active'])
+        if table == 'applies_apply':
+            return Apply(id=row_id, listing_id=row['listing_id'], user_id=row['user_id'] + user_offset, name=row['name'],
+                         email=row['email'], phone=row['phone'], message=row['message'], cv=row['cv'],
+                         apply_date=row['apply_date'])
+        raise ValueError(f'Unknown table {table}')
+    
+    def missing_references(self, objects):
+        """Errors by position for objects whose foreign keys point to missing rows (one query per foreign key)"""
+        errors = {}
+        for field in type(objects[0])._meta.concrete_fields:
+            if not field.is_relation:
+                continue
+            ids = {getattr(obj, field.attname) for obj in objects} - {None}
+            existing = set(field.related_model._base_manager.filter(pk__in=ids).values_list('pk', flat=True))
+            for position, obj in enumerate(objects):
+                value = getattr(obj, field.attname)
+                if value is not None and value not in existing:
+                    errors.setdefault(position, f'{field.related_model.__name__} with ID {value} not found')
+        return errors
+    
+    def insert_bisecting(self, model, objects, offset=0):
+        """bulk_create objects in a savepoint; if that fails, retry each half the same way
+        
+        Returns (position, error) for every row that fails on its own, so k bad
+        rows cost about k * log2(batch size) extra statements instead of one
+        round trip per row.
+        """
+        try:
+            with transaction.atomic():
+                model.objects.bulk_create(objects)
+            return []
+        except Exception as e:
+            if len(objects) == 1:
+                return [(offset, str(e).strip())]
+            half = len(objects) // 2
+            return (self.insert_bisecting(model, objects[:half], offset) +
+                    self.insert_bisecting(model, objects[half:], offset + half))
+    
+    def insert_objects(self, objects):
+        """Insert objects of one model with insert_bisecting in a transaction (a savepoint inside a load transaction)
+
+        Returns (position, error) for every row that could not be inserted.
+        """
+        from django.db import connection
+
+        try:
+            with transaction.atomic():
+                if connection.vendor == 'postgresql':
+                    # Django's foreign keys are deferred to COMMIT; check them per statement
+                    # so a violation fails its savepoint instead of the whole batch
+                    with connection.cursor() as cursor:
+                        cursor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+                return self.insert_bisecting(type(objects[0]), objects)
+        except Exception as e:
+            # The batch failed at COMMIT (e.g. a deferred check on SQLite); nothing of it was stored
+            return [(position, f'Batch commit failed: {str(e)}') for position in range(len(objects))]
+
+    def reject_rows(self, table, rejected):
+        """Write rows that could not be inserted to the rejects CSV, each with its error"""
+        if self.rejects_writer is None:
+            self.rejects_file = open(self.rejects_path, 'w', newline='', encoding='utf-8')
+            self.rejects_writer = csv.writer(self.rejects_file)
+            self.rejects_writer.writerow(['table', 'id', 'error', 'row'])
+        for row_id, row, error in rejected:
+            self.rejects_writer.writerow([table, row_id, error, json.dumps(row, default=str)])
+            self.log_message('ERROR', f'Rejected {table} row: {error}', record_id=row_id)
+        self.rejects_file.flush()
+        self.rejected_count += len(rejected)
+    
+    def close_rejects(self):
+        """Close the rejects CSV if any row was rejected"""
+        if self.rejects_file is not None:
+            self.rejects_file.close()
+            self.rejects_file = None
+            self.rejects_writer = None
+            self.log_message('WARNING', f'{self.rejected_count} rejected rows written to {self.rejects_path}')
+
+    def insert_batch(self, table, rows):
+        """Bulk insert a batch of typed rows streamed by generate_dummy_data.py --stream
+        
+        Rows carry datetimes and bools instead of CSV strings, so nothing is
+        parsed. Users keep their generated ids (shifted past kept superusers,
+        see start_stream); companies, listings and applies get consecutive
+        ids in stream order, which is what the generated foreign keys refer
+        to, so those tables must start empty.
+        
+        Bad rows do not fail the batch: rows that cannot be built or whose
+        foreign keys point to missing rows are set aside up front, the rest is
+        inserted by insert_objects, and every rejected row goes to the
+        rejects CSV with its error. Rejected rows keep their ids, so rows
+        referencing them are rejected too.
+        """
+        first_id = self.stream_ids.get(table, 0) + 1
+        self.stream_ids[table] = first_id + len(rows) - 1
+        
+        rejected = []
+        objects = []
+        kept_rows = []
+        for offset, row in enumerate(rows):
+            try:
+                objects.append(self.stream_object(table, row, first_id + offset))
+                kept_rows.append(row)
+            except Exception as e:
+                rejected.append((row.get('id', first_id + offset), row, f'Invalid row: {str(e)}'))
+        
+        if objects:
+            missing = self.missing_references(objects)
+            rejected += [(objects[position].pk, kept_rows[position], error) for position, error in missing.items()]
+            objects = [obj for position, obj in enumerate(objects) if position not in missing]
+            kept_rows = [row for position, row in enumerate(kept_rows) if position not in missing]
+        
+        if objects:
+            failures = self.insert_objects(objects)
+            rejected += [(objects[position].pk, kept_rows[position], error) for position, error in failures]
+        
+        inserted = len(rows) - len(rejected)
+        self.import_stats['success'] += inserted
+        self.import_stats['failed'] += len(rejected)
+        self.import_stats['total'] += len(rows)
+        if rejected:
+            self.reject_rows(table, rejected)
+            self.log_message('WARNING', f'Inserted {inserted} rows into {table}, rejected {len(rejected)}')
+        else:
+            self.log_message('INFO', f'Inserted {inserted} rows into {table}')
+    
+    def finish_stream(self):
+        """Move the id sequences past the streamed ids and release the inserting thread's connection"""
+        from django.core.management.color import no_style
+        from django.db import connection
+        
+        with connection.cursor() as cursor:
+            for statement in connection.ops.sequence_reset_sql(no_style(), [User, Company, Listing, Apply]):
+                cursor.execute(statement)
+        connection.close()
+        self.close_rejects()
+        self.log_message('SUCCESS', f'Stream import completed: {self.import_stats["success"]} inserted, '
+                                    f'{self.import_stats["failed"]} failed')
+    
+    def collect_counts(self, estimate=False):
+        """Row counts and relationship checks for every table, one aggregate query per table
+        
+        With estimate=True on PostgreSQL the totals come from pg_class.reltuples
+        (as of the last ANALYZE) and the per-row checks are skipped, so nothing
+        scans the tables. The result is kept in self.table_counts and shared by
+        validate_import and generate_report.
+        """
+        from django.db import connection
+        
+        if estimate and connection.vendor == 'postgresql':
+            models = {'User': User, 'Company': Company, 'Listing': Listing, 'Apply': Apply}
+            counts = {}
+            with connection.cursor() as cursor:
+                for name, model in models.items():
+                    # to_regclass resolves the name through the search_path, like the ORM's queries
+                    cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)",
+                                   [connection.ops.quote_name(model._meta.db_table)])
+                    row = cursor.fetchone()
+                    # reltuples is -1 until the table is first analyzed
+                    if row is None or row[0] < 0:
+                        counts[name] = {'total': model.objects.count()}
+                    else:
+                        counts[name] = {'total': row[0], 'estimated': True}
+            self.table_counts = counts
+            return counts
+        if estimate:
+            self.log_message('WARNING', f'Estimated counts need PostgreSQL, counting {connection.vendor} tables exactly')
+        
+        self.table_counts = {
+            'User': User.objects.aggregate(total=Count('id')),
+            'Company': Company.objects.aggregate(
+                total=Count('id'),
+                without_user=Count('id', filter=Q(user__isnull=True))
+            ),
+            'Listing': Listing.objects.aggregate(
+                total=Count('id'),
+                active=Count('id', filter=Q(is_active=True)),
+                inactive=Count('id', filter=Q(is_active=False)),
+                without_company=Count('id', filter=Q(company__isnull=True))
+            ),
+            'Apply': Apply.objects.aggregate(
+                total=Count('id'),
+                without_listing=Count('id', filter=Q(listing__isnull=True)),
+                without_user=Count('id', filter=Q(user__isnull=True))
+            )
+        }
+        return self.table_counts
+    
+    def validate_import(self, estimate=False):
         """Validate that import was successful by checking counts"""
         self.log_message('INFO', '=' * 50)
         self.log_message('INFO', 'VALIDATING IMPORT RESULTS')
         self.log_message('INFO', '=' * 50)
         
-        validation_results = {}
-        
         # Count actual records in database
         try:
-            validation_results['User'] = User.objects.count()
-            validation_results['Company'] = Company.objects.count()
-            validation_results['Listing'] = Listing.objects.count()
-            validation_results['Apply'] = Apply.objects.count()
+            counts = self.collect_counts(estimate)
+            validation_results = {name: table['total'] for name, table in counts.items()}
+            approximate = '~' if any(table.get('estimated') for table in counts.values()) else ''
+            listings = counts['Listing']
             
-            # Count active vs inactive listings
-            active_listings = Listing.objects.filter(is_active=True).count()
-            inactive_listings = Listing.objects.filter(is_active=False).count()
+            self.log_message('INFO', f'Database counts after import{" (estimated from pg_class)" if approximate else ""}:')
+            self.log_message('INFO', f'  Users: {approximate}{validation_results["User"]}')
+            self.log_message('INFO', f'  Companies: {approximate}{validation_results["Company"]}')
+            if 'active' in listings:
+                self.log_message('INFO', f'  Listings: {validation_results["Listing"]} ({listings["active"]} active, {listings["inactive"]} inactive)')
+            else:
+                self.log_message('INFO', f'  Listings: {approximate}{validation_results["Listing"]}')
+            self.log_message('INFO', f'  Applications: {approximate}{validation_results["Apply"]}')
             
-            self.log_message('INFO', f'Database counts after import:')
-            self.log_message('INFO', f'  Users: {validation_results["User"]}')
-            self.log_message('INFO', f'  Companies: {validation_results["Company"]}')
-            self.log_message('INFO', f'  Listings: {validation_results["Listing"]} ({active_listings} active, {inactive_listings} inactive)')
-            self.log_message('INFO', f'  Applications: {validation_results["Apply"]}')
+            if approximate:
+                self.log_message('INFO', 'Relationship checks skipped with estimated counts')
+                return validation_results
             
             # Check relationships
             self.log_message('INFO', 'Checking relationships...')
             
             # Check companies without users
-            companies_without_users = Company.objects.filter(user__isnull=True).count()
-            if companies_without_users > 0:
-                self.log_message('WARNING', f'{companies_without_users} companies have no associated user')
+            if counts['Company']['without_user'] > 0:
+                self.log_message('WARNING', f'{counts["Company"]["without_user"]} companies have no associated user')
             
             # Check listings without companies
-            listings_without_companies = Listing.objects.filter(company__isnull=True).count()
-            if listings_without_companies > 0:
-                self.log_message('WARNING', f'{listings_without_companies} listings have no associated company')
+            if listings['without_company'] > 0:
+                self.log_message('WARNING', f'{listings["without_company"]} listings have no associated company')
             
             # Check applies without listings or users
-            applies_without_listings = Apply.objects.filter(listing__isnull=True).count()
-            applies_without_users = Apply.objects.filter(user__isnull=True).count()
-            
-            if applies_without_listings > 0:
-                self.log_message('WARNING', f'{applies_without_listings} applications have no associated listing')
-            if applies_without_users > 0:
-                self.log_message('WARNING', f'{applies_without_users} applications have no associated user')
+            if counts['Apply']['without_listing'] > 0:
+                self.log_message('WARNING', f'{counts["Apply"]["without_listing"]} applications have no associated listing')
+            if counts['Apply']['without_user'] > 0:
+                self.log_message('WARNING', f'{counts["Apply"]["without_user"]} applications have no associated user')
             
             return validation_results
             
@@ -578,13 +1103,25 @@ DATABASE COUNTS:
 """
         
         try:
-            report += f"Users: {User.objects.count()}\n"
-            report += f"Companies: {Company.objects.count()}\n"
-            report += f"Listings: {Listing.objects.count()}\n"
-            report += f"Applications: {Apply.objects.count()}\n"
+            # Reuse the counts of validate_import when it ran
+            counts = self.table_counts or self.collect_counts()
+            for label, name in (('Users', 'User'), ('Companies', 'Company'), ('Listings', 'Listing'), ('Applications', 'Apply')):
+                approximate = ' (estimated)' if counts[name].get('estimated') else ''
+                report += f"{label}: {counts[name]['total']}{approximate}\n"
         except Exception as e:
             report += f"Error getting counts: {str(e)}\n"
         
+        if self.tuning_report:
+            report += "\nLOAD TUNING (restored after the import):\n----------------------------------------\n"
+            for name, before, during in self.tuning_report:
+                report += f"{name}: {during} (was {before})\n"
+        
+        if self.step_timings:
+            report += "\nDEFERRED INDEX STEPS:\n---------------------\n"
+            for table, timings in self.step_timings.items():
+                report += (f"{table}: load {timings['load']:.2f}s, rebuild {timings['rebuild']:.2f}s, "
+                           f"ANALYZE {timings['analyze']:.2f}s\n")
+        
         report += f"""
 LOG FILE:
 ---------
@@ -600,7 +1137,7 @@ Import log saved to: import_log.txt (in project root)
         
         return report
     
-    def run_import(self, clear_existing=False):
+    def run_import(self, clear_existing=False, bulk_clear=True, estimate_counts=False):
         """Run the complete import process"""
         print("\n" + "=" * 60)
         print("📥 CSV TO POSTGRESQL IMPORT SCRIPT")
@@ -615,11 +1152,11 @@ Import log saved to: import_log.txt (in project root)
         
         # Clear existing data if requested
         if clear_existing:
-            if not self.clear_existing_data():
+            if not self.clear_existing_data(bulk=bulk_clear):
                 return False
         else:
             # Just check if we have data
-            self.clear_existing_data(confirm=False)
+            self.clear_existing_data(confirm=False, bulk=bulk_clear)
         
         # Import in correct order (respecting foreign key constraints)
         import_steps = [
@@ -643,25 +1180,27 @@ Import log saved to: import_log.txt (in project root)
         
         # Execute import steps
         all_successful = True
-        for step_name, step_function in import_steps:
-            print(f"\n{'='*60}")
-            print(f"Step: {step_name}")
-            print(f"{'='*60}")
+        with self.tuned_session():
+            for step_name, step_function in import_steps:
+                print(f"\n{'='*60}")
+                print(f"Step: {step_name}")
+                print(f"{'='*60}")
             
-            if not step_function():
-                self.log_message('ERROR', f'{step_name} import failed!')
-                # Ask whether to continue
-                response = input(f"\n⚠️  {step_name} import had issues. Continue? (yes/no): ")
-                if response.lower() != 'yes':
-                    self.log_message('INFO', f'Import stopped after {step_name}')
-                    all_successful = False
-                    break
-            else:
-                self.log_message('SUCCESS', f'{step_name} import completed')
+                if not self.run_step(step_function):
+                    self.log_message('ERROR', f'{step_name} import failed!')
+                    # Ask whether to continue
+                    response = input(f"\n⚠️  {step_name} import had issues. Continue? (yes/no): ")
+                    if response.lower() != 'yes':
+                        self.log_message('INFO', f'Import stopped after {step_name}')
+                        all_successful = False
+                        break
+                else:
+                    self.log_message('SUCCESS', f'{step_name} import completed')
+        self.close_rejects()
         
         # Validate import results
         if all_successful:
-            self.validate_import()
+            self.validate_import(estimate=estimate_counts)
             self.generate_report()
             
             print("\n" + "=" * 60)
@@ -716,11 +1255,24 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Import CSV data into Django PostgreSQL database')
     parser.add_argument('--test', action='store_true', help='Test database connection only')
     parser.add_argument('--clear', action='store_true', help='Clear existing data before import')
+    parser.add_argument('--orm-clear', action='store_true',
+                        help='With --clear, delete through the ORM instead of TRUNCATE / set-based DELETEs')
+    parser.add_argument('--defer-indexes', action='store_true',
+                        help='Load listings and applies without secondary indexes and FK checks, then rebuild and ANALYZE')
+    parser.add_argument('--estimate-counts', action='store_true',
+                        help='Validate with row estimates from pg_class instead of counting (PostgreSQL, very large tables)')
+    parser.add_argument('--load-tuning', action='store_true',
+                        help='Import each step in one transaction with session-level tuning (synchronous_commit off, '
+                             'SQLite journal/synchronous PRAGMAs), restored afterwards')
+    parser.add_argument('--load-memory-mb', type=int, default=None,
+                        help='With --load-tuning, work_mem/maintenance_work_mem (PostgreSQL) or page cache (SQLite) in MB')
     parser.add_argument('--dir', type=str, default='dummy_data', help='Directory containing CSV files')
     parser.add_argument('--step', type=str, choices=['users', 'companies', 'listings', 'applies'],
                         help='Import only specific step')
     
     args = parser.parse_args()
+    if args.load_memory_mb is not None and not args.load_tuning:
+        parser.error('--load-memory-mb requires --load-tuning')
     
     # Run connection test
     if args.test:
@@ -731,7 +1283,8 @@ if __name__ == "__main__":
         sys.exit(0)
     
     # Create importer instance
-    importer = CSVImporter(csv_dir=args.dir)
+    importer = CSVImporter(csv_dir=args.dir, defer_indexes=args.defer_indexes,
+                           load_tuning=args.load_tuning, load_memory_mb=args.load_memory_mb)
     
     # Run specific step or full import
     if args.step:
@@ -742,14 +1295,15 @@ if __name__ == "__main__":
             sys.exit(1)
         
         # Run specific step
-        if args.step == 'users':
-            success = importer.import_users()
-        elif args.step == 'companies':
-            success = importer.import_companies()
-        elif args.step == 'listings':
-            success = importer.import_listings()
-        elif args.step == 'applies':
-            success = importer.import_applies()
+        with importer.tuned_session():
+            if args.step == 'users':
+                success = importer.run_step(importer.import_users)
+            elif args.step == 'companies':
+                success = importer.run_step(importer.import_companies)
+            elif args.step == 'listings':
+                success = importer.run_step(importer.import_listings)
+            elif args.step == 'applies':
+                success = importer.run_step(importer.import_applies)
         
         if success:
             print(f"\n✅ {args.step.capitalize()} import completed!")
@@ -758,6 +1312,7 @@ if __name__ == "__main__":
             sys.exit(1)
     else:
         # Run full import
-        success = importer.run_import(clear_existing=args.clear)
+        success = importer.run_import(clear_existing=args.clear, bulk_clear=not args.orm_clear,
+                                       estimate_counts=args.estimate_counts)
         if not success:
             sys.exit(1)
\ No newline at end of file
@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+"""
+Media manifest for generated CV PDFs and company logos.
+generate_dummy_data.py writes dummy_data/media_manifest.csv (path, size, sha256)
+next to the CSV files, from the bytes it wrote to each file, and this script
+verifies the media on disk against it so truncated PDFs or half-written logos
+are caught, not just missing files.
+"""
+
+import os
+import csv
+import sys
+import json
+import hashlib
+import itertools
+from pathlib import Path
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+MANIFEST_FIELDS = ["path", "size", "sha256"]
+MANIFEST_FILENAME = 'media_manifest.csv'
+STATE_FILENAME = 'media_manifest_state.json'
+
+# Threads hashing files, and manifest rows handed to them at a time
+DEFAULT_WORKERS = 8
+VERIFY_BATCH_SIZE = 10000
+CHUNK_SIZE = 1024 * 1024
+
+# Size recorded for paths the generator referenced but never wrote (e.g. placeholder logos)
+NOT_WRITTEN_SIZE = -1
+
+def compute_checksum(filepath):
+    """Compute the SHA-256 checksum of a file, reading it in chunks"""
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def media_entry(relative_path, data):
+    """Manifest row for a media file, from the bytes written to it"""
+    return {"path": relative_path, "size": len(data), "sha256": hashlib.sha256(data).hexdigest()}
+
+def write_manifest(relative_paths, written, manifest_path, append=False):
+    """Write a manifest for the given media paths
+
+    written maps every path the generator wrote to its media_entry, so the
+    files are not read back. Paths are de-duplicated (several applies can
+    share one CV file). Paths that were never written, such as fallback
+    placeholder logos, are recorded without a checksum so verification
+    reports them as missing.
+    With append=True the entries of an existing manifest are kept unless the
+    path is among the new ones.
+    Returns the number of files recorded and the list of paths with no file.
+    """
+    unique_paths = sorted({path for path in relative_paths if path})
+    skipped = []
+    recorded = 0
+
+    kept_entries = []
+    if append and os.path.exists(manifest_path):
+        new_paths = set(unique_paths)
+        kept_entries = [entry for entry in read_manifest(manifest_path) if entry["path"] not in new_paths]
+
+    os.makedirs(os.path.dirname(manifest_path) or '.', exist_ok=True)
+
+    with open(manifest_path, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=MANIFEST_FIELDS)
+        writer.writeheader()
+        writer.writerows(kept_entries)
+
+        for path in unique_paths:
+            entry = written.get(path)
+            if entry is None:
+                writer.writerow({"path": path, "size": NOT_WRITTEN_SIZE, "sha256": ""})
+                skipped.append(path)
+            else:
+                writer.writerow(entry)
+                recorded += 1
+
+    if kept_entries:
+        print(f"Kept {len(kept_entries)} existing media manifest entries")
+    print(f"Generated media manifest with {recorded} files in {manifest_path}")
+    if skipped:
+        print(f"  ⚠️  {len(skipped)} paths have no file on disk (placeholders); verification reports them as missing")
+
+    return recorded, skipped
+
+def read_manifest(manifest_path):
+    """Stream manifest rows"""
+    with open(manifest_path, 'r', encoding='utf-8') as csvfile:
+        for row in csv.DictReader(csvfile):
+            row['size'] = int(row['size'])
+            yield row
+
+def load_state(state_path):
+    """Load {path: [size, mtime_ns, sha256]} for files verified on a previous run"""
+    if not state_path or not os.path.exists(state_path):
+        return {}
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (ValueError, OSError) as e:
+        print(f"Warning: Ignoring unreadable verification state {state_path}: {e}")
+        return {}
+
+def save_state(state_path, state):
+    """Save the verification state for the next incremental run"""
+    with open(state_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f)
+
+def verify_entry(base_dir, entry, previous, incremental=True):
+    """Verify one manifest entry against the file on disk
+
+    Returns (status, stat) where status is one of ok, unchanged, missing,
+    not_generated, size_mismatch or checksum_mismatch, and stat is
+    [size, mtime_ns] or None.
+    """
+    full_path = os.path.join(base_dir, entry['path'])
+    try:
+        stat = os.stat(full_path)
+    except OSError:
+        return 'missing', None
+
+    file_stat = [stat.st_size, stat.st_mtime_ns]
+    # A file appeared where the generator only referenced a placeholder; there is nothing to check it against
+    if entry['size'] == NOT_WRITTEN_SIZE:
+        return 'not_generated', file_stat
+    if stat.st_size != entry['size']:
+        return 'size_mismatch', file_stat
+
+    # Skip hashing when size and mtime match the last successful verification
+    if incremental and previous == file_stat + [entry['sha256']]:
+        return 'unchanged', file_stat
+
+    if compute_checksum(full_path) != entry['sha256']:
+        return 'checksum_mismatch', file_stat
+    return 'ok', file_stat
+
+def verify_manifest(manifest_path, base_dir, state_path=None, incremental=True, max_workers=DEFAULT_WORKERS):
+    """Verify media files against a manifest in parallel
+
+    In incremental mode files whose size and mtime have not changed since the
+    last verified run are not re-hashed. Returns a Counter of statuses and the
+    list of (status, path) problems.
+    """
+    print(f"\nVerifying media against {manifest_path}...")
+
+    if not os.path.exists(manifest_path):
+        print(f"Error: Manifest not found: {manifest_path}")
+        return None, []
+
+    previous_state = load_state(state_path) if incremental else {}
+    new_state = {}
+    results = Counter()
+    problems = []
+
+    entries = read_manifest(manifest_path)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            batch = list(itertools.islice(entries, VERIFY_BATCH_SIZE))
+            if not batch:
+                break
+
+            outcomes = executor.map(
+                lambda entry: verify_entry(base_dir, entry, previous_state.get(entry['path']), incremental),
+                batch
+            )
+            for entry, (status, file_stat) in zip(batch, outcomes):
+                results[status] += 1
+                if status in ('ok', 'unchanged'):
+                    new_state[entry['path']] = file_stat + [entry['sha256']]
+                else:
+                    problems.append((status, entry['path']))
+
+    if state_path:
+        save_state(state_path, new_state)
+
+    print(f"  Total files in manifest: {sum(results.values())}")
+    print(f"  Verified (checksum): {results['ok']}")
+    print(f"  Unchanged since last run: {results['unchanged']}")
+    print(f"  Missing files: {results['missing']}")
+    print(f"  Placeholders with an unrecorded file: {results['not_generated']}")
+    print(f"  Size mismatches (truncated?): {results['size_mismatch']}")
+    print(f"  Checksum mismatches: {results['checksum_mismatch']}")
+
+    if problems:
+        print(f"  First 5 problems:")
+        for status, path in problems[:5]:
+            print(f"    {status}: {path}")
+    else:
+        print("✓ All media files match the manifest")
+
+    return results, problems
+
+def main():
+    import argparse
+
+    project_root = Path(__file__).resolve().parent.parent
+
+    parser = argparse.ArgumentParser(description='Verify generated CV and logo files against the media manifest')
+    parser.add_argument('--manifest', type=str, default=str(project_root / 'dummy_data' / MANIFEST_FILENAME),
+                        help='Manifest CSV written by generate_dummy_data.py')
+    parser.add_argument('--base-dir', type=str, default=str(project_root),
+                        help='Directory the manifest paths are relative to')
+    parser.add_argument('--full', action='store_true',
+                        help='Re-hash every file instead of skipping files unchanged since the last verified run')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='Threads used to hash files')
+
+    args = parser.parse_args()
+
+    state_path = os.path.join(os.path.dirname(args.manifest), STATE_FILENAME)
+    results, problems = verify_manifest(
+        args.manifest, args.base_dir, state_path,
+        incremental=not args.full, max_workers=args.workers
+    )
+
+    if results is None or problems:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
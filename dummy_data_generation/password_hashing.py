@@ -0,0 +1,30 @@
+"""
+Standalone PBKDF2-SHA256 password hashing compatible with Django.
+Produces the same "pbkdf2_sha256$<iterations>$<salt>$<hash>" strings as
+django.contrib.auth.hashers.make_password, so generate_dummy_data.py can hash
+passwords on workers that have neither Django nor the project installed.
+"""
+
+import hmac
+import base64
+import hashlib
+
+ALGORITHM = "pbkdf2_sha256"
+
+# Django's PBKDF2PasswordHasher default since Django 5.2 (matches dummy_data/auth_user.csv)
+PBKDF2_ITERATIONS = 1000000
+
+def make_password(password, salt, iterations=PBKDF2_ITERATIONS):
+    """Hash a password the way Django's PBKDF2PasswordHasher.encode does"""
+    if not salt or '$' in salt:
+        raise ValueError("salt must be a non-empty string without '$'")
+    digest = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt.encode('utf-8'), iterations)
+    hash_b64 = base64.b64encode(digest).decode('ascii').strip()
+    return f"{ALGORITHM}${iterations}${salt}${hash_b64}"
+
+def check_password(password, encoded):
+    """Check a password against a pbkdf2_sha256 hash produced by Django or make_password"""
+    algorithm, iterations, salt, _ = encoded.split('$', 3)
+    if algorithm != ALGORITHM:
+        raise ValueError(f"Unsupported password hash algorithm: {algorithm}")
+    return hmac.compare_digest(make_password(password, salt, int(iterations)), encoded)
@@ -0,0 +1,64 @@
+"""
+Output path allocation for generated CVs and logos.
+CVs and logos go to cv/YYYY/MM/DD/ and photos/YYYY/MM/DD/ under the project
+root. Instead of an os.makedirs call (a stat per path component) for every
+file, the allocator remembers which date directories exist and, for large
+runs, creates the whole date tree for the generation range up front.
+"""
+
+import os
+import threading
+from datetime import timedelta
+
+class PathAllocator:
+    """Hands out output paths below root, creating each directory at most once"""
+
+    def __init__(self, root):
+        self.root = str(root)
+        self.created = set()
+        self.lock = threading.Lock()
+
+    def date_dirs(self, prefix, start_date, end_date):
+        """Relative prefix/YYYY/MM/DD directories for every day from start_date to end_date"""
+        day = start_date.date()
+        dirs = []
+        while day <= end_date.date():
+            dirs.append(f"{prefix}/{day.year}/{day.month:02d}/{day.day:02d}")
+            day += timedelta(days=1)
+        return dirs
+
+    def prepare(self, prefix, start_date, end_date, expected_files, create=True):
+        """Create the date tree for a range when at least one file per day is expected
+
+        Smaller runs create directories lazily instead of leaving mostly empty
+        trees behind. With create=False the directories are only recorded as
+        existing (worker processes after the main process created them).
+        Returns the number of directories prepared.
+        """
+        dirs = self.date_dirs(prefix, start_date, end_date)
+        if expected_files < len(dirs):
+            return 0
+        if create:
+            for month_dir in sorted({relative_dir.rsplit('/', 1)[0] for relative_dir in dirs}):
+                os.makedirs(os.path.join(self.root, month_dir), exist_ok=True)
+            for relative_dir in dirs:
+                try:
+                    os.mkdir(os.path.join(self.root, relative_dir))
+                except FileExistsError:
+                    pass
+        with self.lock:
+            self.created.update(dirs)
+        return len(dirs)
+
+    def ensure_dir(self, relative_dir):
+        """Create a directory below root unless it was already created"""
+        if relative_dir in self.created:
+            return
+        os.makedirs(os.path.join(self.root, relative_dir), exist_ok=True)
+        with self.lock:
+            self.created.add(relative_dir)
+
+    def allocate(self, relative_path):
+        """Full path for a relative output path, with its directory in place"""
+        self.ensure_dir(relative_path.rsplit('/', 1)[0])
+        return os.path.join(self.root, relative_path)
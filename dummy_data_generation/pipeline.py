@@ -0,0 +1,214 @@
+"""
+Overlapped stages for generate_dummy_data.py.
+Row generation stays in the calling thread (it owns the seeded random
+stream); password hashing, logo downloads, CV rendering, CSV writing and
+(with --stream) database inserts run in Stage / CsvSink / DatabaseSink
+worker threads. Every stage has a bounded number of
+pending items, so a fast producer blocks instead of queueing the whole run
+in memory, and results are consumed in submission order so the output does
+not depend on thread scheduling.
+
+Generated rows hold the stage futures (hashed password, logo path, CV path)
+as field values; the sinks resolve them just before a row is written, so a
+phase hands its rows over and the next phase starts while the stages are
+still busy.
+
+hashlib.pbkdf2_hmac and network/file I/O release the GIL, so those stages
+really run next to row generation. PDF rendering is pure Python and holds
+the GIL, so the CV stage can run in worker processes instead (processes=True).
+"""
+
+import csv
+import queue
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor
+
+# Default threads per stage and pending items before the producer blocks
+DEFAULT_STAGE_WORKERS = 4
+DEFAULT_MAX_PENDING = 256
+
+def resolved(value):
+    """The result of a stage future, or the value itself"""
+    return value.result() if isinstance(value, Future) else value
+
+def resolve_rows(rows):
+    """Replace stage futures in row fields with their results, in place
+
+    Sinks sharing the same rows may both do this; they store the same value.
+    """
+    for row in rows:
+        for field, value in row.items():
+            if isinstance(value, Future):
+                row[field] = value.result()
+    return rows
+
+class Stage:
+    """Run a function over submitted items in worker threads with backpressure
+
+    With processes=True the items run in a pool of worker processes
+    (started with initializer(*initargs)); function must then be picklable,
+    and unpack, if given, maps every result in this process (e.g. to merge
+    metrics a worker sent back). The processes are spawned rather than
+    forked, since the caller already runs other stages' threads.
+    busy_seconds only counts work done in threads.
+    """
+
+    def __init__(self, name, function, workers=DEFAULT_STAGE_WORKERS, max_pending=DEFAULT_MAX_PENDING,
+                 processes=False, initializer=None, initargs=(), unpack=None):
+        self.name = name
+        self.function = function
+        self.processes = processes and workers > 0
+        self.unpack = unpack
+        # With no workers the stage runs every item inline in the caller's thread
+        if self.processes:
+            self.executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                                initializer=initializer, initargs=initargs)
+        elif workers > 0:
+            self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=name)
+        else:
+            self.executor = None
+        self.slots = threading.BoundedSemaphore(max_pending)
+        self.busy_seconds = 0.0
+        self.lock = threading.Lock()
+
+    def _run(self, args):
+        start = time.perf_counter()
+        try:
+            return self.function(*args)
+        finally:
+            with self.lock:
+                self.busy_seconds += time.perf_counter() - start
+
+    def submit(self, *args):
+        """Queue one item; blocks while max_pending items are still in flight"""
+        if self.executor is None:
+            future = Future()
+            try:
+                future.set_result(self._run(args))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+        self.slots.acquire()
+        if not self.processes:
+            future = self.executor.submit(self._run, args)
+            future.add_done_callback(lambda _: self.slots.release())
+            return future
+
+        result = Future()
+        def finish(future):
+            self.slots.release()
+            try:
+                value = future.result()
+                result.set_result(self.unpack(value) if self.unpack is not None else value)
+            except Exception as e:
+                result.set_exception(e)
+        self.executor.submit(self.function, *args).add_done_callback(finish)
+        return result
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class CsvSink(threading.Thread):
+    """Write rows to a CSV file from a background thread, in the order they were put
+
+    With append=True rows are added to the end of an existing file (no header).
+    format_row, if given, is applied to every row in the writer thread.
+    """
+
+    def __init__(self, filepath, fieldnames, max_pending=DEFAULT_MAX_PENDING, append=False, format_row=None):
+        super().__init__(name=f"csv-{filepath}", daemon=True)
+        self.filepath = filepath
+        self.fieldnames = fieldnames
+        self.append = append
+        self.format_row = format_row
+        self.queue = queue.Queue(maxsize=max_pending)
+        self.count = 0
+        self.error = None
+        self.start()
+
+    def put(self, rows):
+        """Queue a batch of rows (blocks while the writer is max_pending batches behind)"""
+        self.queue.put(rows)
+
+    def run(self):
+        try:
+            with open(self.filepath, 'a' if self.append else 'w', newline='', encoding='utf-8') as csvfile:
+                writer = csv.DictWriter(csvfile, fieldnames=self.fieldnames)
+                if not self.append:
+                    writer.writeheader()
+                while True:
+                    rows = self.queue.get()
+                    if rows is None:
+                        break
+                    resolve_rows(rows)
+                    writer.writerows(rows if self.format_row is None else map(self.format_row, rows))
+                    self.count += len(rows)
+        except Exception as e:
+            self.error = e
+            # Keep draining so producers never block on a dead writer
+            while self.queue.get() is not None:
+                pass
+
+    def close(self):
+        """Flush the remaining rows and wait for the file to be complete"""
+        self.queue.put(None)
+        self.join()
+        if self.error is not None:
+            raise self.error
+        return self.count
+
+class DatabaseSink(threading.Thread):
+    """Hand batches of rows to insert_batch(table, rows) from one background thread
+
+    Batches are inserted in the order they were put, so rows referencing
+    another table arrive after the rows they reference. finish() runs in the
+    same thread once every batch is in (e.g. to fix sequences and close the
+    thread's database connection).
+    """
+
+    def __init__(self, insert_batch, finish=None, max_pending=DEFAULT_MAX_PENDING):
+        super().__init__(name="database-sink", daemon=True)
+        self.insert_batch = insert_batch
+        self.finish = finish
+        self.queue = queue.Queue(maxsize=max_pending)
+        self.counts = {}
+        self.error = None
+        self.start()
+
+    def put(self, table, rows):
+        """Queue a batch of rows for table (blocks while the inserter is max_pending batches behind)"""
+        self.queue.put((table, rows))
+
+    def run(self):
+        try:
+            while True:
+                item = self.queue.get()
+                if item is None:
+                    break
+                table, rows = item
+                self.insert_batch(table, resolve_rows(rows))
+                self.counts[table] = self.counts.get(table, 0) + len(rows)
+            if self.finish is not None:
+                self.finish()
+        except Exception as e:
+            self.error = e
+            # Keep draining so producers never block on a dead inserter
+            while self.queue.get() is not None:
+                pass
+
+    def close(self):
+        """Wait until every queued batch is inserted; returns the rows handed over per table"""
+        self.queue.put(None)
+        self.join()
+        if self.error is not None:
+            raise self.error
+        return self.counts
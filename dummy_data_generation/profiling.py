@@ -0,0 +1,209 @@
+"""
+Per-stage and per-helper profiling for generate_dummy_data.py --profile.
+Stages (users, companies, listings, ...) are timed as a whole; hot helpers
+(password hashing, keyword filtering, PDF rendering, logo fetching, ...) are
+wrapped to count calls, total time, p50/p99 latency and bytes written.
+Stages can additionally capture a cProfile summary and a tracemalloc
+snapshot. Metrics from shard worker processes are merged into the main
+process, which writes one JSON report at the end.
+"""
+
+import io
+import json
+import time
+import pstats
+import cProfile
+import threading
+import functools
+import contextlib
+import tracemalloc
+from array import array
+
+# Latency samples kept per helper; beyond this every other sample is dropped (deterministically)
+MAX_SAMPLES = 20000
+
+# Entries listed per stage from cProfile and tracemalloc
+TOP_ENTRIES = 15
+
+class HelperMetrics:
+    """Calls, total time, bytes and a bounded latency sample of one helper"""
+
+    def __init__(self):
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.bytes = 0
+        self.samples = array('d')
+        self.stride = 1
+
+    def record(self, seconds, num_bytes=0):
+        self.calls += 1
+        self.total_seconds += seconds
+        self.bytes += num_bytes
+        if self.calls % self.stride == 0:
+            self.samples.append(seconds)
+            if len(self.samples) >= MAX_SAMPLES:
+                self.samples = self.samples[::2]
+                self.stride *= 2
+
+    def merge(self, other):
+        self.calls += other["calls"]
+        self.total_seconds += other["total_seconds"]
+        self.bytes += other["bytes"]
+        self.samples.extend(other["samples"])
+
+    def to_dict(self):
+        return {"calls": self.calls, "total_seconds": self.total_seconds, "bytes": self.bytes,
+                "samples": list(self.samples)}
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+class Profiler:
+    """Collects stage timings and helper metrics for one generation run"""
+
+    def __init__(self, cprofile=False, memory=False):
+        self.cprofile = cprofile
+        self.memory = memory
+        self.stages = {}
+        self.helpers = {}
+        self.files = {}
+        self.lock = threading.Lock()
+        self.start = time.perf_counter()
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """Time a stage, optionally under cProfile and tracemalloc"""
+        profile = cProfile.Profile() if self.cprofile else None
+        if self.memory:
+            tracemalloc.start()
+            tracemalloc.reset_peak()
+        if profile is not None:
+            profile.enable()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            report = {"seconds": time.perf_counter() - start}
+            if profile is not None:
+                profile.disable()
+                report["cprofile_top"] = cprofile_summary(profile)
+            if self.memory:
+                report["tracemalloc"] = tracemalloc_summary()
+                tracemalloc.stop()
+            self.stages[name] = report
+
+    def helper(self, name):
+        with self.lock:
+            return self.helpers.setdefault(name, HelperMetrics())
+
+    def record(self, name, seconds, num_bytes=0):
+        metrics = self.helper(name)
+        with self.lock:
+            metrics.record(seconds, num_bytes)
+
+    def wrap(self, function, name, size_of=None):
+        """Wrap a function so every call is recorded under name
+
+        size_of(args, result) returns the bytes written by the call.
+        """
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            result = function(*args, **kwargs)
+            elapsed = time.perf_counter() - start
+            self.record(name, elapsed, size_of(args, result) if size_of is not None else 0)
+            return result
+        timed.profiled_original = function
+        return timed
+
+    def instrument(self, namespace, names, sizes=None):
+        """Replace functions in a module namespace (e.g. globals()) with timed wrappers"""
+        sizes = sizes or {}
+        for name in names:
+            # Re-wrap the original if a profiler was inherited (e.g. by a forked worker process)
+            function = getattr(namespace[name], 'profiled_original', namespace[name])
+            namespace[name] = self.wrap(function, name, sizes.get(name))
+
+    def add_file(self, path, num_bytes):
+        self.files[str(path)] = num_bytes
+
+    def export_helpers(self):
+        """Helper metrics in a picklable form, for shipping from worker processes"""
+        with self.lock:
+            exported = {name: metrics.to_dict() for name, metrics in self.helpers.items()}
+            self.helpers = {}
+        return exported
+
+    def merge_helpers(self, exported):
+        for name, metrics in exported.items():
+            helper = self.helper(name)
+            with self.lock:
+                helper.merge(metrics)
+
+    def report(self):
+        helpers = {}
+        for name, metrics in sorted(self.helpers.items(), key=lambda item: -item[1].total_seconds):
+            samples = sorted(metrics.samples)
+            helpers[name] = {
+                "calls": metrics.calls,
+                "total_seconds": round(metrics.total_seconds, 6),
+                "p50_ms": round(percentile(samples, 0.50) * 1000, 3),
+                "p99_ms": round(percentile(samples, 0.99) * 1000, 3),
+                "bytes": metrics.bytes
+            }
+        return {
+            "wall_seconds": round(time.perf_counter() - self.start, 3),
+            "stages": self.stages,
+            "helpers": helpers,
+            "files": self.files
+        }
+
+    def write_report(self, path):
+        report = self.report()
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print_report(report)
+        print(f"Profile report written to {path}")
+        return report
+
+def cprofile_summary(profile):
+    """Top functions of a cProfile run by cumulative time"""
+    stats = pstats.Stats(profile, stream=io.StringIO())
+    entries = []
+    for (filename, line, function), (_, calls, total, cumulative, _) in stats.stats.items():
+        entries.append({"function": f"{filename}:{line}({function})", "calls": calls,
+                        "total_seconds": round(total, 6), "cumulative_seconds": round(cumulative, 6)})
+    entries.sort(key=lambda entry: -entry["cumulative_seconds"])
+    return entries[:TOP_ENTRIES]
+
+def tracemalloc_summary():
+    """Peak traced memory and the largest allocation sites of the current stage"""
+    _, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot()
+    top = snapshot.statistics('lineno')[:TOP_ENTRIES]
+    return {
+        "peak_bytes": peak,
+        "top": [{"location": str(stat.traceback), "bytes": stat.size, "count": stat.count} for stat in top]
+    }
+
+def print_report(report):
+    """Print stage and helper timings"""
+    print("\n" + "="*70)
+    print("GENERATION PROFILE")
+    print("="*70)
+    print(f"Wall time: {report['wall_seconds']:.2f}s")
+    print("\nStages:")
+    for name, stage in report["stages"].items():
+        print(f"  {name:<24} {stage['seconds']:>10.2f}s")
+    print("\nHelpers (summed over threads and worker processes):")
+    print(f"  {'':<34}{'calls':>10}{'total s':>11}{'p50 ms':>10}{'p99 ms':>10}{'bytes':>12}")
+    for name, helper in report["helpers"].items():
+        print(f"  {name:<34}{helper['calls']:>10}{helper['total_seconds']:>11.2f}"
+              f"{helper['p50_ms']:>10.3f}{helper['p99_ms']:>10.3f}{helper['bytes']:>12}")
+    if report["files"]:
+        print("\nFiles written:")
+        for path, num_bytes in report["files"].items():
+            print(f"  {path}: {num_bytes} bytes")
+    print("="*70)
@@ -0,0 +1,163 @@
+"""
+Column-oriented storage for generated records.
+generate_dummy_data.py keeps the users, companies and listings that later
+phases read in ColumnStores instead of lists of dicts: ids and datetimes live
+in typed arrays and repeated values (names, industries, budgets, titles) are
+interned as small integer codes, so a record costs tens of bytes instead of a
+dict with its own copy of every key.
+"""
+
+from array import array
+from datetime import datetime, timedelta
+
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Naive datetimes are stored as seconds since this epoch
+EPOCH = datetime(1970, 1, 1)
+
+class IntColumn:
+    """Integers in a typed array"""
+
+    def __init__(self):
+        self.values = array('q')
+
+    def append(self, value):
+        self.values.append(int(value))
+
+    def __getitem__(self, index):
+        return self.values[index]
+
+    def __len__(self):
+        return len(self.values)
+
+    def take(self, start, stop):
+        column = IntColumn()
+        column.values = self.values[start:stop]
+        return column
+
+class DateColumn(IntColumn):
+    """"YYYY-MM-DD HH:MM:SS" datetimes stored as epoch seconds in a typed array
+
+    Naive datetime objects (typed rows, generate_dummy_data.py --stream) are accepted as well.
+    """
+
+    def append(self, value):
+        if isinstance(value, str):
+            value = datetime.strptime(value, DATETIME_FORMAT)
+        self.values.append(int((value - EPOCH).total_seconds()))
+
+    def __getitem__(self, index):
+        return self.datetime(index).strftime(DATETIME_FORMAT)
+
+    def datetime(self, index):
+        return EPOCH + timedelta(seconds=self.values[index])
+
+    def take(self, start, stop):
+        column = DateColumn()
+        column.values = self.values[start:stop]
+        return column
+
+class CategoryColumn:
+    """Repeated values stored once, rows hold integer codes into the category list"""
+
+    def __init__(self):
+        self.categories = []
+        self.codes_by_value = {}
+        self.codes = array('I')
+
+    def append(self, value):
+        code = self.codes_by_value.get(value)
+        if code is None:
+            code = len(self.categories)
+            self.codes_by_value[value] = code
+            self.categories.append(value)
+        self.codes.append(code)
+
+    def __getitem__(self, index):
+        return self.categories[self.codes[index]]
+
+    def __len__(self):
+        return len(self.codes)
+
+    def take(self, start, stop):
+        column = CategoryColumn()
+        column.categories = self.categories
+        column.codes_by_value = self.codes_by_value
+        column.codes = self.codes[start:stop]
+        return column
+
+class StringColumn:
+    """Distinct strings (emails, paths) in a plain list"""
+
+    def __init__(self):
+        self.values = []
+
+    def append(self, value):
+        self.values.append(value)
+
+    def __getitem__(self, index):
+        return self.values[index]
+
+    def __len__(self):
+        return len(self.values)
+
+    def take(self, start, stop):
+        column = StringColumn()
+        column.values = self.values[start:stop]
+        return column
+
+COLUMN_TYPES = {
+    "int": IntColumn,
+    "date": DateColumn,
+    "category": CategoryColumn,
+    "str": StringColumn
+}
+
+class ColumnStore:
+    """A table of generated records kept one column per field
+
+    schema maps field names to "int", "date", "category" or "str". Only the
+    fields in the schema are kept; other keys of appended records are dropped.
+    """
+
+    def __init__(self, schema):
+        self.schema = dict(schema)
+        self.columns = {name: COLUMN_TYPES[kind]() for name, kind in self.schema.items()}
+        self.length = 0
+
+    @classmethod
+    def from_records(cls, records, schema):
+        store = cls(schema)
+        store.extend(records)
+        return store
+
+    def append(self, record):
+        for name, column in self.columns.items():
+            column.append(record[name])
+        self.length += 1
+
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+
+    def column(self, name):
+        return self.columns[name]
+
+    def row(self, index):
+        """One record as a dict of the stored fields"""
+        return {name: column[index] for name, column in self.columns.items()}
+
+    def rows(self):
+        for index in range(self.length):
+            yield self.row(index)
+
+    def slice(self, start, stop):
+        """Records start..stop as a new store (categories are shared)"""
+        store = ColumnStore.__new__(ColumnStore)
+        store.schema = self.schema
+        store.columns = {name: column.take(start, stop) for name, column in self.columns.items()}
+        store.length = len(range(self.length)[start:stop])
+        return store
+
+    def __len__(self):
+        return self.length
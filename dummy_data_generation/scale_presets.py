@@ -0,0 +1,156 @@
+"""
+Scale presets and resource planning for generate_dummy_data.py.
+Sizes are derived from a multiplier (the former hard-coded Multipler) and can
+be overridden per table; the planner estimates wall time, peak memory and disk
+from per-record costs before any work is done.
+"""
+
+import json
+
+# Records per table for a multiplier of 1
+SIZE_RATIOS = {
+    "company_users": 1,  # Company users (1:1 with companies)
+    "individual_users": 10,  # Individual users (job seekers)
+    "listings": 4,
+    "applies": 60
+}
+
+# Named presets: multiplier applied to SIZE_RATIOS
+SCALE_PRESETS = {
+    "smoke": 1,  # 11 users, 4 listings, 60 applies - seconds
+    "dev": 30,  # The fixture checked into dummy_data/
+    "load": 1000,
+    "soak": 10000
+}
+DEFAULT_PRESET = "dev"
+
+# Per-record costs measured on a developer laptop (refresh with --plan --calibrate):
+#   seconds      - CPU/wall time to produce one record and its media
+#   csv_bytes    - average CSV row size
+#   memory_bytes - in-memory size of one record dict
+#   store_bytes  - size of the record in the ColumnStore kept for later phases
+#   media_bytes  - average size of the PDF or PNG written for the record
+RECORD_COSTS = {
+    "auth_user": {"seconds": 0.56, "csv_bytes": 200, "memory_bytes": 1600, "store_bytes": 40, "media_bytes": 0},  # make_password
+    "companies_company": {"seconds": 0.30, "csv_bytes": 400, "memory_bytes": 2000, "store_bytes": 110, "media_bytes": 2000},  # logo download
+    "listings_listing": {"seconds": 0.0003, "csv_bytes": 360, "memory_bytes": 1800, "store_bytes": 20, "media_bytes": 0},
+    "applies_apply": {"seconds": 0.012, "csv_bytes": 270, "memory_bytes": 1500, "store_bytes": 60, "media_bytes": 1820}  # CV PDF
+}
+
+# Interpreter, Django and fpdf before the first record
+BASELINE_MEMORY_BYTES = 80 * 1024 * 1024
+
+# One manifest row per media file
+MANIFEST_ROW_BYTES = 110
+
+def build_sizes(multiplier):
+    """Table sizes for a multiplier"""
+    return {name: ratio * multiplier for name, ratio in SIZE_RATIOS.items()}
+
+def load_sizes_config(path):
+    """Read sizes from a JSON file: {"preset": ..., "multiplier": ..., "applies": ...}"""
+    with open(path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+
+    unknown = set(config) - {"preset", "multiplier"} - set(SIZE_RATIOS)
+    if unknown:
+        raise ValueError(f"Unknown keys in sizes config {path}: {sorted(unknown)}")
+    return config
+
+def resolve_sizes(preset=None, multiplier=None, overrides=None):
+    """Resolve table sizes from a preset or multiplier plus per-table overrides"""
+    if multiplier is None:
+        preset = preset or DEFAULT_PRESET
+        if preset not in SCALE_PRESETS:
+            raise ValueError(f"Unknown preset '{preset}', choose from {', '.join(SCALE_PRESETS)}")
+        multiplier = SCALE_PRESETS[preset]
+    elif multiplier < 1:
+        raise ValueError("multiplier must be at least 1")
+
+    sizes = build_sizes(multiplier)
+    for name, value in (overrides or {}).items():
+        if value is not None:
+            if value < 1:
+                raise ValueError(f"{name} must be at least 1")
+            sizes[name] = value
+    return sizes
+
+def table_counts(sizes):
+    """Records per generated table"""
+    return {
+        "auth_user": sizes["company_users"] + sizes["individual_users"],
+        "companies_company": sizes["company_users"],
+        "listings_listing": sizes["listings"],
+        "applies_apply": sizes["applies"]
+    }
+
+def estimate_resources(sizes, workers=1, shards=1, costs=None):
+    """Estimate wall time, peak memory and disk usage of a generation run"""
+    costs = costs or RECORD_COSTS
+    counts = table_counts(sizes)
+    parallelism = max(1, min(workers, shards))
+
+    phases = {}
+    for table, count in counts.items():
+        cost = costs[table]
+        phases[table] = {
+            "records": count,
+            "seconds": count * cost["seconds"] / parallelism,
+            "csv_bytes": count * cost["csv_bytes"],
+            "media_bytes": count * cost["media_bytes"],
+            "memory_bytes": count * cost["memory_bytes"],
+            "store_bytes": count * cost["store_bytes"]
+        }
+
+    media_files = counts["companies_company"] + counts["applies_apply"]
+    return {
+        "phases": phases,
+        "seconds": sum(phase["seconds"] for phase in phases.values()),
+        # Record dicts live until their table is written; after that only the column stores remain
+        "peak_memory_bytes": BASELINE_MEMORY_BYTES + max(phase["memory_bytes"] for phase in phases.values())
+                             + sum(phase["store_bytes"] for phase in phases.values()),
+        "csv_bytes": sum(phase["csv_bytes"] for phase in phases.values()) + media_files * MANIFEST_ROW_BYTES,
+        "cv_bytes": phases["applies_apply"]["media_bytes"],
+        "logo_bytes": phases["companies_company"]["media_bytes"]
+    }
+
+def format_bytes(num_bytes):
+    """Human readable byte count"""
+    for unit in ("B", "KB", "MB", "GB"):
+        if num_bytes < 1024:
+            return f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} TB"
+
+def format_duration(seconds):
+    """Human readable duration"""
+    hours, remainder = divmod(int(seconds), 3600)
+    minutes, seconds = divmod(remainder, 60)
+    if hours:
+        return f"{hours}h {minutes:02d}m"
+    if minutes:
+        return f"{minutes}m {seconds:02d}s"
+    return f"{seconds}s"
+
+def print_plan(estimate, free_bytes=None):
+    """Print the resource plan for a generation run"""
+    print("\n" + "="*50)
+    print("GENERATION PLAN")
+    print("="*50)
+    for table, phase in estimate["phases"].items():
+        print(f"  {table:<20} {phase['records']:>10} records  ~{format_duration(phase['seconds'])}")
+    print("-"*50)
+    print(f"Estimated wall time:   {format_duration(estimate['seconds'])}")
+    print(f"Estimated peak memory: {format_bytes(estimate['peak_memory_bytes'])}")
+    print(f"Estimated disk usage:")
+    print(f"  CSV files + manifest: {format_bytes(estimate['csv_bytes'])}")
+    print(f"  CV PDFs:              {format_bytes(estimate['cv_bytes'])}")
+    print(f"  Logos:                {format_bytes(estimate['logo_bytes'])}")
+
+    total_disk = estimate["csv_bytes"] + estimate["cv_bytes"] + estimate["logo_bytes"]
+    if free_bytes is not None:
+        print(f"  Free disk space:      {format_bytes(free_bytes)}")
+        if total_disk > free_bytes:
+            print("⚠️  Not enough free disk space for this run!")
+    print("="*50)
+    return total_disk
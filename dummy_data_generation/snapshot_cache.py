@@ -0,0 +1,90 @@
+"""
+Snapshot cache for generate_dummy_data.py.
+A run is fingerprinted from everything that determines its output (sizes,
+seed, shards, choices and the generator sources). Its CSVs, manifest and
+media are stored as one tar archive per fingerprint; a later run with the
+same fingerprint extracts the archive instead of hashing passwords,
+rendering CVs and fetching logos again. The least recently used archives
+are evicted once the cache grows past its size limit.
+
+Archives are used instead of hard links because the generator rewrites its
+output files in place, which would silently change hard-linked cache entries.
+"""
+
+import os
+import json
+import hashlib
+import tarfile
+
+# Bump when the archive layout changes
+CACHE_FORMAT_VERSION = 1
+
+DEFAULT_MAX_CACHE_BYTES = 2 * 1024 ** 3
+
+def compute_fingerprint(inputs, source_files):
+    """Digest of the run inputs (JSON-serializable) and the contents of the generator sources"""
+    digest = hashlib.sha256()
+    digest.update(json.dumps({"format": CACHE_FORMAT_VERSION, "inputs": inputs}, sort_keys=True).encode('utf-8'))
+    for path in sorted(str(path) for path in source_files):
+        digest.update(os.path.basename(path).encode('utf-8'))
+        with open(path, 'rb') as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+def snapshot_path(cache_dir, fingerprint):
+    return os.path.join(cache_dir, f"{fingerprint}.tar")
+
+def restore_snapshot(cache_dir, fingerprint, base_dir):
+    """Extract a cached snapshot below base_dir; returns the restored paths or None on a miss"""
+    archive = snapshot_path(cache_dir, fingerprint)
+    if not os.path.exists(archive):
+        return None
+
+    with tarfile.open(archive, 'r') as tar:
+        names = tar.getnames()
+        if hasattr(tarfile, 'data_filter'):
+            tar.extractall(base_dir, filter='data')
+        else:
+            tar.extractall(base_dir)
+
+    # Mark as recently used for LRU eviction
+    os.utime(archive)
+    return names
+
+def save_snapshot(cache_dir, fingerprint, base_dir, relative_paths):
+    """Store files below base_dir as the snapshot for fingerprint; returns the archive size"""
+    os.makedirs(cache_dir, exist_ok=True)
+    archive = snapshot_path(cache_dir, fingerprint)
+    temp_archive = f"{archive}.{os.getpid()}.tmp"
+
+    with tarfile.open(temp_archive, 'w') as tar:
+        for relative_path in sorted(set(relative_paths)):
+            full_path = os.path.join(base_dir, relative_path)
+            if os.path.isfile(full_path):
+                tar.add(full_path, arcname=relative_path)
+    os.replace(temp_archive, archive)
+    return os.path.getsize(archive)
+
+def evict_snapshots(cache_dir, max_bytes=DEFAULT_MAX_CACHE_BYTES):
+    """Delete the least recently used snapshots until the cache fits in max_bytes
+
+    Returns the fingerprints that were evicted.
+    """
+    if not os.path.isdir(cache_dir):
+        return []
+
+    snapshots = []
+    for entry in os.scandir(cache_dir):
+        if entry.is_file() and entry.name.endswith('.tar'):
+            stat = entry.stat()
+            snapshots.append((stat.st_mtime, stat.st_size, entry.path))
+
+    total = sum(size for _, size, _ in snapshots)
+    evicted = []
+    for _, size, path in sorted(snapshots):
+        if total <= max_bytes:
+            break
+        os.remove(path)
+        total -= size
+        evicted.append(os.path.basename(path)[:-len('.tar')])
+    return evicted
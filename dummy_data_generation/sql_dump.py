@@ -0,0 +1,200 @@
+"""
+PostgreSQL load files for generate_dummy_data.py --sql.
+Every table is written to dummy_data/sql/<table>.sql as one COPY ... FROM
+stdin block (or as multi-row INSERTs with --sql insert), streamed from a
+background thread batch by batch, so memory stays flat however many rows
+are written. load.sql loads all tables in one transaction and moves the id
+sequences past the loaded ids:
+
+    psql -d <database> -f dummy_data/sql/load.sql
+
+No Django is needed on the loading machine. Rows get the same ids the CSV
+import would give them; with --append the files hold only the new rows.
+"""
+
+import os
+import queue
+import threading
+from datetime import datetime
+
+from record_store import DATETIME_FORMAT
+from pipeline import DEFAULT_MAX_PENDING, resolve_rows
+
+SQL_DIRNAME = 'sql'
+LOAD_SCRIPT = 'load.sql'
+SQL_FORMATS = ["copy", "insert"]
+
+# Rows per INSERT statement in insert format
+INSERT_BATCH_ROWS = 1000
+
+# Columns of each table, in load order (foreign keys point to earlier tables)
+SQL_TABLES = {
+    "auth_user": [
+        "id", "password", "last_login", "is_superuser", "username", "first_name",
+        "last_name", "email", "is_staff", "is_active", "date_joined"
+    ],
+    "companies_company": [
+        "id", "name", "logo", "industry", "serivces", "description",
+        "phone", "email", "create_date", "user_id"
+    ],
+    "listings_listing": [
+        "id", "company_id", "title", "industry", "budget", "duration",
+        "description", "requirement", "publish_date", "is_active"
+    ],
+    "applies_apply": [
+        "id", "listing_id", "user_id", "name", "email", "phone",
+        "message", "cv", "apply_date"
+    ]
+}
+
+BOOLEAN_COLUMNS = {"is_superuser", "is_staff", "is_active"}
+TRUE_VALUES = {True, "true", "1", "t"}
+
+# import_csv_to_db.py reads user timestamps as UTC; the others in the session time zone,
+# which should be the Django TIME_ZONE the ORM import would interpret them in
+UTC_COLUMNS = {"last_login", "date_joined"}
+
+# Columns where an empty value means NULL
+NULLABLE_COLUMNS = {"last_login"}
+
+# Session time zone when the Django TIME_ZONE is not known
+DEFAULT_TIMEZONE = 'UTC'
+
+def sql_value(column, value):
+    """Text of a generated value as PostgreSQL reads it (None for NULL)"""
+    if value is None or (value == "" and column in NULLABLE_COLUMNS):
+        return None
+    if column in BOOLEAN_COLUMNS:
+        return 't' if value in TRUE_VALUES else 'f'
+    if isinstance(value, datetime):
+        value = value.strftime(DATETIME_FORMAT)
+    if column in UTC_COLUMNS:
+        return f"{value}+00"
+    return str(value)
+
+def copy_field(text):
+    """Escape a value for COPY text format"""
+    if text is None:
+        return '\\N'
+    return text.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+
+def sql_literal(text):
+    """Quote a value as a SQL literal (standard_conforming_strings on)"""
+    if text is None:
+        return 'NULL'
+    return "'" + text.replace("'", "''") + "'"
+
+class SqlTableSink(threading.Thread):
+    """Write one table's rows as COPY data or INSERT statements from a background thread
+
+    Rows without an "id" are numbered from first_id in the order they are put.
+    """
+
+    def __init__(self, filepath, table, sql_format="copy", first_id=1, max_pending=DEFAULT_MAX_PENDING):
+        super().__init__(name=f"sql-{table}", daemon=True)
+        self.filepath = filepath
+        self.table = table
+        self.columns = SQL_TABLES[table]
+        self.sql_format = sql_format
+        self.next_id = first_id
+        self.queue = queue.Queue(maxsize=max_pending)
+        self.count = 0
+        self.error = None
+        self.start()
+
+    def put(self, rows):
+        """Queue a batch of rows (blocks while the writer is max_pending batches behind)"""
+        self.queue.put(rows)
+
+    def values(self, row):
+        if "id" not in row:
+            row = dict(row, id=self.next_id)
+            self.next_id += 1
+        return [sql_value(column, row[column]) for column in self.columns]
+
+    def run(self):
+        column_list = ", ".join(self.columns)
+        try:
+            with open(self.filepath, 'w', encoding='utf-8', newline='\n') as f:
+                if self.sql_format == "copy":
+                    f.write(f"COPY {self.table} ({column_list}) FROM stdin;\n")
+                while True:
+                    rows = self.queue.get()
+                    if rows is None:
+                        break
+                    resolve_rows(rows)
+                    if self.sql_format == "copy":
+                        f.writelines("\t".join(copy_field(value) for value in self.values(row)) + "\n"
+                                     for row in rows)
+                    else:
+                        for start in range(0, len(rows), INSERT_BATCH_ROWS):
+                            tuples = ",\n".join(
+                                "(" + ", ".join(sql_literal(value) for value in self.values(row)) + ")"
+                                for row in rows[start:start + INSERT_BATCH_ROWS]
+                            )
+                            f.write(f"INSERT INTO {self.table} ({column_list}) VALUES\n{tuples};\n")
+                    self.count += len(rows)
+                if self.sql_format == "copy":
+                    f.write("\\.\n")
+        except Exception as e:
+            self.error = e
+            # Keep draining so producers never block on a dead writer
+            while self.queue.get() is not None:
+                pass
+
+    def close(self):
+        """Finish the file and wait for it to be complete"""
+        self.queue.put(None)
+        self.join()
+        if self.error is not None:
+            raise self.error
+        return self.count
+
+class SqlDump:
+    """The per-table load files and load.sql of one run"""
+
+    def __init__(self, directory, sql_format="copy", first_ids=None, timezone=None):
+        if sql_format not in SQL_FORMATS:
+            raise ValueError(f"Unknown SQL format '{sql_format}', choose from {', '.join(SQL_FORMATS)}")
+        self.directory = str(directory)
+        self.sql_format = sql_format
+        self.first_ids = first_ids or {}
+        self.timezone = timezone
+        self.tables = []
+        os.makedirs(self.directory, exist_ok=True)
+
+    def open_table(self, table):
+        """Start the writer of a table's load file"""
+        self.tables.append(table)
+        return SqlTableSink(os.path.join(self.directory, f"{table}.sql"), table, self.sql_format,
+                            self.first_ids.get(table, 1))
+
+    def write_load_script(self):
+        """Write load.sql: every table file in one transaction, then the sequence fix-ups"""
+        path = os.path.join(self.directory, LOAD_SCRIPT)
+        lines = [
+            "-- Generated by generate_dummy_data.py; load with: psql -d <database> -f load.sql",
+        ]
+        if self.timezone is None:
+            lines += [
+                f"-- The Django TIME_ZONE was not known: company, listing and apply timestamps are read as "
+                f"{DEFAULT_TIMEZONE}.",
+                "-- If the project's TIME_ZONE differs, change the SET LOCAL timezone below to match it."
+            ]
+        lines += [
+            "\\set ON_ERROR_STOP on",
+            "BEGIN;",
+            f"SET LOCAL timezone = {sql_literal(self.timezone or DEFAULT_TIMEZONE)};",
+            "SET LOCAL standard_conforming_strings = on;"
+        ]
+        tables = [table for table in SQL_TABLES if table in self.tables]
+        lines += [f"\\ir {table}.sql" for table in tables]
+        lines += [
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE(MAX(id), 1), MAX(id) IS NOT NULL) "
+            f"FROM {table};"
+            for table in tables
+        ]
+        lines += ["COMMIT;"]
+        with open(path, 'w', encoding='utf-8', newline='\n') as f:
+            f.write("\n".join(lines) + "\n")
+        return path
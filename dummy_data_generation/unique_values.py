@@ -0,0 +1,79 @@
+"""
+Uniqueness for generated emails and company names at any scale.
+Names, domains and COMPANY_NAMES are small pools, so at load-test sizes the
+natural values collide and import_csv_to_db.py skips the duplicates. Each
+value is kept as generated the first time it is seen; repeats get the
+record's id appended, which no natural value can produce, so the result is
+unique by construction. Seen values are tracked in a set, or above
+BLOOM_THRESHOLD in a Bloom filter: a false positive only adds an
+unnecessary suffix, never a duplicate.
+"""
+
+import math
+import hashlib
+
+# Above this many values the exact set is replaced by a Bloom filter
+BLOOM_THRESHOLD = 1000000
+BLOOM_ERROR_RATE = 0.001
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (stable across processes and runs)"""
+
+    def __init__(self, capacity, error_rate=BLOOM_ERROR_RATE):
+        capacity = max(1, capacity)
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, value):
+        digest = hashlib.blake2b(value.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return [(first + i * second) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, value):
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+class UniqueValues:
+    """Values already handed out: an exact set, or a Bloom filter for large runs"""
+
+    def __init__(self, expected_count, bloom_threshold=BLOOM_THRESHOLD):
+        self.seen = BloomFilter(expected_count) if expected_count > bloom_threshold else set()
+
+    def claim(self, value):
+        """Take value if it is (as far as we can tell) unused; returns False for a repeat"""
+        if value in self.seen:
+            return False
+        self.seen.add(value)
+        return True
+
+def unique_email(email, record_id):
+    """"john.smith@gmail.com" -> "john.smith.42@gmail.com" (natural emails never end in .<digits>)"""
+    local, domain = email.rsplit('@', 1)
+    return f"{local}.{record_id}@{domain}"
+
+def unique_company_name(name, record_id):
+    """"Byte Forge" -> "Byte Forge 42" (COMPANY_NAMES contain no digits)"""
+    return f"{name} {record_id}"
+
+def make_unique(records, field, id_field, disambiguate, existing=()):
+    """Rewrite repeated values of records[field] in place; returns how many were rewritten
+
+    records must be in id order (with unique ids) and are visited once each.
+    existing holds values already taken, e.g. by rows of an appended-to fixture.
+    """
+    records = list(records)
+    existing = list(existing)
+    seen = UniqueValues(len(records) + len(existing))
+    for value in existing:
+        seen.claim(value)
+    rewritten = 0
+    for record in records:
+        if not seen.claim(record[field]):
+            record[field] = disambiguate(record[field], record[id_field])
+            rewritten += 1
+    return rewritten
@@ -2,104 +2,222 @@
 """
 Main script to verify imported data matches generated data.
 Run this after importing dummy data into your database.
+
+Everything runs in one process: rows are streamed straight from the ORM and
+compared against the generated CSVs without writing intermediate exports.
+With --aggregate, tables are first compared by aggregate signatures computed
+in SQL and only tables whose signatures disagree get a row-level diff.
 """
 
 import os
 import sys
-import subprocess
-
-print("="*70)
-print("VERIFYING IMPORTED DATA")
-print("="*70)
-
-# Step 1: Check if database has data
-print("\nStep 1: Checking if database has data...")
-try:
-    # Try to import Django and check if there's any data
-    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
-    
-    import django
-    django.setup()
-    
-    from django.contrib.auth.models import User
-    from companies.models import Company
-    from listings.models import Listing
-    from applies.models import Apply
-    
-    user_count = User.objects.count()
-    company_count = Company.objects.count()
-    listing_count = Listing.objects.count()
-    apply_count = Apply.objects.count()
-    
-    print(f"  Users in database: {user_count}")
-    print(f"  Companies in database: {company_count}")
-    print(f"  Listings in database: {listing_count}")
-    print(f"  Applies in database: {apply_count}")
-    
-    if user_count == 0:
-        print("⚠️  No data found in database. Have you imported the CSV files?")
-        print("   Run: python import_data.py or use Django's loaddata command")
+import csv
+from pathlib import Path
+
+# Project root holds dummy_data/, exported_data/, cv/ and photos/
+project_root = Path(__file__).resolve().parent.parent
+
+def check_database():
+    """Step 1: Check that Django is importable and the database has data"""
+    print("\nStep 1: Checking if database has data...")
+    try:
+        # Importing the exporter sets up Django once for the whole run
+        import export_data_to_csv
+        from export_data_to_csv import User, Company, Listing, Apply
+
+        user_count = User.objects.count()
+        company_count = Company.objects.count()
+        listing_count = Listing.objects.count()
+        apply_count = Apply.objects.count()
+
+        print(f"  Users in database: {user_count}")
+        print(f"  Companies in database: {company_count}")
+        print(f"  Listings in database: {listing_count}")
+        print(f"  Applies in database: {apply_count}")
+
+        if user_count == 0:
+            print("⚠️  No data found in database. Have you imported the CSV files?")
+            print("   Run: python import_csv_to_db.py or use Django's loaddata command")
+            sys.exit(1)
+
+        print("✓ Database contains data")
+        return export_data_to_csv
+
+    except ImportError as e:
+        print(f"Error: Could not import Django modules: {e}")
+        print("Make sure you're in the correct directory and Django is installed.")
         sys.exit(1)
-    
-    print("✓ Database contains data")
-    
-except ImportError as e:
-    print(f"Error: Could not import Django modules: {e}")
-    print("Make sure you're in the correct directory and Django is installed.")
-    sys.exit(1)
-except Exception as e:
-    print(f"Error checking database: {e}")
-    sys.exit(1)
-
-# Step 2: Export data from database
-print("\nStep 2: Exporting data from database to CSV...")
-try:
-    result = subprocess.run([sys.executable, 'export_data_to_csv.py'], 
-                          capture_output=True, text=True)
-    print(result.stdout)
-    if result.stderr:
-        print("Errors:", result.stderr)
-    
-    if result.returncode != 0:
-        print("⚠️  Export failed")
+    except Exception as e:
+        print(f"Error checking database: {e}")
         sys.exit(1)
-    
-    print("✓ Data exported successfully")
-    
-except Exception as e:
-    print(f"Error exporting data: {e}")
-    sys.exit(1)
-
-# Step 3: Compare generated vs exported data
-print("\nStep 3: Comparing generated data with exported data...")
-try:
-    result = subprocess.run([sys.executable, 'compare_data.py'], 
-                          capture_output=True, text=True)
-    print(result.stdout)
-    if result.stderr:
-        print("Errors:", result.stderr)
-    
-    if result.returncode != 0:
-        print("⚠️  Comparison failed")
+
+def iter_generated_rows(filepath):
+    """Stream rows from a generated CSV file"""
+    with open(filepath, 'r', encoding='utf-8') as csvfile:
+        yield from csv.DictReader(csvfile)
+
+def tee_to_csv(rows, filepath, fieldnames):
+    """Pass rows through while also writing them to a CSV file"""
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            yield row
+    print(f"  Dumped export to {filepath}")
+
+def verification_tables(exporter):
+    """Tables to verify: (generated file, export file, fields, ORM row stream, key fields)
+
+    Superusers are left out of auth_user, as in its aggregate signature.
+    """
+    return [
+        ('auth_user.csv', 'auth_user_exported.csv', exporter.AUTH_USER_FIELDS,
+         lambda: exporter.iter_auth_user_data(include_superusers=False), ['username', 'email']),
+        ('companies_company.csv', 'companies_company_exported.csv', exporter.COMPANY_FIELDS,
+         exporter.iter_company_data, ['name', 'email']),
+        ('listings_listing.csv', 'listings_listing_exported.csv', exporter.LISTING_FIELDS,
+         exporter.iter_listing_data, ['title']),
+        ('applies_apply.csv', 'applies_apply_exported.csv', exporter.APPLY_FIELDS,
+         exporter.iter_apply_data, ['name', 'email']),
+    ]
+
+def compare_signatures_in_process(exporter):
+    """Compare SQL aggregate signatures with signatures of the generated CSVs
+
+    Returns the names of the tables whose signatures disagree.
+    """
+    from compare_data import SIGNATURE_SPECS, compute_csv_signature, compare_signatures
+
+    print("\nStep 2a: Comparing aggregate signatures...")
+    generated_dir = project_root / 'dummy_data'
+    mismatched_tables = []
+
+    for table, spec in SIGNATURE_SPECS.items():
+        generated_file = generated_dir / f"{table}.csv"
+        if not generated_file.exists():
+            print(f"  ⚠️  {table}: File not found: {generated_file}")
+            mismatched_tables.append(table)
+            continue
+
+        expected = compute_csv_signature(generated_file, spec)
+        actual = exporter.compute_db_signature(table, spec)
+        differences = compare_signatures(expected, actual)
+
+        if differences:
+            print(f"  ⚠️  {table}: {len(differences)} signature differences")
+            for name, expected_value, actual_value in differences[:5]:
+                print(f"    {name}: Generated={expected_value} vs Database={actual_value}")
+            mismatched_tables.append(table)
+        else:
+            print(f"  ✓ {table}: {expected['count']} rows, signature matches")
+
+    return mismatched_tables
+
+def compare_in_process(exporter, dump_exports=False, tables=None):
+    """Step 2: Stream database rows and compare them with the generated CSVs
+
+    tables limits the row-level diff to the given table names.
+    """
+    from compare_data import compare_record_streams
+
+    print("\nStep 2: Comparing database rows with generated data...")
+    generated_dir = project_root / 'dummy_data'
+    exported_dir = project_root / 'exported_data'
+    all_match = True
+
+    for generated_name, exported_name, fieldnames, iter_rows, key_fields in verification_tables(exporter):
+        generated_file = generated_dir / generated_name
+        if tables is not None and generated_file.stem not in tables:
+            continue
+        print(f"\nComparing:\n  Generated: {generated_file}\n  Database:  {generated_file.stem} table")
+        print("-" * 60)
+
+        if not generated_file.exists():
+            print(f"Error: File not found: {generated_file}")
+            all_match = False
+            continue
+
+        exported_rows = iter_rows()
+        if dump_exports:
+            exported_rows = tee_to_csv(exported_rows, str(exported_dir / exported_name), fieldnames)
+
+        stats = compare_record_streams(iter_generated_rows(generated_file), exported_rows, key_fields)
+        if stats['matched'] != stats['generated'] or stats['generated'] != stats['exported']:
+            all_match = False
+
+    return all_match
+
+def check_media(exporter):
+    """Step 3: Check that the logo and CV paths stored in the database exist"""
+    from compare_data import check_file_paths_in_data
+    from media_manifest import verify_manifest, MANIFEST_FILENAME, STATE_FILENAME
+
+    print("\nStep 3: Checking media files...")
+    check_file_paths_in_data(
+        exporter.Company.objects.values('logo').iterator(chunk_size=exporter.ITERATOR_CHUNK_SIZE),
+        "logo", str(project_root)
+    )
+    check_file_paths_in_data(
+        exporter.Apply.objects.values('cv').iterator(chunk_size=exporter.ITERATOR_CHUNK_SIZE),
+        "cv", str(project_root)
+    )
+
+    manifest_file = project_root / 'dummy_data' / MANIFEST_FILENAME
+    if manifest_file.exists():
+        verify_manifest(str(manifest_file), str(project_root), str(project_root / 'dummy_data' / STATE_FILENAME))
+
+def main(dump_exports=False, aggregate=False):
+    print("="*70)
+    print("VERIFYING IMPORTED DATA")
+    print("="*70)
+
+    exporter = check_database()
+    if aggregate:
+        mismatched_tables = compare_signatures_in_process(exporter)
+        if mismatched_tables or dump_exports:
+            # Fall back to a row-level diff only where signatures disagree
+            tables = None if dump_exports else mismatched_tables
+            all_match = compare_in_process(exporter, dump_exports, tables) and not mismatched_tables
+        else:
+            all_match = True
+    else:
+        all_match = compare_in_process(exporter, dump_exports)
+    check_media(exporter)
+
+    print("\n" + "="*70)
+    print("VERIFICATION COMPLETE")
+    print("="*70)
+    if all_match:
+        print("✓ Database rows match the generated data")
+    else:
+        print("⚠️  Differences found between database rows and generated data")
+    print("\nNext steps:")
+    print("1. Review the comparison results above")
+    if dump_exports:
+        print("2. Check the 'exported_data/' directory for exported CSV files")
+    else:
+        print("2. Re-run with --dump-exports to write 'exported_data/' CSV files for debugging")
+    print("3. Compare with 'dummy_data/' directory")
+    print("4. If there are issues, check your import process")
+    print("\nExpected differences:")
+    print("  • Passwords: Hashed in database vs plain text in generated data")
+    print("  • Auto-generated dates: Might differ by seconds")
+    print("  • File paths: Should match exactly")
+    print("="*70)
+
+    return all_match
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Verify imported database data against the generated dummy data')
+    parser.add_argument('--dump-exports', action='store_true',
+                        help="Also write the database rows to 'exported_data/' CSV files for debugging")
+    parser.add_argument('--aggregate', action='store_true',
+                        help='Compare SQL aggregate signatures first and diff rows only for tables that disagree')
+
+    args = parser.parse_args()
+    if not main(dump_exports=args.dump_exports, aggregate=args.aggregate):
         sys.exit(1)
-    
-    print("✓ Comparison completed")
-    
-except Exception as e:
-    print(f"Error comparing data: {e}")
-    sys.exit(1)
-
-print("\n" + "="*70)
-print("VERIFICATION COMPLETE")
-print("="*70)
-print("\nNext steps:")
-print("1. Review the comparison results above")
-print("2. Check the 'exported_data/' directory for exported CSV files")
-print("3. Compare with 'dummy_data/' directory")
-print("4. If there are issues, check your import process")
-print("\nExpected differences:")
-print("  • Passwords: Hashed in database vs plain text in generated data")
-print("  • Auto-generated dates: Might differ by seconds")
-print("  • File paths: Should match exactly")
-print("="*70)
\ No newline at end of file